@@ -301,16 +301,21 @@ async def manual_reinvestment(
         # Create source details
         source_details = request.source_details or {}
 
-        # Apply zone preference multipliers if provided
+        # Apply zone preference multipliers if provided; the section is replaced rather
+        # than mutated so the engine's cached reinvestment config is rebuilt
         if request.zone_preference_multipliers:
             # Set zone preference multipliers in config
-            context.config.reinvestment_engine = context.config.reinvestment_engine or {}
-            context.config.reinvestment_engine["zone_preference_multipliers"] = request.zone_preference_multipliers
+            context.config.reinvestment_engine = {
+                **(context.config.reinvestment_engine or {}),
+                "zone_preference_multipliers": request.zone_preference_multipliers,
+            }
 
         # Apply dynamic allocation if requested
         if request.enable_dynamic_allocation:
-            context.config.reinvestment_engine = context.config.reinvestment_engine or {}
-            context.config.reinvestment_engine["enable_dynamic_allocation"] = True
+            context.config.reinvestment_engine = {
+                **(context.config.reinvestment_engine or {}),
+                "enable_dynamic_allocation": True,
+            }
 
         # Perform reinvestment
         reinvestment_event = await reinvest_amount(
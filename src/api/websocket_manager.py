@@ -6,15 +6,69 @@ This module provides WebSocket functionality for real-time progress updates.
 
 import asyncio
 import json
+import math
 from enum import Enum
 from typing import Dict, Any, Optional, List, Set, Callable, Awaitable
 
+import numpy as np
 import structlog
 from fastapi import WebSocket, WebSocketDisconnect
 
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
 logger = structlog.get_logger(__name__)
 
 
+def _to_json_compatible(value: Any) -> Any:
+    """
+    Convert a value to what orjson would write for it.
+
+    Non-finite floats become None (null) and NumPy scalars and arrays become
+    native Python values, so the standard library fallback emits the same JSON.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        JSON-compatible value
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _to_json_compatible(value.tolist())
+    if isinstance(value, np.generic):
+        return _to_json_compatible(value.item())
+    return value
+
+
+def dumps_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a WebSocket message to JSON text.
+
+    Uses orjson when it is installed (the ``fast-json`` extra), which is
+    considerably faster for large payloads such as guardrail reports, and falls
+    back to the standard library. Both paths write NaN and infinity as null.
+
+    Args:
+        message: Message to serialize
+
+    Returns:
+        JSON text
+    """
+    if USE_ORJSON:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    return json.dumps(_to_json_compatible(message), allow_nan=False, separators=(",", ":"))
+
+
 class MessageType(str, Enum):
     """Message types for WebSocket communication."""
     
@@ -44,6 +98,9 @@ class WebSocketManager:
         
         # Message handlers by message type
         self.message_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+        
+        # Sends scheduled by synchronous callers, referenced until they complete
+        self.background_sends: Set[asyncio.Task] = set()
     
     async def connect(self, websocket: WebSocket, simulation_id: str) -> None:
         """
@@ -124,7 +181,7 @@ class WebSocketManager:
         }
         
         # Convert message to JSON
-        message_json = json.dumps(message)
+        message_json = dumps_message(message)
         
         # Send message to all connected clients
         disconnected_clients = set()
@@ -254,6 +311,35 @@ class WebSocketManager:
             },
         )
     
+    def send_in_background(self, send: Awaitable[None]) -> None:
+        """
+        Schedule a send on the running event loop without awaiting it.
+
+        For synchronous callers that cannot await the send. The manager keeps the
+        task referenced until it completes and logs it if the send fails.
+
+        Args:
+            send: Send coroutine, such as a send_progress call
+        """
+        task = asyncio.get_running_loop().create_task(send)
+        self.background_sends.add(task)
+        task.add_done_callback(self._finish_background_send)
+    
+    def _finish_background_send(self, task: asyncio.Task) -> None:
+        """
+        Release a completed background send and log its failure, if any.
+        
+        Args:
+            task: Completed send task
+        """
+        self.background_sends.discard(task)
+        
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Error sending background WebSocket message",
+                error=str(task.exception()),
+            )
+    
     def is_cancelled(self, simulation_id: str) -> bool:
         """
         Check if a simulation has been cancelled.
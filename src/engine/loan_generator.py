@@ -24,6 +24,10 @@ from src.tls_module import get_tls_manager
 
 logger = structlog.get_logger(__name__)
 
+# Integer codes stored on each loan as "zone_id" so aggregations can index arrays
+# instead of hashing zone names; -1 marks a zone outside this mapping
+ZONE_IDS = {"green": 0, "orange": 1, "red": 2}
+
 
 async def generate_reinvestment_loans(
     context: SimulationContext,
@@ -207,6 +211,7 @@ async def generate_reinvestment_loans(
                 "loan_size": loan_sizes[i],
                 "ltv": ltv_ratios[i],
                 "zone": zone,
+                "zone_id": ZONE_IDS.get(zone, -1),
                 "term": loan_terms[i],
                 "interest_rate": interest_rates[i],
                 "origination_year": int(year),
@@ -535,6 +540,7 @@ async def generate_loans(context: SimulationContext, year: float = 0.0) -> None:
                 "loan_size": loan_sizes[i],
                 "ltv": ltv_ratios[i],
                 "zone": zone,
+                "zone_id": ZONE_IDS.get(zone, -1),
                 "term": loan_terms[i],
                 "interest_rate": interest_rates[i],
                 "origination_year": config.vintage_year,
@@ -6,6 +6,7 @@ including KPI tables, zone allocation reports, cash flow visualizations, risk me
 and export capabilities.
 """
 
+import heapq
 import logging
 import math
 from typing import Dict, Any, List, Optional, Tuple, Union
@@ -15,6 +16,7 @@ import numpy as np
 import pandas as pd
 import structlog
 from collections import defaultdict
+from operator import itemgetter
 import json
 import csv
 import io
@@ -545,24 +547,17 @@ class PerformanceReporter:
 
             suburb_amounts[suburb] += loan_amount
 
-        # Calculate suburb percentages and sort by amount
-        suburb_allocation = {
+        # Select the top 10 suburbs by amount (descending) and calculate their percentages
+        top_suburbs = heapq.nlargest(10, suburb_amounts.items(), key=itemgetter(1))
+
+        zone_allocation["by_suburb"] = {
             suburb: {
                 "amount": amount,
                 "percentage": amount / total_loan_amount,
             }
-            for suburb, amount in suburb_amounts.items()
+            for suburb, amount in top_suburbs
         }
 
-        # Sort suburbs by amount (descending) and take top 10
-        top_suburbs = sorted(
-            suburb_allocation.items(),
-            key=lambda x: x[1]["amount"],
-            reverse=True,
-        )[:10]
-
-        zone_allocation["by_suburb"] = {suburb: data for suburb, data in top_suburbs}
-
         # Calculate allocation by property type
         property_type_amounts = defaultdict(float)
         for loan in loans:
@@ -8,24 +8,48 @@ with the Capital Allocator and Loan Generator to create new loans.
 """
 
 import asyncio
+import itertools
 import time
-import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, List, Optional, Tuple, Union, Set
+from typing import DefaultDict, Dict, Any, Iterator, List, Optional, Tuple, Union, Set
 
 import numpy as np
+import pandas as pd
 import structlog
 
 from src.api.websocket_manager import get_websocket_manager
 from src.engine.simulation_context import SimulationContext
 from src.utils.error_handler import SimulationError, ErrorCode, handle_exception, log_error
 from src.utils.metrics import increment_counter, observe_histogram, set_gauge
-from src.engine.loan_generator import generate_reinvestment_loans
+from src.engine.loan_generator import ZONE_IDS, generate_reinvestment_loans
 
 # Set up logging
 logger = structlog.get_logger(__name__)
 
+# Zones every allocation dictionary is expected to cover, ordered by zone_id
+_ZONES = tuple(ZONE_IDS)
+
+# Maximum number of background progress updates in flight at once
+_MAX_CONCURRENT_PROGRESS_SENDS = 16
+
+# Minimum progress increase (percentage points) between per-group progress updates
+_MIN_PROGRESS_STEP = 1.0
+
+# Keys of the quarterly reinvestment timing buckets, indexed by (month - 1) // 3
+_QUARTER_KEYS = ("q1", "q2", "q3", "q4")
+
+# Concentration risk metrics entering the risk score and diversification impact
+_CONCENTRATION_KEYS = ("hhi_zone", "hhi_suburb", "top_5_concentration", "top_10_concentration")
+
+# Risk score weights for avg_ltv followed by the concentration metrics in _CONCENTRATION_KEYS
+_RISK_WEIGHTS = np.array([0.3, 0.2, 0.2, 0.15, 0.15])
+
+# Diversification impact weights for the concentration metrics in _CONCENTRATION_KEYS
+_DIVERSIFICATION_WEIGHTS = np.array([0.4, 0.4, 0.1, 0.1])
+
 
 class ReinvestmentStrategy(str, Enum):
     """Reinvestment strategy enum."""
@@ -51,6 +75,92 @@ class ReinvestmentFrequency(str, Enum):
     ON_EXIT = "on_exit"
 
 
+@dataclass(frozen=True, slots=True)
+class ReinvestmentConfig:
+    """
+    Resolved reinvestment engine parameters.
+
+    Built once from the ``reinvestment_engine`` section of the simulation config so
+    the hot paths read attributes instead of repeating dictionary lookups, and so
+    the defaults live in one place.
+
+    Attributes:
+        reinvestment_strategy: Strategy for reinvesting capital
+        min_reinvestment_amount: Minimum amount to trigger reinvestment
+        reinvestment_frequency: How often exits are grouped for reinvestment
+        reinvestment_delay: Delay in months between exit and reinvestment
+        enable_cash_reserve: Whether exit proceeds pass through a cash reserve
+        cash_reserve_target: Target cash reserve as a fraction of fund size
+        cash_reserve_min: Minimum cash reserve as a fraction of fund size
+        cash_reserve_max: Maximum cash reserve as a fraction of fund size
+        zone_preference_multipliers: Multipliers applied by the custom strategy
+        opportunistic_threshold: Appreciation threshold for the opportunistic strategy
+        rebalance_threshold: Allocation drift threshold for rebalancing
+        enable_dynamic_allocation: Whether to adjust allocations by recent performance
+        performance_lookback_period: Lookback period in months for dynamic allocation
+        performance_weight: Weight of performance in dynamic allocation (0-1)
+        max_allocation_adjustment: Maximum dynamic allocation adjustment (0-1)
+    """
+
+    reinvestment_strategy: str = ReinvestmentStrategy.REBALANCE
+    min_reinvestment_amount: float = 100000
+    reinvestment_frequency: str = ReinvestmentFrequency.QUARTERLY
+    reinvestment_delay: int = 1
+    enable_cash_reserve: bool = False
+    cash_reserve_target: float = 0.05
+    cash_reserve_min: float = 0.02
+    cash_reserve_max: float = 0.1
+    zone_preference_multipliers: Dict[str, float] = field(
+        default_factory=lambda: {"green": 1.0, "orange": 1.0, "red": 1.0}
+    )
+    opportunistic_threshold: float = 0.05
+    rebalance_threshold: float = 0.05
+    enable_dynamic_allocation: bool = False
+    performance_lookback_period: int = 12
+    performance_weight: float = 0.5
+    max_allocation_adjustment: float = 0.2
+
+    @classmethod
+    def from_dict(cls, reinvestment_config: Dict[str, Any]) -> "ReinvestmentConfig":
+        """
+        Create a reinvestment config from a raw configuration dictionary.
+
+        Unknown keys (e.g. ``reinvestment_batch_size``, used by other modules) are ignored.
+
+        Args:
+            reinvestment_config: The ``reinvestment_engine`` configuration section
+
+        Returns:
+            Resolved reinvestment config
+        """
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in reinvestment_config.items() if key in names})
+
+
+def get_reinvestment_config(context: SimulationContext) -> ReinvestmentConfig:
+    """
+    Get the resolved reinvestment config for a simulation.
+
+    The result is cached on the context and rebuilt only when the
+    ``reinvestment_engine`` section is replaced; callers that change parameters
+    must assign a new dictionary rather than mutating the existing one.
+
+    Args:
+        context: Simulation context
+
+    Returns:
+        Resolved reinvestment config
+    """
+    raw_config = getattr(context.config, "reinvestment_engine", None)
+
+    cached = getattr(context, "_reinvestment_config_cache", None)
+    if cached is None or cached[0] is not raw_config:
+        cached = (raw_config, ReinvestmentConfig.from_dict(raw_config or {}))
+        context._reinvestment_config_cache = cached
+
+    return cached[1]
+
+
 async def reinvest_capital(context: SimulationContext) -> None:
     """
     Reinvest capital during the reinvestment period.
@@ -90,46 +200,33 @@ async def reinvest_capital(context: SimulationContext) -> None:
             )
             return
 
-        # Get configuration
-        config = context.config
-        reinvestment_config = getattr(config, "reinvestment_engine", {})
+        # Initialize reinvestment tracking in context if not already present; the
+        # sentinel makes this a single attribute lookup after the first run
+        if not getattr(context, "_reinvestment_initialized", False):
+            if not hasattr(context, "reinvestment_events"):
+                context.reinvestment_events = []
 
-        # Initialize reinvestment tracking in context if not already present
-        if not hasattr(context, "reinvestment_events"):
-            context.reinvestment_events = []
+            if not hasattr(context, "cash_reserve"):
+                context.cash_reserve = 0.0
 
-        if not hasattr(context, "cash_reserve"):
-            context.cash_reserve = 0.0
+            if not hasattr(context, "cash_reserve_history"):
+                context.cash_reserve_history = []
 
-        if not hasattr(context, "cash_reserve_history"):
-            context.cash_reserve_history = []
+            if not hasattr(context, "reinvestment_risk_metrics"):
+                context.reinvestment_risk_metrics = []
 
-        if not hasattr(context, "reinvestment_risk_metrics"):
-            context.reinvestment_risk_metrics = []
+            context._reinvestment_initialized = True
 
         # Capture portfolio state before reinvestment for risk comparison
-        portfolio_before = {
-            "num_loans": len(getattr(context, "loans", [])),
-            "total_loan_amount": sum(loan.get("loan_size", 0) for loan in getattr(context, "loans", [])),
-            "zone_distribution": calculate_zone_distribution(context),
-            "avg_ltv": calculate_avg_ltv(context),
-            "concentration_risk": calculate_concentration_risk(context),
-        }
+        portfolio_before = build_portfolio_snapshot(get_portfolio_aggregates(context))
 
         # Process exits and reinvest capital
         await process_exits_and_reinvest(context)
 
-        # Capture portfolio state after reinvestment for risk comparison
-        portfolio_after = {
-            "num_loans": len(getattr(context, "loans", [])),
-            "total_loan_amount": sum(loan.get("loan_size", 0) for loan in getattr(context, "loans", [])),
-            "zone_distribution": calculate_zone_distribution(context),
-            "avg_ltv": calculate_avg_ltv(context),
-            "concentration_risk": calculate_concentration_risk(context),
-        }
-
-        # Calculate risk impact of reinvestment
-        risk_impact = calculate_risk_impact(portfolio_before, portfolio_after)
+        # Capture portfolio state after reinvestment and calculate the risk impact. The CPU-bound
+        # post-processing steps run in worker threads so the event loop stays free to deliver
+        # websocket messages while statistics and visualization data are computed
+        portfolio_after, risk_impact = await asyncio.to_thread(_calculate_portfolio_after, context, portfolio_before)
 
         # Store risk impact in context
         context.reinvestment_risk_metrics.append({
@@ -140,11 +237,11 @@ async def reinvest_capital(context: SimulationContext) -> None:
         })
 
         # Calculate reinvestment statistics
-        reinvestment_summary = calculate_reinvestment_statistics(context)
+        reinvestment_summary = await asyncio.to_thread(calculate_reinvestment_statistics, context)
         context.reinvestment_summary = reinvestment_summary
 
         # Generate visualization data
-        visualization = generate_reinvestment_visualization(context)
+        visualization = await asyncio.to_thread(generate_reinvestment_visualization, context)
         context.reinvestment_visualization = visualization
 
         # Report completion
@@ -217,6 +314,28 @@ async def reinvest_capital(context: SimulationContext) -> None:
         raise
 
 
+def _calculate_portfolio_after(
+    context: SimulationContext,
+    portfolio_before: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the post-reinvestment portfolio snapshot and its risk impact.
+
+    Only loans appended to the portfolio while processing exits are aggregated on
+    top of the cached pre-reinvestment aggregates.
+
+    Args:
+        context: Simulation context
+        portfolio_before: Portfolio snapshot before reinvestment
+
+    Returns:
+        Tuple of (portfolio snapshot after reinvestment, risk impact)
+    """
+    portfolio_after = build_portfolio_snapshot(get_portfolio_aggregates(context))
+
+    return portfolio_after, calculate_risk_impact(portfolio_before, portfolio_after)
+
+
 async def process_exits_and_reinvest(context: SimulationContext) -> None:
     """
     Process exits and reinvest capital.
@@ -232,17 +351,17 @@ async def process_exits_and_reinvest(context: SimulationContext) -> None:
 
     # Get configuration
     config = context.config
-    reinvestment_config = getattr(config, "reinvestment_engine", {})
+    reinvestment_config = get_reinvestment_config(context)
 
     # Get reinvestment parameters
-    reinvestment_strategy = reinvestment_config.get("reinvestment_strategy", ReinvestmentStrategy.REBALANCE)
-    min_reinvestment_amount = reinvestment_config.get("min_reinvestment_amount", 100000)
-    reinvestment_frequency = reinvestment_config.get("reinvestment_frequency", ReinvestmentFrequency.QUARTERLY)
-    reinvestment_delay = reinvestment_config.get("reinvestment_delay", 1)  # months
-    enable_cash_reserve = reinvestment_config.get("enable_cash_reserve", False)
-    cash_reserve_target = reinvestment_config.get("cash_reserve_target", 0.05) * config.fund_size
-    cash_reserve_min = reinvestment_config.get("cash_reserve_min", 0.02) * config.fund_size
-    cash_reserve_max = reinvestment_config.get("cash_reserve_max", 0.1) * config.fund_size
+    reinvestment_strategy = reinvestment_config.reinvestment_strategy
+    min_reinvestment_amount = reinvestment_config.min_reinvestment_amount
+    reinvestment_frequency = reinvestment_config.reinvestment_frequency
+    reinvestment_delay = reinvestment_config.reinvestment_delay  # months
+    enable_cash_reserve = reinvestment_config.enable_cash_reserve
+    cash_reserve_target = reinvestment_config.cash_reserve_target * config.fund_size
+    cash_reserve_min = reinvestment_config.cash_reserve_min * config.fund_size
+    cash_reserve_max = reinvestment_config.cash_reserve_max * config.fund_size
 
     # Get exits
     exits = getattr(context, "exits", [])
@@ -251,6 +370,13 @@ async def process_exits_and_reinvest(context: SimulationContext) -> None:
     fund_term = config.fund_term
     reinvestment_period = config.reinvestment_period
 
+    # Bind loop state to locals; the cash reserve is written back to the context
+    # before each reinvest_amount call (which reads it) and when the loop exits
+    fund_size = config.fund_size
+    inv_fund_size = 1.0 / fund_size
+    cash_reserve = context.cash_reserve
+    reserve_history_append = context.cash_reserve_history.append
+
     # Group exits by time period based on reinvestment frequency
     exit_groups = group_exits_by_time_period(exits, reinvestment_frequency)
 
@@ -266,120 +392,139 @@ async def process_exits_and_reinvest(context: SimulationContext) -> None:
         },
     )
 
-    # Process each exit group
-    for i, (time_key, group_exits) in enumerate(exit_groups.items()):
-        # Extract year and month from time key
-        year, month = parse_time_key(time_key)
-
-        # Check if we're within the reinvestment period
-        if year > reinvestment_period:
-            logger.info(
-                "Skipping reinvestment - beyond reinvestment period",
-                year=year,
-                reinvestment_period=reinvestment_period,
-            )
-            continue
-
-        # Calculate total exit value for this group
-        total_exit_value = sum(exit_data.get("exit_value", 0) for exit_data in group_exits)
-
-        # Apply reinvestment delay
-        delayed_month = month + reinvestment_delay
-        delayed_year = year + (delayed_month - 1) // 12
-        delayed_month = ((delayed_month - 1) % 12) + 1
-
-        # Check for cancellation
-        if websocket_manager.is_cancelled(context.run_id):
-            logger.info("Reinvestment processing cancelled", run_id=context.run_id)
-            await websocket_manager.send_info(
-                simulation_id=context.run_id,
-                message="Reinvestment processing cancelled",
-            )
-            return
-
-        # Handle cash reserve if enabled
-        if enable_cash_reserve:
-            # Add exit value to cash reserve
-            context.cash_reserve += total_exit_value
-
-            # Record cash reserve history
-            context.cash_reserve_history.append({
-                "year": year,
-                "month": month,
-                "cash_reserve": context.cash_reserve,
-                "cash_reserve_percentage": context.cash_reserve / config.fund_size,
-                "event": "exit",
-                "amount": total_exit_value,
-            })
-
-            # Determine amount to reinvest from cash reserve
-            reinvestment_amount = 0
-
-            if context.cash_reserve > cash_reserve_target:
-                # Reinvest excess over target
-                reinvestment_amount = context.cash_reserve - cash_reserve_target
+    # Per-group progress updates are sent in the background so they overlap with
+    # processing of the next group; they are drained before this function returns
+    progress_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PROGRESS_SENDS)
+    progress_tasks = []
+    num_exit_groups = len(exit_groups)
+    last_progress = 20.0
 
-                # Ensure we don't go below minimum
-                if context.cash_reserve - reinvestment_amount < cash_reserve_min:
-                    reinvestment_amount = context.cash_reserve - cash_reserve_min
+    # Write back the cash reserve and drain the progress updates however the loop ends,
+    # so a failed reinvestment leaves no pending tasks with unretrieved exceptions
+    try:
+        # Process each exit group
+        for i, (year, month, time_key, group_exits) in enumerate(exit_groups):
+            # Check if we're within the reinvestment period
+            if year > reinvestment_period:
+                logger.info(
+                    "Skipping reinvestment - beyond reinvestment period",
+                    year=year,
+                    reinvestment_period=reinvestment_period,
+                )
+                continue
+
+            # Calculate total exit value for this group
+            total_exit_value = sum(exit_data.get("exit_value", 0) for exit_data in group_exits)
+
+            # Apply reinvestment delay
+            delayed_month = month + reinvestment_delay
+            delayed_year = year + (delayed_month - 1) // 12
+            delayed_month = ((delayed_month - 1) % 12) + 1
+
+            # Check for cancellation
+            if websocket_manager.is_cancelled(context.run_id):
+                logger.info("Reinvestment processing cancelled", run_id=context.run_id)
+                await websocket_manager.send_info(
+                    simulation_id=context.run_id,
+                    message="Reinvestment processing cancelled",
+                )
+                return
 
-            # Only reinvest if amount exceeds minimum
-            if reinvestment_amount >= min_reinvestment_amount:
-                # Update cash reserve
-                context.cash_reserve -= reinvestment_amount
+            # Handle cash reserve if enabled
+            if enable_cash_reserve:
+                # Add exit value to cash reserve
+                cash_reserve += total_exit_value
 
                 # Record cash reserve history
-                context.cash_reserve_history.append({
-                    "year": delayed_year,
-                    "month": delayed_month,
-                    "cash_reserve": context.cash_reserve,
-                    "cash_reserve_percentage": context.cash_reserve / config.fund_size,
-                    "event": "reinvestment",
-                    "amount": -reinvestment_amount,
+                reserve_history_append({
+                    "year": year,
+                    "month": month,
+                    "cash_reserve": cash_reserve,
+                    "cash_reserve_percentage": cash_reserve * inv_fund_size,
+                    "event": "exit",
+                    "amount": total_exit_value,
                 })
 
-                # Reinvest the amount
-                await reinvest_amount(
-                    context=context,
-                    amount=reinvestment_amount,
-                    year=delayed_year,
-                    month=delayed_month,
-                    source=ReinvestmentSource.CASH_RESERVE,
-                    source_details={
-                        "exit_group": time_key,
-                        "num_exits": len(group_exits),
-                    },
-                )
-        else:
-            # Direct reinvestment without cash reserve
-            if total_exit_value >= min_reinvestment_amount:
-                await reinvest_amount(
-                    context=context,
-                    amount=total_exit_value,
-                    year=delayed_year,
-                    month=delayed_month,
-                    source=ReinvestmentSource.EXIT,
-                    source_details={
-                        "exit_group": time_key,
-                        "num_exits": len(group_exits),
-                        "exit_ids": [exit_data.get("loan_id") for exit_data in group_exits],
-                    },
-                )
+                # Determine amount to reinvest from cash reserve
+                reinvestment_amount = 0
+
+                if cash_reserve > cash_reserve_target:
+                    # Reinvest excess over target
+                    reinvestment_amount = cash_reserve - cash_reserve_target
+
+                    # Ensure we don't go below minimum
+                    if cash_reserve - reinvestment_amount < cash_reserve_min:
+                        reinvestment_amount = cash_reserve - cash_reserve_min
+
+                # Only reinvest if amount exceeds minimum
+                if reinvestment_amount >= min_reinvestment_amount:
+                    # Update cash reserve
+                    cash_reserve -= reinvestment_amount
+                    context.cash_reserve = cash_reserve
+
+                    # Record cash reserve history
+                    reserve_history_append({
+                        "year": delayed_year,
+                        "month": delayed_month,
+                        "cash_reserve": cash_reserve,
+                        "cash_reserve_percentage": cash_reserve * inv_fund_size,
+                        "event": "reinvestment",
+                        "amount": -reinvestment_amount,
+                    })
+
+                    # Reinvest the amount
+                    await reinvest_amount(
+                        context=context,
+                        amount=reinvestment_amount,
+                        year=delayed_year,
+                        month=delayed_month,
+                        source=ReinvestmentSource.CASH_RESERVE,
+                        source_details={
+                            "exit_group": time_key,
+                            "num_exits": len(group_exits),
+                        },
+                    )
+            else:
+                # Direct reinvestment without cash reserve
+                if total_exit_value >= min_reinvestment_amount:
+                    await reinvest_amount(
+                        context=context,
+                        amount=total_exit_value,
+                        year=delayed_year,
+                        month=delayed_month,
+                        source=ReinvestmentSource.EXIT,
+                        source_details={
+                            "exit_group": time_key,
+                            "num_exits": len(group_exits),
+                            "exit_ids": [exit_data.get("loan_id") for exit_data in group_exits],
+                        },
+                    )
+
+            # Report progress in steps of at least one percentage point, plus the last group
+            progress = 20.0 + (i + 1) / num_exit_groups * 60.0
+            if progress - last_progress < _MIN_PROGRESS_STEP and i < num_exit_groups - 1:
+                continue
+
+            last_progress = progress
+            progress_tasks.append(asyncio.create_task(_send_progress_bounded(
+                progress_semaphore,
+                websocket_manager,
+                simulation_id=context.run_id,
+                module="reinvest_engine",
+                progress=progress,
+                message=f"Processed exit group {i+1} of {num_exit_groups}",
+                data={
+                    "time_key": time_key,
+                    "year": year,
+                    "month": month,
+                    "total_exit_value": total_exit_value,
+                    "num_exits": len(group_exits),
+                },
+            )))
 
-        # Report progress
-        await websocket_manager.send_progress(
-            simulation_id=context.run_id,
-            module="reinvest_engine",
-            progress=20.0 + (i + 1) / len(exit_groups) * 60.0,
-            message=f"Processed exit group {i+1} of {len(exit_groups)}",
-            data={
-                "time_key": time_key,
-                "year": year,
-                "month": month,
-                "total_exit_value": total_exit_value,
-                "num_exits": len(group_exits),
-            },
-        )
+    finally:
+        context.cash_reserve = cash_reserve
+        await asyncio.gather(*progress_tasks, return_exceptions=True)
 
     # Report completion
     await websocket_manager.send_progress(
@@ -389,11 +534,28 @@ async def process_exits_and_reinvest(context: SimulationContext) -> None:
         message="Completed processing exits and reinvestment",
         data={
             "num_reinvestment_events": len(context.reinvestment_events),
-            "total_reinvested": sum(event.get("amount", 0) for event in context.reinvestment_events),
+            "total_reinvested": getattr(context, "total_reinvested", 0.0),
         },
     )
 
 
+async def _send_progress_bounded(
+    semaphore: asyncio.Semaphore,
+    websocket_manager: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Send a progress update while holding a concurrency slot.
+
+    Args:
+        semaphore: Semaphore bounding concurrent sends
+        websocket_manager: WebSocket manager used to send the update
+        **kwargs: Arguments for WebSocketManager.send_progress
+    """
+    async with semaphore:
+        await websocket_manager.send_progress(**kwargs)
+
+
 async def reinvest_amount(
     context: SimulationContext,
     amount: float,
@@ -423,25 +585,25 @@ async def reinvest_amount(
     websocket_manager = get_websocket_manager()
 
     # Get configuration
-    config = context.config
-    reinvestment_config = getattr(config, "reinvestment_engine", {})
+    reinvestment_config = get_reinvestment_config(context)
 
     # Get reinvestment parameters
-    reinvestment_strategy = reinvestment_config.get("reinvestment_strategy", ReinvestmentStrategy.REBALANCE)
-    zone_preference_multipliers = reinvestment_config.get("zone_preference_multipliers", {
-        "green": 1.0,
-        "orange": 1.0,
-        "red": 1.0,
-    })
-    opportunistic_threshold = reinvestment_config.get("opportunistic_threshold", 0.05)
-    rebalance_threshold = reinvestment_config.get("rebalance_threshold", 0.05)
-    enable_dynamic_allocation = reinvestment_config.get("enable_dynamic_allocation", False)
-    performance_lookback_period = reinvestment_config.get("performance_lookback_period", 12)
-    performance_weight = reinvestment_config.get("performance_weight", 0.5)
-    max_allocation_adjustment = reinvestment_config.get("max_allocation_adjustment", 0.2)
-
-    # Generate a unique ID for this reinvestment event
-    event_id = str(uuid.uuid4())
+    reinvestment_strategy = reinvestment_config.reinvestment_strategy
+    zone_preference_multipliers = reinvestment_config.zone_preference_multipliers
+    opportunistic_threshold = reinvestment_config.opportunistic_threshold
+    rebalance_threshold = reinvestment_config.rebalance_threshold
+    enable_dynamic_allocation = reinvestment_config.enable_dynamic_allocation
+    performance_lookback_period = reinvestment_config.performance_lookback_period
+    performance_weight = reinvestment_config.performance_weight
+    max_allocation_adjustment = reinvestment_config.max_allocation_adjustment
+
+    # Generate a unique ID for this reinvestment event from a per-run sequence
+    event_counter = getattr(context, "_reinvestment_event_counter", None)
+    if event_counter is None:
+        event_counter = itertools.count(1)
+        context._reinvestment_event_counter = event_counter
+
+    event_id = f"{context.run_id}-rinv-{next(event_counter)}"
 
     # Report progress
     await websocket_manager.send_progress(
@@ -496,9 +658,7 @@ async def reinvest_amount(
                 target_allocations[zone] += adjustment
 
         # Normalize allocations to ensure they sum to 1
-        total = sum(target_allocations.values())
-        if total > 0:
-            target_allocations = {zone: alloc / total for zone, alloc in target_allocations.items()}
+        target_allocations = normalize_allocations(target_allocations)
 
     # Report progress
     await websocket_manager.send_progress(
@@ -520,20 +680,20 @@ async def reinvest_amount(
         year=year,
     )
 
-    # Calculate actual allocations achieved
+    # Calculate actual allocations achieved, collecting loan IDs in the same pass
     actual_allocations = {}
-    zone_amounts = {}
+    zone_amounts: DefaultDict[Any, float] = defaultdict(float)
+    loan_ids = []
+    loan_ids_append = loan_ids.append
+    total_amount = 0.0
 
     for loan in reinvestment_loans:
-        zone = loan.get("zone")
         loan_size = loan.get("loan_size", 0)
 
-        if zone not in zone_amounts:
-            zone_amounts[zone] = 0
+        zone_amounts[loan.get("zone")] += loan_size
+        total_amount += loan_size
+        loan_ids_append(loan.get("loan_id"))
 
-        zone_amounts[zone] += loan_size
-
-    total_amount = sum(zone_amounts.values())
     if total_amount > 0:
         actual_allocations = {zone: amount / total_amount for zone, amount in zone_amounts.items()}
 
@@ -550,7 +710,7 @@ async def reinvest_amount(
         "target_allocations": target_allocations,
         "actual_allocations": actual_allocations,
         "num_loans_generated": len(reinvestment_loans),
-        "loan_ids": [loan.get("loan_id") for loan in reinvestment_loans],
+        "loan_ids": loan_ids,
         "performance_adjustments": performance_adjustments if enable_dynamic_allocation else {},
     }
 
@@ -559,8 +719,9 @@ async def reinvest_amount(
         reinvestment_event["cash_reserve_before"] = context.cash_reserve + amount if source == ReinvestmentSource.CASH_RESERVE else context.cash_reserve
         reinvestment_event["cash_reserve_after"] = context.cash_reserve
 
-    # Store reinvestment event in context
+    # Store reinvestment event in context and keep the running total in step
     context.reinvestment_events.append(reinvestment_event)
+    context.total_reinvested = getattr(context, "total_reinvested", 0.0) + amount
 
     # Report progress
     await websocket_manager.send_progress(
@@ -579,77 +740,78 @@ async def reinvest_amount(
     return reinvestment_event
 
 
-def group_exits_by_time_period(exits: List[Dict[str, Any]], frequency: str) -> Dict[str, List[Dict[str, Any]]]:
+def _monthly_group(exit_year: float, exit_month: int, exit_data: Dict[str, Any]) -> Tuple[str, int]:
+    """Get the monthly time key and period start month for an exit."""
+    return f"{exit_year:.1f}-{exit_month:02d}", exit_month
+
+
+def _quarterly_group(exit_year: float, exit_month: int, exit_data: Dict[str, Any]) -> Tuple[str, int]:
+    """Get the quarterly time key and period start month for an exit."""
+    quarter = (exit_month - 1) // 3 + 1
+    return f"{exit_year:.1f}-Q{quarter}", (quarter - 1) * 3 + 1
+
+
+def _semi_annual_group(exit_year: float, exit_month: int, exit_data: Dict[str, Any]) -> Tuple[str, int]:
+    """Get the semi-annual time key and period start month for an exit."""
+    half = (exit_month - 1) // 6 + 1
+    return f"{exit_year:.1f}-H{half}", (half - 1) * 6 + 1
+
+
+def _annual_group(exit_year: float, exit_month: int, exit_data: Dict[str, Any]) -> Tuple[str, int]:
+    """Get the annual time key and period start month for an exit."""
+    return f"{exit_year:.1f}", 1
+
+
+def _on_exit_group(exit_year: float, exit_month: int, exit_data: Dict[str, Any]) -> Tuple[str, int]:
+    """Get a time key that puts the exit in its own group."""
+    return f"{exit_year:.1f}-{exit_month:02d}-{exit_data.get('loan_id', '')}", exit_month
+
+
+# Time key functions by frequency value; anything else (ON_EXIT or unknown) uses _on_exit_group
+_GROUP_KEY_FUNCTIONS = {
+    ReinvestmentFrequency.MONTHLY.value: _monthly_group,
+    ReinvestmentFrequency.QUARTERLY.value: _quarterly_group,
+    ReinvestmentFrequency.SEMI_ANNUALLY.value: _semi_annual_group,
+    ReinvestmentFrequency.ANNUALLY.value: _annual_group,
+}
+
+
+def group_exits_by_time_period(
+    exits: List[Dict[str, Any]],
+    frequency: str,
+) -> List[Tuple[float, int, str, List[Dict[str, Any]]]]:
     """
     Group exits by time period based on frequency.
 
+    The year and month of each group are carried alongside its label so callers
+    never need to parse the label back into numbers. The key function for the
+    frequency is chosen once, outside the per-exit loop.
+
     Args:
         exits: List of exit events
         frequency: Frequency for grouping (monthly, quarterly, etc.)
 
     Returns:
-        Dictionary of exit groups by time key
+        List of (year, month, time_key, exits) tuples in first-seen order, where
+        month is the first month (1-12) of the grouping period
     """
-    exit_groups = {}
+    # Enum members hash by name, so look up by the plain string value
+    group_key = _GROUP_KEY_FUNCTIONS.get(getattr(frequency, "value", frequency), _on_exit_group)
+    exit_groups: DefaultDict[Tuple[float, int, str], List[Dict[str, Any]]] = defaultdict(list)
 
     for exit_data in exits:
         # Get exit year and month
         exit_year = exit_data.get("exit_year", 0)
         exit_month = exit_data.get("exit_month", 0) % 12 + 1  # Convert 0-based to 1-based month
 
-        # Create time key based on frequency
-        if frequency == ReinvestmentFrequency.MONTHLY:
-            time_key = f"{exit_year:.1f}-{exit_month:02d}"
-        elif frequency == ReinvestmentFrequency.QUARTERLY:
-            quarter = (exit_month - 1) // 3 + 1
-            time_key = f"{exit_year:.1f}-Q{quarter}"
-        elif frequency == ReinvestmentFrequency.SEMI_ANNUALLY:
-            half = (exit_month - 1) // 6 + 1
-            time_key = f"{exit_year:.1f}-H{half}"
-        elif frequency == ReinvestmentFrequency.ANNUALLY:
-            time_key = f"{exit_year:.1f}"
-        else:  # ON_EXIT or fallback
-            # Each exit is its own group
-            time_key = f"{exit_year:.1f}-{exit_month:02d}-{exit_data.get('loan_id', '')}"
-
-        # Add exit to group
-        if time_key not in exit_groups:
-            exit_groups[time_key] = []
+        # Create time key and period start month based on frequency
+        time_key, group_month = group_key(exit_year, exit_month, exit_data)
 
-        exit_groups[time_key].append(exit_data)
+        # Add exit to group; the year is rounded the same way as the time key, so the
+        # time key alone still determines the group
+        exit_groups[(round(exit_year, 1), group_month, time_key)].append(exit_data)
 
-    return exit_groups
-
-
-def parse_time_key(time_key: str) -> Tuple[float, int]:
-    """
-    Parse a time key into year and month.
-
-    Args:
-        time_key: Time key string (e.g., "2.0-01", "2.0-Q1", "2.0-H1", "2.0")
-
-    Returns:
-        Tuple of (year, month)
-    """
-    parts = time_key.split("-")
-    year = float(parts[0])
-
-    if len(parts) == 1:
-        # Annual format: "2.0"
-        month = 1
-    elif parts[1].startswith("Q"):
-        # Quarterly format: "2.0-Q1"
-        quarter = int(parts[1][1:])
-        month = (quarter - 1) * 3 + 1
-    elif parts[1].startswith("H"):
-        # Semi-annual format: "2.0-H1"
-        half = int(parts[1][1:])
-        month = (half - 1) * 6 + 1
-    else:
-        # Monthly format: "2.0-01"
-        month = int(parts[1])
-
-    return year, month
+    return [(year, month, time_key, group) for (year, month, time_key), group in exit_groups.items()]
 
 
 def get_current_allocations(context: SimulationContext) -> Dict[str, float]:
@@ -666,28 +828,11 @@ def get_current_allocations(context: SimulationContext) -> Dict[str, float]:
     loans = getattr(context, "loans", [])
 
     # Calculate zone amounts
-    zone_amounts = {}
-
-    for loan in loans:
-        zone = loan.get("zone")
-        loan_size = loan.get("loan_size", 0)
-
-        if zone not in zone_amounts:
-            zone_amounts[zone] = 0
+    zone_amounts = sum_loan_sizes_by_zone(loans)
 
-        zone_amounts[zone] += loan_size
-
-    # Calculate allocations
-    total_amount = sum(zone_amounts.values())
-    allocations = {}
-
-    if total_amount > 0:
-        allocations = {zone: amount / total_amount for zone, amount in zone_amounts.items()}
-
-    # Ensure all zones have an allocation
-    for zone in ["green", "orange", "red"]:
-        if zone not in allocations:
-            allocations[zone] = 0.0
+    # Calculate allocations, starting every zone at zero
+    allocations = dict.fromkeys(_ZONES, 0.0)
+    allocations.update(normalize_allocations(zone_amounts))
 
     return allocations
 
@@ -696,6 +841,10 @@ def get_target_allocations(context: SimulationContext) -> Dict[str, float]:
     """
     Get target zone allocations from config.
 
+    The normalized allocations are computed once per config and cached on the
+    context, since they do not change during a simulation run. A fresh copy is
+    returned on every call so callers may adjust it in place.
+
     Args:
         context: Simulation context
 
@@ -705,6 +854,25 @@ def get_target_allocations(context: SimulationContext) -> Dict[str, float]:
     # Get configuration
     config = context.config
 
+    # Reuse cached allocations if they were computed for this config
+    cached = getattr(context, "_target_allocations_cache", None)
+    if cached is None or cached[0] is not config:
+        cached = (config, _calculate_target_allocations(config))
+        context._target_allocations_cache = cached
+
+    return dict(cached[1])
+
+
+def _calculate_target_allocations(config: Any) -> Dict[str, float]:
+    """
+    Calculate normalized target zone allocations from config.
+
+    Args:
+        config: Simulation configuration
+
+    Returns:
+        Dictionary of target zone allocations (0-1)
+    """
     # Get zone allocations from config
     zone_allocations = getattr(config, "zone_allocations", None)
 
@@ -732,9 +900,7 @@ def get_target_allocations(context: SimulationContext) -> Dict[str, float]:
     }
 
     # Normalize allocations to ensure they sum to 1
-    total = sum(allocations.values())
-    if total > 0:
-        allocations = {zone: alloc / total for zone, alloc in allocations.items()}
+    allocations = normalize_allocations(allocations)
 
     return allocations
 
@@ -757,43 +923,77 @@ def get_opportunistic_allocations(
     price_paths = getattr(context, "price_paths", {})
     zone_price_paths = price_paths.get("zone_price_paths", {})
 
-    # Calculate recent appreciation rates
-    appreciation_rates = {}
-    lookback_steps = 12  # 1 year lookback
+    # Calculate recent appreciation rates; price paths are fixed during a run, so the
+    # rates are cached on the context for as long as the same paths are in place
+    cached = getattr(context, "_zone_appreciation_cache", None)
+    if cached is None or cached[0] is not zone_price_paths:
+        cached = (zone_price_paths, *_calculate_zone_appreciation(zone_price_paths))
+        context._zone_appreciation_cache = cached
 
-    for zone, path in zone_price_paths.items():
-        if len(path) > lookback_steps:
-            # Calculate appreciation over lookback period
-            recent_appreciation = path[-1] / path[-lookback_steps] - 1
-            appreciation_rates[zone] = recent_appreciation
+    _, zones, appreciation_rates = cached
 
     # Identify zones with appreciation above threshold
-    opportunistic_zones = {}
-
-    for zone, rate in appreciation_rates.items():
-        if rate > opportunistic_threshold:
-            opportunistic_zones[zone] = rate
+    above_threshold = appreciation_rates > opportunistic_threshold
 
     # If no zones meet the threshold, fall back to target allocations
-    if not opportunistic_zones:
+    if not above_threshold.any():
         return get_target_allocations(context)
 
     # Allocate based on relative appreciation rates
-    total_appreciation = sum(opportunistic_zones.values())
-    allocations = {}
+    opportunistic_rates = appreciation_rates[above_threshold]
+    total_appreciation = opportunistic_rates.sum()
+    allocations = dict.fromkeys(_ZONES, 0.0)
 
     if total_appreciation > 0:
-        for zone, rate in opportunistic_zones.items():
-            allocations[zone] = rate / total_appreciation
-
-    # Ensure all zones have an allocation
-    for zone in ["green", "orange", "red"]:
-        if zone not in allocations:
-            allocations[zone] = 0.0
+        opportunistic_zones = [zone for zone, above in zip(zones, above_threshold) if above]
+        allocations.update(zip(opportunistic_zones, (opportunistic_rates / total_appreciation).tolist()))
 
     return allocations
 
 
+def _calculate_zone_appreciation(
+    zone_price_paths: Dict[str, Any],
+    lookback_steps: int = 12,
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Calculate recent appreciation for every zone price path long enough to cover the lookback.
+
+    Args:
+        zone_price_paths: Price path by zone
+        lookback_steps: Number of steps to look back (12 = 1 year)
+
+    Returns:
+        Tuple of (zones, appreciation rates aligned with zones)
+    """
+    zones = [zone for zone, path in zone_price_paths.items() if len(path) > lookback_steps]
+    latest = np.fromiter((zone_price_paths[zone][-1] for zone in zones), dtype=np.float64, count=len(zones))
+    reference = np.fromiter(
+        (zone_price_paths[zone][-lookback_steps] for zone in zones), dtype=np.float64, count=len(zones)
+    )
+
+    return zones, latest / reference - 1
+
+
+def normalize_allocations(allocations: Dict[Any, float]) -> Dict[Any, float]:
+    """
+    Scale allocations so they sum to 1.
+
+    Args:
+        allocations: Allocation weights by zone
+
+    Returns:
+        Normalized allocations, or a copy of the input if the weights do not sum to
+        a positive total
+    """
+    weights = np.fromiter(allocations.values(), dtype=np.float64, count=len(allocations))
+    total = weights.sum()
+
+    if total > 0:
+        return dict(zip(allocations, (weights / total).tolist()))
+
+    return dict(allocations)
+
+
 def apply_preference_multipliers(
     allocations: Dict[str, float],
     multipliers: Dict[str, float]
@@ -816,9 +1016,7 @@ def apply_preference_multipliers(
         adjusted_allocations[zone] = allocation * multiplier
 
     # Normalize allocations to ensure they sum to 1
-    total = sum(adjusted_allocations.values())
-    if total > 0:
-        adjusted_allocations = {zone: alloc / total for zone, alloc in adjusted_allocations.items()}
+    adjusted_allocations = normalize_allocations(adjusted_allocations)
 
     return adjusted_allocations
 
@@ -843,48 +1041,36 @@ def calculate_performance_adjustments(
     """
     # Get exits
     exits = getattr(context, "exits", [])
+    num_exits = len(exits)
 
-    # Filter exits within lookback period
-    recent_exits = []
-    current_year = max([exit_data.get("exit_year", 0) for exit_data in exits], default=0)
-
-    for exit_data in exits:
-        exit_year = exit_data.get("exit_year", 0)
-        exit_month = exit_data.get("exit_month", 0)
-
-        # Convert to months since start
-        exit_months = exit_year * 12 + exit_month
-        current_months = current_year * 12
-
-        if current_months - exit_months <= lookback_period:
-            recent_exits.append(exit_data)
-
-    # Calculate ROI by zone
-    zone_roi = {}
-    zone_counts = {}
+    # Calculate average ROI by zone over exits within the lookback period
+    avg_roi = {}
 
-    for exit_data in recent_exits:
-        zone = exit_data.get("zone")
-        roi = exit_data.get("roi", 0)
+    if num_exits > 0:
+        exit_years = np.fromiter((e.get("exit_year", 0) for e in exits), dtype=np.float64, count=num_exits)
+        exit_months = np.fromiter((e.get("exit_month", 0) for e in exits), dtype=np.float64, count=num_exits)
 
-        if zone not in zone_roi:
-            zone_roi[zone] = 0
-            zone_counts[zone] = 0
+        # Months since start, measured against the start of the latest exit year
+        current_months = exit_years.max() * 12
+        recent = np.flatnonzero(current_months - (exit_years * 12 + exit_months) <= lookback_period)
 
-        zone_roi[zone] += roi
-        zone_counts[zone] += 1
+        # Code zones in first-seen order, then sum ROI and counts per zone code
+        zone_codes: Dict[Any, int] = {}
+        codes = np.fromiter(
+            (zone_codes.setdefault(exits[i].get("zone"), len(zone_codes)) for i in recent),
+            dtype=np.intp,
+            count=len(recent),
+        )
+        recent_roi = np.fromiter((exits[i].get("roi", 0) for i in recent), dtype=np.float64, count=len(recent))
 
-    # Calculate average ROI by zone
-    avg_roi = {}
+        zone_roi = np.bincount(codes, weights=recent_roi, minlength=len(zone_codes))
+        zone_counts = np.bincount(codes, minlength=len(zone_codes))
 
-    for zone, total_roi in zone_roi.items():
-        count = zone_counts.get(zone, 0)
-        if count > 0:
-            avg_roi[zone] = total_roi / count
+        avg_roi = {zone: float(zone_roi[code] / zone_counts[code]) for zone, code in zone_codes.items()}
 
     # If no ROI data, return no adjustments
     if not avg_roi:
-        return {zone: 0.0 for zone in ["green", "orange", "red"]}
+        return {zone: 0.0 for zone in _ZONES}
 
     # Calculate relative performance
     total_roi = sum(avg_roi.values())
@@ -915,113 +1101,137 @@ def calculate_performance_adjustments(
     return adjustments
 
 
-def calculate_reinvestment_statistics(context: SimulationContext) -> Dict[str, Any]:
+def index_by_loan_id(records: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
     """
-    Calculate reinvestment statistics.
+    Index loan or exit records by loan ID.
+
+    When several records share a loan ID the first one wins, matching a linear
+    scan for the first match.
 
     Args:
-        context: Simulation context
+        records: List of loan or exit dictionaries
 
     Returns:
-        Dictionary of reinvestment statistics
+        Dictionary of records by loan ID
     """
-    # Get reinvestment events
-    reinvestment_events = getattr(context, "reinvestment_events", [])
+    return {record.get("loan_id"): record for record in reversed(records)}
 
-    # Get loans
-    loans = getattr(context, "loans", [])
 
-    # Get exits
-    exits = getattr(context, "exits", [])
+def _aggregate_reinvestment_events(
+    reinvestment_events: List[Dict[str, Any]],
+) -> Tuple[float, Dict[Any, float], Dict[str, float], Dict[str, float], Dict[str, float], Dict[int, Dict[str, float]]]:
+    """
+    Aggregate reinvestment event amounts in a single pass.
 
-    # Calculate total reinvested
-    total_reinvested = sum(event.get("amount", 0) for event in reinvestment_events)
+    Args:
+        reinvestment_events: List of reinvestment events
 
-    # Calculate average reinvestment amount
-    avg_reinvestment_amount = 0
-    if reinvestment_events:
-        avg_reinvestment_amount = total_reinvested / len(reinvestment_events)
+    Returns:
+        Tuple of (total reinvested, reinvestment by year, by zone, by strategy, by
+        source, and quarterly reinvestment timing by integer year)
+    """
+    total_reinvested = 0
+    reinvestment_by_year: DefaultDict[Any, float] = defaultdict(float)
+    reinvestment_by_zone: DefaultDict[str, float] = defaultdict(float)
+    reinvestment_by_strategy: DefaultDict[str, float] = defaultdict(float)
+    reinvestment_by_source: DefaultDict[str, float] = defaultdict(float)
+    reinvestment_timing: DefaultDict[int, List[float]] = defaultdict(lambda: [0, 0, 0, 0])
 
-    # Calculate reinvestment by year
-    reinvestment_by_year = {}
     for event in reinvestment_events:
         year = event.get("year", 0)
+        month = event.get("month", 0)
         amount = event.get("amount", 0)
+        strategy = event.get("strategy_used", "unknown")
+        source = event.get("source", "unknown")
 
-        if year not in reinvestment_by_year:
-            reinvestment_by_year[year] = 0
-
+        total_reinvested += amount
         reinvestment_by_year[year] += amount
+        reinvestment_by_strategy[strategy] += amount
+        reinvestment_by_source[source] += amount
 
-    # Calculate reinvestment by zone
-    reinvestment_by_zone = {}
-    for event in reinvestment_events:
-        actual_allocations = event.get("actual_allocations", {})
-        amount = event.get("amount", 0)
-
-        for zone, allocation in actual_allocations.items():
-            if zone not in reinvestment_by_zone:
-                reinvestment_by_zone[zone] = 0
-
+        for zone, allocation in event.get("actual_allocations", {}).items():
             reinvestment_by_zone[zone] += amount * allocation
 
-    # Calculate reinvestment by strategy
-    reinvestment_by_strategy = {}
-    for event in reinvestment_events:
-        strategy = event.get("strategy_used", "unknown")
-        amount = event.get("amount", 0)
+        # Bucket the amount into its calendar quarter
+        quarters = reinvestment_timing[int(year)]
+        if 1 <= month <= 12:
+            quarters[int(month - 1) // 3] += amount
+
+    return (
+        total_reinvested,
+        dict(reinvestment_by_year),
+        dict(reinvestment_by_zone),
+        dict(reinvestment_by_strategy),
+        dict(reinvestment_by_source),
+        {year_int: dict(zip(_QUARTER_KEYS, quarters)) for year_int, quarters in reinvestment_timing.items()},
+    )
 
-        if strategy not in reinvestment_by_strategy:
-            reinvestment_by_strategy[strategy] = 0
 
-        reinvestment_by_strategy[strategy] += amount
+def calculate_reinvestment_statistics(context: SimulationContext) -> Dict[str, Any]:
+    """
+    Calculate reinvestment statistics.
 
-    # Calculate reinvestment by source
-    reinvestment_by_source = {}
-    for event in reinvestment_events:
-        source = event.get("source", "unknown")
-        amount = event.get("amount", 0)
+    Args:
+        context: Simulation context
 
-        if source not in reinvestment_by_source:
-            reinvestment_by_source[source] = 0
+    Returns:
+        Dictionary of reinvestment statistics
+    """
+    # Get reinvestment events
+    reinvestment_events = getattr(context, "reinvestment_events", [])
 
-        reinvestment_by_source[source] += amount
+    # Get loans
+    loans = getattr(context, "loans", [])
 
-    # Calculate reinvestment efficiency metrics
-    total_exits_amount = sum(exit_data.get("exit_value", 0) for exit_data in exits)
-    reinvestment_ratio = total_reinvested / total_exits_amount if total_exits_amount > 0 else 0
+    # Get exits
+    exits = getattr(context, "exits", [])
 
-    # Calculate time to reinvest
-    time_to_reinvest = []
-    for event in reinvestment_events:
-        if event.get("source") == ReinvestmentSource.EXIT:
-            source_details = event.get("source_details", {})
-            exit_ids = source_details.get("exit_ids", [])
+    # Index exits by loan ID so lookups don't rescan the exit list
+    exits_by_id = index_by_loan_id(exits)
 
-            for exit_id in exit_ids:
-                # Find the exit
-                exit_data = next((e for e in exits if e.get("loan_id") == exit_id), None)
-                if exit_data:
-                    exit_year = exit_data.get("exit_year", 0)
-                    exit_month = exit_data.get("exit_month", 0)
-                    reinvest_year = event.get("year", 0)
-                    reinvest_month = event.get("month", 0)
+    # Aggregate reinvestment events in a single pass
+    (
+        total_reinvested,
+        reinvestment_by_year,
+        reinvestment_by_zone,
+        reinvestment_by_strategy,
+        reinvestment_by_source,
+        reinvestment_timing,
+    ) = _aggregate_reinvestment_events(reinvestment_events)
 
-                    # Calculate time difference in months
-                    exit_time = exit_year * 12 + exit_month
-                    reinvest_time = reinvest_year * 12 + reinvest_month
-                    time_diff = reinvest_time - exit_time
+    # Calculate average reinvestment amount
+    avg_reinvestment_amount = 0
+    if reinvestment_events:
+        avg_reinvestment_amount = total_reinvested / len(reinvestment_events)
 
-                    if time_diff >= 0:
-                        time_to_reinvest.append(time_diff)
+    # Calculate reinvestment efficiency metrics
+    total_exits_amount = sum(exit_data.get("exit_value", 0) for exit_data in exits)
+    reinvestment_ratio = total_reinvested / total_exits_amount if total_exits_amount > 0 else 0
 
-    avg_time_to_reinvest = sum(time_to_reinvest) / len(time_to_reinvest) if time_to_reinvest else 0
+    # Calculate time to reinvest from (exit time, reinvestment time) pairs in months
+    times = np.array(
+        [
+            (
+                exit_data.get("exit_year", 0) * 12 + exit_data.get("exit_month", 0),
+                event.get("year", 0) * 12 + event.get("month", 0),
+            )
+            for event in reinvestment_events
+            if event.get("source") == ReinvestmentSource.EXIT
+            for exit_id in event.get("source_details", {}).get("exit_ids", [])
+            if (exit_data := exits_by_id.get(exit_id))
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    time_to_reinvest = times[:, 1] - times[:, 0]
+    time_to_reinvest = time_to_reinvest[time_to_reinvest >= 0]
+
+    avg_time_to_reinvest = float(time_to_reinvest.mean()) if time_to_reinvest.size else 0
 
     # Calculate reinvestment loan performance
     reinvestment_loans = [loan for loan in loans if loan.get("is_reinvestment", False)]
+    reinvestment_loans_by_id = index_by_loan_id(reinvestment_loans)
     reinvestment_loan_exits = [
-        exit_data for exit_data in exits
-        if exit_data.get("loan_id") in [loan.get("loan_id") for loan in reinvestment_loans]
+        exit_data for exit_data in exits if exit_data.get("loan_id") in reinvestment_loans_by_id
     ]
 
     # Calculate ROI for reinvestment loans
@@ -1035,7 +1245,7 @@ def calculate_reinvestment_statistics(context: SimulationContext) -> Dict[str, A
     hold_periods = []
     for exit_data in reinvestment_loan_exits:
         loan_id = exit_data.get("loan_id")
-        loan = next((l for l in reinvestment_loans if l.get("loan_id") == loan_id), None)
+        loan = reinvestment_loans_by_id.get(loan_id)
 
         if loan:
             origination_year = loan.get("reinvestment_year", 0)
@@ -1046,63 +1256,31 @@ def calculate_reinvestment_statistics(context: SimulationContext) -> Dict[str, A
     avg_hold_period = sum(hold_periods) / len(hold_periods) if hold_periods else 0
 
     # Calculate exit type distribution for reinvestment loans
-    exit_types = {}
-    for exit_data in reinvestment_loan_exits:
-        exit_type = exit_data.get("exit_type", "unknown")
-
-        if exit_type not in exit_types:
-            exit_types[exit_type] = 0
-
-        exit_types[exit_type] += 1
-
-    # Calculate exit type percentages
-    exit_type_distribution = {}
-    if reinvestment_loan_exits:
-        for exit_type, count in exit_types.items():
-            exit_type_distribution[exit_type] = count / len(reinvestment_loan_exits)
+    exit_types = Counter(exit_data.get("exit_type", "unknown") for exit_data in reinvestment_loan_exits)
+    num_reinvestment_loan_exits = len(reinvestment_loan_exits)
+    exit_type_distribution = {
+        exit_type: count / num_reinvestment_loan_exits for exit_type, count in exit_types.items()
+    }
 
     # Calculate reinvestment impact on portfolio
     portfolio_with_reinvestment = len(loans)
     portfolio_without_reinvestment = portfolio_with_reinvestment - len(reinvestment_loans)
     reinvestment_portfolio_impact = len(reinvestment_loans) / portfolio_without_reinvestment if portfolio_without_reinvestment > 0 else 0
 
-    # Calculate reinvestment timing metrics
-    reinvestment_timing = {}
-    for event in reinvestment_events:
-        year = event.get("year", 0)
-        year_int = int(year)
-
-        if year_int not in reinvestment_timing:
-            reinvestment_timing[year_int] = {
-                "q1": 0,
-                "q2": 0,
-                "q3": 0,
-                "q4": 0,
-            }
-
-        month = event.get("month", 0)
-        amount = event.get("amount", 0)
-
-        if 1 <= month <= 3:
-            reinvestment_timing[year_int]["q1"] += amount
-        elif 4 <= month <= 6:
-            reinvestment_timing[year_int]["q2"] += amount
-        elif 7 <= month <= 9:
-            reinvestment_timing[year_int]["q3"] += amount
-        elif 10 <= month <= 12:
-            reinvestment_timing[year_int]["q4"] += amount
-
     # Calculate cash reserve metrics
     cash_reserve_metrics = {}
     if hasattr(context, "cash_reserve_history") and context.cash_reserve_history:
         cash_reserve_history = context.cash_reserve_history
 
-        # Calculate average cash reserve
-        avg_cash_reserve = sum(entry.get("cash_reserve", 0) for entry in cash_reserve_history) / len(cash_reserve_history)
-
-        # Calculate min and max cash reserve
-        min_cash_reserve = min(entry.get("cash_reserve", 0) for entry in cash_reserve_history)
-        max_cash_reserve = max(entry.get("cash_reserve", 0) for entry in cash_reserve_history)
+        # Calculate average, min and max cash reserve from one read of the history
+        cash_reserves = np.fromiter(
+            (entry.get("cash_reserve", 0) for entry in cash_reserve_history),
+            dtype=np.float64,
+            count=len(cash_reserve_history),
+        )
+        avg_cash_reserve = float(cash_reserves.mean())
+        min_cash_reserve = float(cash_reserves.min())
+        max_cash_reserve = float(cash_reserves.max())
 
         # Calculate cash reserve as percentage of fund size
         fund_size = context.config.fund_size
@@ -1149,12 +1327,113 @@ def calculate_reinvestment_statistics(context: SimulationContext) -> Dict[str, A
     return statistics
 
 
-def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str, Any]:
+def _event_time(event: Dict[str, Any]) -> Tuple[float, int]:
+    """Get the (year, month) sort key of a reinvestment event."""
+    return event.get("year", 0), event.get("month", 0)
+
+
+def get_sorted_reinvestment_events(context: SimulationContext) -> List[Dict[str, Any]]:
+    """
+    Get reinvestment events sorted by year and month.
+
+    The sorted list is cached on the context against the event list and its
+    length, so repeated visualization passes over the same events sort once.
+
+    Args:
+        context: Simulation context
+
+    Returns:
+        Reinvestment events in chronological order (must not be modified)
+    """
+    reinvestment_events = getattr(context, "reinvestment_events", [])
+    num_events = len(reinvestment_events)
+
+    cached = getattr(context, "_sorted_reinvestment_events_cache", None)
+    if cached is None or cached[0] is not reinvestment_events or cached[1] != num_events:
+        cached = (reinvestment_events, num_events, sorted(reinvestment_events, key=_event_time))
+        context._sorted_reinvestment_events_cache = cached
+
+    return cached[2]
+
+
+def _iter_reinvestment_events_table(sorted_events: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Generate rows of the reinvestment events table.
+
+    Args:
+        sorted_events: Reinvestment events in chronological order
+
+    Yields:
+        Events table rows
+    """
+    for event in sorted_events:
+        yield {
+            "event_id": event.get("event_id", ""),
+            "year": event.get("year", 0),
+            "month": event.get("month", 0),
+            "amount": event.get("amount", 0),
+            "strategy": event.get("strategy_used", ""),
+            "num_loans": event.get("num_loans_generated", 0),
+            "source": event.get("source", ""),
+            "target_zones": ", ".join([f"{zone}: {alloc:.1%}" for zone, alloc in event.get("target_allocations", {}).items()]),
+            "actual_zones": ", ".join([f"{zone}: {alloc:.1%}" for zone, alloc in event.get("actual_allocations", {}).items()]),
+        }
+
+
+def _iter_reinvestment_loans_table(
+    reinvestment_loans: List[Dict[str, Any]],
+    exits: List[Dict[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Generate rows of the reinvestment loans table.
+
+    Args:
+        reinvestment_loans: Loans originated by reinvestment
+        exits: List of exit events
+
+    Yields:
+        Loans table rows, with exit details for loans that have exited
+    """
+    if not reinvestment_loans:
+        return
+
+    # Index exits by loan ID so lookups don't rescan the exit list
+    exits_by_id = index_by_loan_id(exits)
+
+    for loan in reinvestment_loans:
+        # Find the corresponding exit if any
+        exit_data = exits_by_id.get(loan.get("loan_id"))
+
+        loan_data = {
+            "loan_id": loan.get("loan_id", ""),
+            "loan_size": loan.get("loan_size", 0),
+            "ltv": loan.get("ltv", 0),
+            "zone": loan.get("zone", ""),
+            "reinvestment_year": loan.get("reinvestment_year", 0),
+            "property_value": loan.get("property_value", 0),
+            "suburb_name": loan.get("suburb_name", ""),
+        }
+
+        if exit_data:
+            loan_data.update({
+                "exit_year": exit_data.get("exit_year", 0),
+                "exit_value": exit_data.get("exit_value", 0),
+                "exit_type": exit_data.get("exit_type", ""),
+                "roi": exit_data.get("roi", 0),
+                "hold_period": exit_data.get("exit_year", 0) - loan.get("reinvestment_year", 0),
+            })
+
+        yield loan_data
+
+
+def generate_reinvestment_visualization(context: SimulationContext, streaming: bool = False) -> Dict[str, Any]:
     """
     Generate visualization data for reinvestment activity.
 
     Args:
         context: Simulation context
+        streaming: Return the events and loans tables as one-shot generators
+            instead of lists, for callers that serialize them once
 
     Returns:
         Dictionary of visualization data
@@ -1171,31 +1450,21 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
 
     # Identify reinvestment loans
     reinvestment_loans = [loan for loan in loans if loan.get("is_reinvestment", False)]
-    reinvestment_loan_exits = [
-        exit_data for exit_data in exits
-        if exit_data.get("loan_id") in [loan.get("loan_id") for loan in reinvestment_loans]
-    ]
 
     # Generate reinvestment timeline
     reinvestment_timeline = []
     cumulative_amount = 0
 
-    # Sort events by year and month
-    sorted_events = sorted(
-        reinvestment_events,
-        key=lambda e: (e.get("year", 0), e.get("month", 0))
-    )
+    # Get events sorted by year and month
+    sorted_events = get_sorted_reinvestment_events(context) if reinvestment_events else []
 
     for event in sorted_events:
-        year = event.get("year", 0)
-        month = event.get("month", 0)
         amount = event.get("amount", 0)
-
         cumulative_amount += amount
 
         reinvestment_timeline.append({
-            "year": year,
-            "month": month,
+            "year": event.get("year", 0),
+            "month": event.get("month", 0),
             "amount": amount,
             "cumulative_amount": cumulative_amount,
             "strategy": event.get("strategy_used", ""),
@@ -1223,21 +1492,19 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
     reinvestment_by_year = reinvestment_summary.get("reinvestment_by_year", {})
     reinvestment_by_year_chart = []
 
-    # Count events by year
-    events_by_year = {}
-    for event in reinvestment_events:
-        year = event.get("year", 0)
-
-        if year not in events_by_year:
-            events_by_year[year] = 0
+    # Sort the yearly totals once for the chart and the summary table
+    sorted_reinvestment_by_year = sorted(reinvestment_by_year.items())
 
-        events_by_year[year] += 1
+    # Group events by year once for the chart and the summary table
+    events_by_year: DefaultDict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for event in reinvestment_events:
+        events_by_year[event.get("year", 0)].append(event)
 
-    for year, amount in sorted(reinvestment_by_year.items()):
+    for year, amount in sorted_reinvestment_by_year:
         reinvestment_by_year_chart.append({
             "year": year,
             "amount": amount,
-            "num_events": events_by_year.get(year, 0),
+            "num_events": len(events_by_year.get(year, ())),
         })
 
     # Generate reinvestment by strategy chart
@@ -1273,18 +1540,18 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
     # Generate cash reserve chart
     cash_reserve_chart = []
 
-    if hasattr(context, "cash_reserve_history"):
+    if getattr(context, "cash_reserve_history", None):
         # Get configuration
         config = context.config
-        reinvestment_config = getattr(config, "reinvestment_engine", {})
+        reinvestment_config = get_reinvestment_config(context)
 
         # Get cash reserve parameters
-        cash_reserve_target = reinvestment_config.get("cash_reserve_target", 0.05) * config.fund_size
-        cash_reserve_min = reinvestment_config.get("cash_reserve_min", 0.02) * config.fund_size
-        cash_reserve_max = reinvestment_config.get("cash_reserve_max", 0.1) * config.fund_size
+        cash_reserve_target = reinvestment_config.cash_reserve_target * config.fund_size
+        cash_reserve_min = reinvestment_config.cash_reserve_min * config.fund_size
+        cash_reserve_max = reinvestment_config.cash_reserve_max * config.fund_size
 
-        for entry in context.cash_reserve_history:
-            cash_reserve_chart.append({
+        cash_reserve_chart = [
+            {
                 "year": entry.get("year", 0),
                 "month": entry.get("month", 0),
                 "cash_reserve": entry.get("cash_reserve", 0),
@@ -1293,7 +1560,9 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
                 "max": cash_reserve_max,
                 "event": entry.get("event", ""),
                 "amount": entry.get("amount", 0),
-            })
+            }
+            for entry in context.cash_reserve_history
+        ]
 
     # Generate allocation comparison chart
     allocation_comparison_chart = []
@@ -1303,10 +1572,13 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
         year = event.get("year", 0)
         target_allocations = event.get("target_allocations", {})
         actual_allocations = event.get("actual_allocations", {})
+        get_target = target_allocations.get
+        get_actual = actual_allocations.get
 
-        for zone in set(target_allocations.keys()) | set(actual_allocations.keys()):
-            target = target_allocations.get(zone, 0)
-            actual = actual_allocations.get(zone, 0)
+        # Merging the dicts gives the union of zones in a stable, first-seen order
+        for zone in {**target_allocations, **actual_allocations}:
+            target = get_target(zone, 0)
+            actual = get_actual(zone, 0)
             gap = actual - target
 
             allocation_comparison_chart.append({
@@ -1380,18 +1652,12 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
     reinvestment_vs_exits_chart = []
 
     # Group exits by year
-    exits_by_year = {}
+    exits_by_year: DefaultDict[Any, float] = defaultdict(float)
     for exit_data in exits:
-        year = exit_data.get("exit_year", 0)
-        exit_value = exit_data.get("exit_value", 0)
-
-        if year not in exits_by_year:
-            exits_by_year[year] = 0
-
-        exits_by_year[year] += exit_value
+        exits_by_year[exit_data.get("exit_year", 0)] += exit_data.get("exit_value", 0)
 
     # Compare exits and reinvestments by year
-    all_years = sorted(set(list(reinvestment_by_year.keys()) + list(exits_by_year.keys())))
+    all_years = sorted({*reinvestment_by_year, *exits_by_year})
     for year in all_years:
         reinvestment_vs_exits_chart.append({
             "year": year,
@@ -1401,84 +1667,53 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
         })
 
     # Generate reinvestment loan size distribution
-    loan_sizes = [loan.get("loan_size", 0) for loan in reinvestment_loans]
+    loan_size_distribution_chart = []
 
-    if loan_sizes:
-        min_size = min(loan_sizes)
-        max_size = max(loan_sizes)
+    if reinvestment_loans:
+        loan_sizes = np.fromiter(
+            (loan.get("loan_size", 0) for loan in reinvestment_loans),
+            dtype=np.float64,
+            count=len(reinvestment_loans),
+        )
+        min_size = loan_sizes.min()
 
-        # Create bins
+        # Use ten equal-width bins, or unit-width bins from the single size if all loans are the same size
         num_bins = 10
-        bin_width = (max_size - min_size) / num_bins if max_size > min_size else 1
-
-        # Initialize bins
-        size_bins = {}
-        for i in range(num_bins):
-            bin_min = min_size + i * bin_width
-            bin_max = min_size + (i + 1) * bin_width
-            bin_label = f"{bin_min:.0f}-{bin_max:.0f}"
-            size_bins[bin_label] = 0
-
-        # Count loans in each bin
-        for size in loan_sizes:
-            bin_index = min(num_bins - 1, int((size - min_size) / bin_width))
-            bin_min = min_size + bin_index * bin_width
-            bin_max = min_size + (bin_index + 1) * bin_width
-            bin_label = f"{bin_min:.0f}-{bin_max:.0f}"
-            size_bins[bin_label] += 1
-
-        # Convert to chart data
+        bins = num_bins if loan_sizes.max() > min_size else min_size + np.arange(num_bins + 1)
+        counts, edges = np.histogram(loan_sizes, bins=bins)
+
         loan_size_distribution_chart = [
-            {"bin": bin_label, "count": count}
-            for bin_label, count in size_bins.items()
+            {"bin": f"{bin_min:.0f}-{bin_max:.0f}", "count": count}
+            for bin_min, bin_max, count in zip(edges[:-1].tolist(), edges[1:].tolist(), counts.tolist())
         ]
-    else:
-        loan_size_distribution_chart = []
 
     # Generate reinvestment summary table
     reinvestment_summary_table = []
 
-    for year, amount in sorted(reinvestment_by_year.items()):
-        year_events = [e for e in reinvestment_events if e.get("year", 0) == year]
+    for year, amount in sorted_reinvestment_by_year:
+        year_events = events_by_year.get(year, ())
         num_events = len(year_events)
 
-        # Count loans
-        num_loans = sum(e.get("num_loans_generated", 0) for e in year_events)
+        # Count loans and calculate zone and strategy distributions in one pass
+        num_loans = 0
+        zone_distribution = defaultdict(float)
+        strategy_distribution = defaultdict(float)
+        for event in year_events:
+            event_amount = event.get("amount", 0)
+            num_loans += event.get("num_loans_generated", 0)
+            strategy_distribution[event.get("strategy_used", "unknown")] += event_amount
+
+            for zone, allocation in event.get("actual_allocations", {}).items():
+                zone_distribution[zone] += event_amount * allocation
 
         # Calculate average loan size
         avg_loan_size = 0
         if num_loans > 0:
             avg_loan_size = amount / num_loans
 
-        # Calculate zone distribution
-        zone_distribution = {}
-        for event in year_events:
-            actual_allocations = event.get("actual_allocations", {})
-            event_amount = event.get("amount", 0)
-
-            for zone, allocation in actual_allocations.items():
-                if zone not in zone_distribution:
-                    zone_distribution[zone] = 0
-
-                zone_distribution[zone] += event_amount * allocation
-
         # Convert to percentages
         if amount > 0:
             zone_distribution = {zone: amt / amount for zone, amt in zone_distribution.items()}
-
-        # Calculate strategy distribution
-        strategy_distribution = {}
-        for event in year_events:
-            strategy = event.get("strategy_used", "unknown")
-            event_amount = event.get("amount", 0)
-
-            if strategy not in strategy_distribution:
-                strategy_distribution[strategy] = 0
-
-            strategy_distribution[strategy] += event_amount
-
-        # Convert to percentages
-        if amount > 0:
             strategy_distribution = {strategy: amt / amount for strategy, amt in strategy_distribution.items()}
 
         reinvestment_summary_table.append({
@@ -1487,53 +1722,17 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
             "num_events": num_events,
             "num_loans": num_loans,
             "avg_loan_size": avg_loan_size,
-            "zone_distribution": zone_distribution,
-            "strategy_distribution": strategy_distribution,
+            "zone_distribution": dict(zone_distribution),
+            "strategy_distribution": dict(strategy_distribution),
         })
 
-    # Generate reinvestment events table
-    reinvestment_events_table = []
-
-    for event in sorted_events:
-        reinvestment_events_table.append({
-            "event_id": event.get("event_id", ""),
-            "year": event.get("year", 0),
-            "month": event.get("month", 0),
-            "amount": event.get("amount", 0),
-            "strategy": event.get("strategy_used", ""),
-            "num_loans": event.get("num_loans_generated", 0),
-            "source": event.get("source", ""),
-            "target_zones": ", ".join([f"{zone}: {alloc:.1%}" for zone, alloc in event.get("target_allocations", {}).items()]),
-            "actual_zones": ", ".join([f"{zone}: {alloc:.1%}" for zone, alloc in event.get("actual_allocations", {}).items()]),
-        })
-
-    # Generate reinvestment loans table
-    reinvestment_loans_table = []
-
-    for loan in reinvestment_loans:
-        # Find the corresponding exit if any
-        exit_data = next((e for e in exits if e.get("loan_id") == loan.get("loan_id")), None)
-
-        loan_data = {
-            "loan_id": loan.get("loan_id", ""),
-            "loan_size": loan.get("loan_size", 0),
-            "ltv": loan.get("ltv", 0),
-            "zone": loan.get("zone", ""),
-            "reinvestment_year": loan.get("reinvestment_year", 0),
-            "property_value": loan.get("property_value", 0),
-            "suburb_name": loan.get("suburb_name", ""),
-        }
-
-        if exit_data:
-            loan_data.update({
-                "exit_year": exit_data.get("exit_year", 0),
-                "exit_value": exit_data.get("exit_value", 0),
-                "exit_type": exit_data.get("exit_type", ""),
-                "roi": exit_data.get("roi", 0),
-                "hold_period": exit_data.get("exit_year", 0) - loan.get("reinvestment_year", 0),
-            })
+    # Generate reinvestment events and loans tables, lazily when streaming
+    reinvestment_events_table = _iter_reinvestment_events_table(sorted_events)
+    reinvestment_loans_table = _iter_reinvestment_loans_table(reinvestment_loans, exits)
 
-        reinvestment_loans_table.append(loan_data)
+    if not streaming:
+        reinvestment_events_table = list(reinvestment_events_table)
+        reinvestment_loans_table = list(reinvestment_loans_table)
 
     # Generate cash reserve metrics table
     cash_reserve_metrics = reinvestment_summary.get("cash_reserve_metrics", {})
@@ -1596,42 +1795,64 @@ def generate_reinvestment_visualization(context: SimulationContext) -> Dict[str,
     return visualization
 
 
-def calculate_zone_distribution(context: SimulationContext) -> Dict[str, float]:
+def sum_loan_sizes_by_zone(loans: List[Dict[str, Any]], sizes: Optional[np.ndarray] = None) -> Dict[Any, float]:
     """
-    Calculate the distribution of loans by zone.
+    Sum loan sizes by zone.
+
+    Loans are bucketed by their integer ``zone_id`` with a single np.bincount.
+    Loans without a ``zone_id`` (e.g. added through the API) are coded from their
+    zone name, and zones outside ZONE_IDS are summed in a dictionary.
 
     Args:
-        context: Simulation context
+        loans: List of loans
+        sizes: Loan sizes already extracted from ``loans``, if available
 
     Returns:
-        Dictionary of zone distributions (0-1)
+        Dictionary of total loan size by zone, for zones that have loans
     """
-    # Get loans
-    loans = getattr(context, "loans", [])
+    num_loans = len(loans)
+    if sizes is None:
+        sizes = np.fromiter((loan.get("loan_size", 0) for loan in loans), dtype=np.float64, count=num_loans)
+    zone_ids = np.fromiter(
+        (loan["zone_id"] if "zone_id" in loan else ZONE_IDS.get(loan.get("zone"), -1) for loan in loans),
+        dtype=np.intp,
+        count=num_loans,
+    )
 
-    # Calculate zone amounts
-    zone_amounts = {}
+    known = zone_ids >= 0
+    known_ids = zone_ids[known]
+    totals = np.bincount(known_ids, weights=sizes[known], minlength=len(_ZONES))
+    counts = np.bincount(known_ids, minlength=len(_ZONES))
 
-    for loan in loans:
-        zone = loan.get("zone")
-        loan_size = loan.get("loan_size", 0)
+    zone_amounts = {zone: float(totals[zone_id]) for zone_id, zone in enumerate(_ZONES) if counts[zone_id]}
+
+    for i in np.flatnonzero(~known):
+        zone = loans[i].get("zone")
+        zone_amounts[zone] = zone_amounts.get(zone, 0.0) + float(sizes[i])
+
+    return zone_amounts
+
+
+def calculate_zone_distribution(context: SimulationContext) -> Dict[str, float]:
+    """
+    Calculate the distribution of loans by zone.
 
-        if zone not in zone_amounts:
-            zone_amounts[zone] = 0
+    Args:
+        context: Simulation context
 
-        zone_amounts[zone] += loan_size
+    Returns:
+        Dictionary of zone distributions (0-1)
+    """
+    # Get zone amounts from the shared portfolio aggregates
+    zone_amounts = get_portfolio_aggregates(context)["zone_amounts"]
 
-    # Calculate allocations
+    # Calculate allocations, starting every zone at zero
     total_amount = sum(zone_amounts.values())
-    zone_distribution = {}
+    zone_distribution = dict.fromkeys(_ZONES, 0.0)
 
     if total_amount > 0:
-        zone_distribution = {zone: amount / total_amount for zone, amount in zone_amounts.items()}
-
-    # Ensure all zones have a value
-    for zone in ["green", "orange", "red"]:
-        if zone not in zone_distribution:
-            zone_distribution[zone] = 0.0
+        for zone, amount in zone_amounts.items():
+            zone_distribution[zone] = amount / total_amount
 
     return zone_distribution
 
@@ -1646,58 +1867,53 @@ def calculate_avg_ltv(context: SimulationContext) -> float:
     Returns:
         Average LTV (0-1)
     """
-    # Get loans
-    loans = getattr(context, "loans", [])
-
-    if not loans:
-        return 0.0
+    aggregates = get_portfolio_aggregates(context)
 
     # Calculate weighted average LTV
-    total_loan_size = sum(loan.get("loan_size", 0) for loan in loans)
+    total_loan_size = aggregates["total_loan_amount"]
 
-    if total_loan_size == 0:
+    if aggregates["num_loans"] == 0 or total_loan_size == 0:
         return 0.0
 
-    weighted_ltv_sum = sum(loan.get("loan_size", 0) * loan.get("ltv", 0) for loan in loans)
-
-    return weighted_ltv_sum / total_loan_size
+    return aggregates["weighted_ltv_sum"] / total_loan_size
 
 
 def calculate_concentration_risk(context: SimulationContext) -> Dict[str, float]:
     """
     Calculate concentration risk metrics for the portfolio.
 
+    The metrics are cached on the context against the portfolio aggregates they
+    were computed from, so they are only recomputed after the loans change.
+
     Args:
         context: Simulation context
 
     Returns:
         Dictionary of concentration risk metrics
     """
-    # Get loans
-    loans = getattr(context, "loans", [])
+    aggregates = get_portfolio_aggregates(context)
 
-    if not loans:
-        return {
-            "hhi_zone": 0.0,
-            "hhi_suburb": 0.0,
-            "top_5_concentration": 0.0,
-            "top_10_concentration": 0.0,
-        }
+    cached = getattr(context, "_concentration_risk_cache", None)
+    if cached is None or cached[0] is not aggregates:
+        cached = (aggregates, concentration_risk_from_aggregates(aggregates))
+        context._concentration_risk_cache = cached
 
-    # Calculate Herfindahl-Hirschman Index (HHI) for zone concentration
-    zone_amounts = {}
-    for loan in loans:
-        zone = loan.get("zone")
-        loan_size = loan.get("loan_size", 0)
+    return dict(cached[1])
 
-        if zone not in zone_amounts:
-            zone_amounts[zone] = 0
 
-        zone_amounts[zone] += loan_size
+def concentration_risk_from_aggregates(aggregates: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Calculate concentration risk metrics from portfolio aggregates.
 
-    total_amount = sum(zone_amounts.values())
+    Args:
+        aggregates: Portfolio aggregates from aggregate_portfolio
+
+    Returns:
+        Dictionary of concentration risk metrics
+    """
+    total_amount = aggregates["total_loan_amount"]
 
-    if total_amount == 0:
+    if aggregates["num_loans"] == 0 or total_amount == 0:
         return {
             "hhi_zone": 0.0,
             "hhi_suburb": 0.0,
@@ -1705,40 +1921,208 @@ def calculate_concentration_risk(context: SimulationContext) -> Dict[str, float]
             "top_10_concentration": 0.0,
         }
 
-    zone_shares = {zone: amount / total_amount for zone, amount in zone_amounts.items()}
-    hhi_zone = sum(share ** 2 for share in zone_shares.values())
+    # Calculate Herfindahl-Hirschman Index (HHI) for zone and suburb concentration,
+    # sum((amount / total) ** 2) == sum(amount ** 2) / total ** 2
+    total_sq = total_amount * total_amount
+    hhi_zone = aggregates["zone_sum_sq"] / total_sq
+    hhi_suburb = aggregates["suburb_sum_sq"] / total_sq
 
-    # Calculate HHI for suburb concentration
-    suburb_amounts = {}
-    for loan in loans:
-        suburb = loan.get("suburb_name", "unknown")
-        loan_size = loan.get("loan_size", 0)
+    # Calculate top 5 and top 10 concentration from the largest suburb shares
+    suburb_amounts = aggregates["suburb_amounts"]
+    suburb_shares = np.fromiter(suburb_amounts.values(), dtype=np.float64, count=len(suburb_amounts)) / total_amount
+    top_5_concentration, top_10_concentration = _top_share_sums(suburb_shares)
+
+    return {
+        "hhi_zone": float(hhi_zone),
+        "hhi_suburb": float(hhi_suburb),
+        "top_5_concentration": top_5_concentration,
+        "top_10_concentration": top_10_concentration,
+    }
+
+
+def _top_share_sums(shares: np.ndarray) -> Tuple[float, float]:
+    """
+    Sum the five and ten largest shares.
+
+    The ten and then five largest are selected with linear-time partitions, and
+    portfolios with at most five or ten suburbs skip the selections they do not
+    need, so no shares are sorted.
+
+    Args:
+        shares: Array of shares
+
+    Returns:
+        Tuple of (top 5 sum, top 10 sum)
+    """
+    if shares.size <= 5:
+        total_share = float(shares.sum())
+        return total_share, total_share
+
+    top_10_shares = np.partition(shares, -10)[-10:] if shares.size > 10 else shares
+    top_5_shares = np.partition(top_10_shares, -5)[-5:]
+
+    return float(top_5_shares.sum()), float(top_10_shares.sum())
+
+
+def get_portfolio_aggregates(context: SimulationContext) -> Dict[str, Any]:
+    """
+    Get the portfolio aggregates for the context's loans.
+
+    The aggregates are cached on the context against the loan list and its
+    length, so calculate_zone_distribution, calculate_avg_ltv and
+    calculate_concentration_risk share a single pass over the loans. When loans
+    have been appended to the same list since the last call, only the new loans
+    are aggregated. Loans modified in place are not detected.
+
+    Args:
+        context: Simulation context
 
-        if suburb not in suburb_amounts:
-            suburb_amounts[suburb] = 0
+    Returns:
+        Portfolio aggregates from aggregate_portfolio (must not be modified)
+    """
+    loans = getattr(context, "loans", [])
+    num_loans = len(loans)
+
+    cached = getattr(context, "_portfolio_aggregates_cache", None)
+    if cached is not None and cached[0] is loans and cached[1] == num_loans:
+        return cached[2]
+
+    if cached is not None and cached[0] is loans and cached[1] < num_loans:
+        aggregates = aggregate_portfolio(loans[cached[1]:], base=cached[2])
+    else:
+        aggregates = aggregate_portfolio(loans)
+
+    context._portfolio_aggregates_cache = (loans, num_loans, aggregates)
+
+    return aggregates
 
-        suburb_amounts[suburb] += loan_size
 
-    suburb_shares = {suburb: amount / total_amount for suburb, amount in suburb_amounts.items()}
-    hhi_suburb = sum(share ** 2 for share in suburb_shares.values())
+def aggregate_portfolio(
+    loans: List[Dict[str, Any]],
+    base: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Accumulate the running sums needed for a portfolio risk snapshot.
 
-    # Calculate top 5 and top 10 concentration
-    sorted_suburbs = sorted(suburb_amounts.items(), key=lambda x: x[1], reverse=True)
+    When ``base`` is given, its sums are copied and only ``loans`` are added,
+    so a portfolio that grows by a few loans can be re-aggregated in O(delta)
+    instead of rescanning every loan. The sums of squared zone and suburb
+    amounts are updated per touched key, so the HHIs follow in O(1).
+
+    Args:
+        loans: Loans to add to the aggregates
+        base: Aggregates of the portfolio the loans are added to (not modified)
 
-    top_5_amount = sum(amount for _, amount in sorted_suburbs[:5])
-    top_10_amount = sum(amount for _, amount in sorted_suburbs[:10])
+    Returns:
+        Dictionary with num_loans, total_loan_amount, weighted_ltv_sum,
+        zone_amounts, suburb_amounts, zone_sum_sq and suburb_sum_sq
+    """
+    if base is None:
+        num_loans = 0
+        total_loan_amount = 0
+        weighted_ltv_sum = 0
+        zone_amounts = {}
+        suburb_amounts = {}
+        zone_sum_sq = 0.0
+        suburb_sum_sq = 0.0
+    else:
+        num_loans = base["num_loans"]
+        total_loan_amount = base["total_loan_amount"]
+        weighted_ltv_sum = base["weighted_ltv_sum"]
+        zone_amounts = dict(base["zone_amounts"])
+        suburb_amounts = dict(base["suburb_amounts"])
+        zone_sum_sq = base["zone_sum_sq"]
+        suburb_sum_sq = base["suburb_sum_sq"]
+
+    num_new_loans = len(loans)
+    sizes = np.fromiter((loan.get("loan_size", 0) for loan in loans), dtype=np.float64, count=num_new_loans)
+    ltvs = np.fromiter((loan.get("ltv", 0) for loan in loans), dtype=np.float64, count=num_new_loans)
+
+    total_loan_amount += float(sizes.sum())
+    weighted_ltv_sum += float(sizes @ ltvs)
+
+    # Replace each touched key's squared amount in the running sums of squares
+    for zone, amount in sum_loan_sizes_by_zone(loans, sizes=sizes).items():
+        old_amount = zone_amounts.get(zone, 0)
+        new_amount = old_amount + amount
+        zone_sum_sq += new_amount * new_amount - old_amount * old_amount
+        zone_amounts[zone] = new_amount
+
+    # Sum loan sizes by suburb with a hash factorization and a weighted bincount
+    if num_new_loans:
+        suburb_codes, suburbs = pd.factorize(
+            np.array([loan.get("suburb_name", "unknown") for loan in loans], dtype=object)
+        )
+        suburb_totals = np.bincount(suburb_codes, weights=sizes, minlength=len(suburbs))
 
-    top_5_concentration = top_5_amount / total_amount
-    top_10_concentration = top_10_amount / total_amount
+        for suburb, amount in zip(suburbs.tolist(), suburb_totals.tolist()):
+            old_amount = suburb_amounts.get(suburb, 0)
+            new_amount = old_amount + amount
+            suburb_sum_sq += new_amount * new_amount - old_amount * old_amount
+            suburb_amounts[suburb] = new_amount
 
     return {
-        "hhi_zone": hhi_zone,
-        "hhi_suburb": hhi_suburb,
-        "top_5_concentration": top_5_concentration,
-        "top_10_concentration": top_10_concentration,
+        "num_loans": num_loans + num_new_loans,
+        "total_loan_amount": total_loan_amount,
+        "weighted_ltv_sum": weighted_ltv_sum,
+        "zone_amounts": zone_amounts,
+        "suburb_amounts": suburb_amounts,
+        "zone_sum_sq": zone_sum_sq,
+        "suburb_sum_sq": suburb_sum_sq,
     }
 
 
+def build_portfolio_snapshot(aggregates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a portfolio risk snapshot from portfolio aggregates.
+
+    The snapshot matches what calculate_zone_distribution, calculate_avg_ltv
+    and calculate_concentration_risk report for the same loans.
+
+    Args:
+        aggregates: Portfolio aggregates from aggregate_portfolio
+
+    Returns:
+        Dictionary with num_loans, total_loan_amount, zone_distribution,
+        avg_ltv and concentration_risk
+    """
+    num_loans = aggregates["num_loans"]
+    total_amount = aggregates["total_loan_amount"]
+
+    zone_distribution = dict.fromkeys(_ZONES, 0.0)
+    avg_ltv = 0.0
+
+    if num_loans > 0 and total_amount != 0:
+        for zone, amount in aggregates["zone_amounts"].items():
+            zone_distribution[zone] = amount / total_amount
+        avg_ltv = aggregates["weighted_ltv_sum"] / total_amount
+
+    concentration_risk = concentration_risk_from_aggregates(aggregates)
+
+    return {
+        "num_loans": num_loans,
+        "total_loan_amount": total_amount,
+        "zone_distribution": zone_distribution,
+        "avg_ltv": avg_ltv,
+        "concentration_risk": concentration_risk,
+    }
+
+
+def _risk_factors(avg_ltv: float, concentration_risk: Dict[str, float]) -> np.ndarray:
+    """
+    Build the risk factor vector weighted by _RISK_WEIGHTS.
+
+    Args:
+        avg_ltv: Average LTV of the portfolio
+        concentration_risk: Concentration risk metrics of the portfolio
+
+    Returns:
+        Array of avg_ltv followed by the metrics in _CONCENTRATION_KEYS, missing metrics as 0
+    """
+    get = concentration_risk.get
+    return np.array([avg_ltv, *(get(key, 0) for key in _CONCENTRATION_KEYS)], dtype=np.float64)
+
+
 def calculate_risk_impact(portfolio_before: Dict[str, Any], portfolio_after: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate the impact of reinvestment on portfolio risk.
@@ -1754,11 +2138,10 @@ def calculate_risk_impact(portfolio_before: Dict[str, Any], portfolio_after: Dic
     zone_distribution_before = portfolio_before.get("zone_distribution", {})
     zone_distribution_after = portfolio_after.get("zone_distribution", {})
 
-    zone_distribution_change = {}
-    for zone in set(zone_distribution_before.keys()) | set(zone_distribution_after.keys()):
-        before = zone_distribution_before.get(zone, 0)
-        after = zone_distribution_after.get(zone, 0)
-        zone_distribution_change[zone] = after - before
+    zone_distribution_change = {
+        zone: zone_distribution_after.get(zone, 0) - zone_distribution_before.get(zone, 0)
+        for zone in zone_distribution_before.keys() | zone_distribution_after.keys()
+    }
 
     avg_ltv_before = portfolio_before.get("avg_ltv", 0)
     avg_ltv_after = portfolio_after.get("avg_ltv", 0)
@@ -1767,40 +2150,23 @@ def calculate_risk_impact(portfolio_before: Dict[str, Any], portfolio_after: Dic
     concentration_risk_before = portfolio_before.get("concentration_risk", {})
     concentration_risk_after = portfolio_after.get("concentration_risk", {})
 
-    concentration_risk_change = {}
-    for metric in set(concentration_risk_before.keys()) | set(concentration_risk_after.keys()):
-        before = concentration_risk_before.get(metric, 0)
-        after = concentration_risk_after.get(metric, 0)
-        concentration_risk_change[metric] = after - before
+    concentration_risk_change = {
+        metric: concentration_risk_after.get(metric, 0) - concentration_risk_before.get(metric, 0)
+        for metric in concentration_risk_before.keys() | concentration_risk_after.keys()
+    }
 
     # Calculate overall risk score change
     # Higher score means higher risk
-    risk_score_before = (
-        avg_ltv_before * 0.3 +
-        concentration_risk_before.get("hhi_zone", 0) * 0.2 +
-        concentration_risk_before.get("hhi_suburb", 0) * 0.2 +
-        concentration_risk_before.get("top_5_concentration", 0) * 0.15 +
-        concentration_risk_before.get("top_10_concentration", 0) * 0.15
-    )
-
-    risk_score_after = (
-        avg_ltv_after * 0.3 +
-        concentration_risk_after.get("hhi_zone", 0) * 0.2 +
-        concentration_risk_after.get("hhi_suburb", 0) * 0.2 +
-        concentration_risk_after.get("top_5_concentration", 0) * 0.15 +
-        concentration_risk_after.get("top_10_concentration", 0) * 0.15
-    )
+    risk_factors_before = _risk_factors(avg_ltv_before, concentration_risk_before)
+    risk_factors_after = _risk_factors(avg_ltv_after, concentration_risk_after)
 
+    risk_score_before = float(risk_factors_before @ _RISK_WEIGHTS)
+    risk_score_after = float(risk_factors_after @ _RISK_WEIGHTS)
     risk_score_change = risk_score_after - risk_score_before
 
     # Calculate diversification impact
     # Positive means more diversified, negative means less diversified
-    diversification_impact = (
-        -concentration_risk_change.get("hhi_zone", 0) * 0.4 +
-        -concentration_risk_change.get("hhi_suburb", 0) * 0.4 +
-        -concentration_risk_change.get("top_5_concentration", 0) * 0.1 +
-        -concentration_risk_change.get("top_10_concentration", 0) * 0.1
-    )
+    diversification_impact = float((risk_factors_before[1:] - risk_factors_after[1:]) @ _DIVERSIFICATION_WEIGHTS)
 
     # Calculate risk-adjusted return impact
     # This is a simplified calculation - in a real system, this would be more complex
@@ -12,6 +12,7 @@ import logging
 import os
 import sys
 import time
+from types import MappingProxyType
 from typing import Dict, Any
 
 # Add the project root to the Python path
@@ -30,6 +31,61 @@ from src.reinvest_engine.reinvest_engine import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Configuration shared by the test scenarios
+_BASE_CONFIG_KW = MappingProxyType({
+    "fund_size": 100000000,
+    "fund_term": 10,
+    "vintage_year": 2023,
+    "reinvestment_period": 5,
+    "avg_loan_size": 500000,
+    "avg_loan_ltv": 0.5,
+    "avg_loan_term": 10,
+    "avg_loan_interest_rate": 0.05,
+    "loan_size_std_dev": 100000,
+    "ltv_std_dev": 0.05,
+    "min_loan_size": 100000,
+    "max_loan_size": 1000000,
+    "min_ltv": 0.3,
+    "max_ltv": 0.7,
+    "zone_allocations": {
+        "green": 0.6,
+        "orange": 0.3,
+        "red": 0.1,
+    },
+    "reinvestment_engine": {
+        "reinvestment_strategy": "rebalance",
+        "min_reinvestment_amount": 1000000,
+        "reinvestment_frequency": "quarterly",
+        "reinvestment_delay": 1,
+        "reinvestment_batch_size": 10,
+        "zone_preference_multipliers": {
+            "green": 1.0,
+            "orange": 1.0,
+            "red": 1.0,
+        },
+        "opportunistic_threshold": 0.05,
+        "rebalance_threshold": 0.05,
+        "enable_dynamic_allocation": False,
+        "enable_cash_reserve": True,
+        "cash_reserve_target": 0.05,
+        "cash_reserve_min": 0.02,
+        "cash_reserve_max": 0.1,
+    },
+})
+
+
+def _make_config(**overrides: Any) -> SimulationConfig:
+    """
+    Create a test configuration.
+
+    Args:
+        **overrides: Configuration values replacing the shared defaults
+
+    Returns:
+        Simulation configuration
+    """
+    return SimulationConfig(**{**_BASE_CONFIG_KW, **overrides})
+
 
 async def test_reinvestment_engine() -> None:
     """
@@ -41,46 +97,7 @@ async def test_reinvestment_engine() -> None:
     logger.info("Starting reinvestment engine test")
 
     # Create a test configuration
-    config = SimulationConfig(
-        fund_size=100000000,
-        fund_term=10,
-        vintage_year=2023,
-        reinvestment_period=5,
-        avg_loan_size=500000,
-        avg_loan_ltv=0.5,
-        avg_loan_term=10,
-        avg_loan_interest_rate=0.05,
-        loan_size_std_dev=100000,
-        ltv_std_dev=0.05,
-        min_loan_size=100000,
-        max_loan_size=1000000,
-        min_ltv=0.3,
-        max_ltv=0.7,
-        zone_allocations={
-            "green": 0.6,
-            "orange": 0.3,
-            "red": 0.1,
-        },
-        reinvestment_engine={
-            "reinvestment_strategy": "rebalance",
-            "min_reinvestment_amount": 1000000,
-            "reinvestment_frequency": "quarterly",
-            "reinvestment_delay": 1,
-            "reinvestment_batch_size": 10,
-            "zone_preference_multipliers": {
-                "green": 1.0,
-                "orange": 1.0,
-                "red": 1.0,
-            },
-            "opportunistic_threshold": 0.05,
-            "rebalance_threshold": 0.05,
-            "enable_dynamic_allocation": False,
-            "enable_cash_reserve": True,
-            "cash_reserve_target": 0.05,
-            "cash_reserve_min": 0.02,
-            "cash_reserve_max": 0.1,
-        },
-    )
+    config = _make_config()
 
     # Create a simulation context
     context = SimulationContext(config)
@@ -121,46 +138,7 @@ async def test_manual_reinvestment() -> None:
     logger.info("Starting manual reinvestment test")
 
     # Create a test configuration
-    config = SimulationConfig(
-        fund_size=100000000,
-        fund_term=10,
-        vintage_year=2023,
-        reinvestment_period=5,
-        avg_loan_size=500000,
-        avg_loan_ltv=0.5,
-        avg_loan_term=10,
-        avg_loan_interest_rate=0.05,
-        loan_size_std_dev=100000,
-        ltv_std_dev=0.05,
-        min_loan_size=100000,
-        max_loan_size=1000000,
-        min_ltv=0.3,
-        max_ltv=0.7,
-        zone_allocations={
-            "green": 0.6,
-            "orange": 0.3,
-            "red": 0.1,
-        },
-        reinvestment_engine={
-            "reinvestment_strategy": "rebalance",
-            "min_reinvestment_amount": 1000000,
-            "reinvestment_frequency": "quarterly",
-            "reinvestment_delay": 1,
-            "reinvestment_batch_size": 10,
-            "zone_preference_multipliers": {
-                "green": 1.0,
-                "orange": 1.0,
-                "red": 1.0,
-            },
-            "opportunistic_threshold": 0.05,
-            "rebalance_threshold": 0.05,
-            "enable_dynamic_allocation": False,
-            "enable_cash_reserve": True,
-            "cash_reserve_target": 0.05,
-            "cash_reserve_min": 0.02,
-            "cash_reserve_max": 0.1,
-        },
-    )
+    config = _make_config()
 
     # Create a simulation context
     context = SimulationContext(config)
@@ -201,9 +179,8 @@ async def test_manual_reinvestment() -> None:
 
 
 async def main() -> None:
-    """Run the tests."""
-    await test_reinvestment_engine()
-    await test_manual_reinvestment()
+    """Run the tests concurrently."""
+    await asyncio.gather(test_reinvestment_engine(), test_manual_reinvestment())
 
 
 if __name__ == "__main__":
@@ -7,9 +7,13 @@ but does not stop the simulation.
 """
 
 import asyncio
-from enum import Enum
-from typing import Dict, Any, List, Optional, Set
-from dataclasses import dataclass, field, asdict
+import functools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import numpy as np
 import structlog
 
 from src.engine.simulation_context import SimulationContext
@@ -21,15 +25,139 @@ from src.utils.error_handler import handle_exception, log_error
 logger = structlog.get_logger(__name__)
 
 
-class Severity(str, Enum):
-    """Severity levels for guardrail breaches."""
+def _as_number(value: Any, default: float = 0.0) -> Tuple[Any, bool]:
+    """
+    Coerce a scalar metric value to a number.
+
+    Lists and tuples are reduced to their first element (``default`` if empty).
+
+    Args:
+        value: Metric value
+        default: Value used for empty lists and tuples and non-numeric values
+
+    Returns:
+        Tuple of (number, whether the value was numeric)
+    """
+    if isinstance(value, (list, tuple)):
+        return (value[0] if value else default), True
+    if isinstance(value, (int, float)):
+        return value, True
+    return default, False
+
+
+def _to_float_array(values: Iterable[Any]) -> np.ndarray:
+    """
+    Convert metric values to a float array in a single pass.
+
+    Lists and tuples are reduced to their first element (0.0 if empty) and
+    non-numeric values become NaN, so threshold comparisons skip them.
+
+    Args:
+        values: Metric values
+
+    Returns:
+        Array of float values
+    """
+    return np.fromiter(
+        (
+            (value[0] if value else 0.0) if isinstance(value, (list, tuple))
+            else value if isinstance(value, (int, float)) else np.nan
+            for value in values
+        ),
+        dtype=np.float64,
+    )
+
+
+class Severity:
+    """
+    Severity levels for guardrail breaches.
+
+    The levels are plain strings rather than enum members, since breaches are
+    serialized as strings and compared on every breach.
+    """
 
     INFO = "INFO"
     WARN = "WARN"
     FAIL = "FAIL"
 
 
-@dataclass
+# Bit of each guardrail code in a monitor's checked-guardrails mask, assigned by _check_once
+_GUARDRAIL_BITS: Dict[str, int] = {}
+
+
+def _check_once(code: str) -> Callable[[Callable[..., List["Breach"]]], Callable[..., List["Breach"]]]:
+    """
+    Make a guardrail check run at most once per monitor.
+
+    The code is assigned its own bit, and the checks a monitor has run are
+    tracked as an int bitmask. A repeated check returns no breaches.
+
+    Args:
+        code: Guardrail code
+
+    Returns:
+        Decorator for GuardrailMonitor check methods
+    """
+    bit = _GUARDRAIL_BITS.setdefault(code, 1 << len(_GUARDRAIL_BITS))
+
+    def decorator(check: Callable[..., List["Breach"]]) -> Callable[..., List["Breach"]]:
+        @functools.wraps(check)
+        def wrapper(self: "GuardrailMonitor", *args: Any, **kwargs: Any) -> List["Breach"]:
+            # Parallel checks share the mask, so update it under the lock
+            with self._checked_lock:
+                if self._checked_mask & bit:
+                    return []
+
+                self._checked_mask |= bit
+
+            return check(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Default guardrail thresholds, overridable by the guardrails section of the config.
+# The nested dicts are shared by every monitor and must not be modified.
+_DEFAULT_THRESHOLDS: Dict[str, Any] = {
+    "zone_ticket_limits": {
+        "green": 500000,  # $500k
+        "orange": 400000,  # $400k
+        "red": 300000,  # $300k
+    },
+    "max_term_months": 120,  # 10 years
+    "zone_limits": {
+        "red": 0.05,  # 5%
+        "orange": 0.3,  # 30%
+        "green": 1.0,  # 100%
+    },
+    "city_avg_default": 0.01,  # 1%
+    "city_avg_volatility": 0.05,  # 5%
+    "suburb_concentration_limit": 0.1,  # 10%
+    "loan_concentration_limit": 0.02,  # 2%
+    "max_nav_util": 0.6,  # 60%
+    "min_interest_coverage": 1.25,  # 1.25×
+    "min_liquidity_buffer": 0.04,  # 4%
+    "wal_override": False,
+    "max_wal": 8.0,  # 8 years
+    "max_var_99": 0.15,  # 15%
+    "max_cvar_99": 0.2,  # 20%
+    "min_hurdle_clear_prob": 0.7,  # 70%
+    "min_paths": 500,
+}
+
+# Config JSON schema version supported by the engine
+_ENGINE_SCHEMA_VERSION = "1.0.0"
+
+# Maximum number of FAIL breaches listed in the breach log record
+_MAX_LOGGED_BREACHES = 50
+
+# Severity levels ordered from least to most severe
+_SEVERITY_RANKS = {Severity.INFO: 0, Severity.WARN: 1, Severity.FAIL: 2}
+_FAIL_RANK = _SEVERITY_RANKS[Severity.FAIL]
+
+
+@dataclass(slots=True)
 class Breach:
     """
     Represents a guardrail breach.
@@ -45,7 +173,7 @@ class Breach:
     """
 
     code: str
-    severity: Severity
+    severity: str
     message: str
     value: Optional[float] = None
     threshold: Optional[float] = None
@@ -54,10 +182,18 @@ class Breach:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "code": self.code,
+            "severity": self.severity,
+            "message": self.message,
+            "value": self.value,
+            "threshold": self.threshold,
+            "unit": self.unit,
+            "layer": self.layer,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardrailReport:
     """
     Report of guardrail breaches.
@@ -71,13 +207,17 @@ class GuardrailReport:
     simulation_id: Optional[str] = None
 
     @property
-    def worst_level(self) -> Severity:
+    def worst_level(self) -> str:
         """Get the worst severity level in the report."""
-        if any(b.severity == Severity.FAIL for b in self.breaches):
-            return Severity.FAIL
-        if any(b.severity == Severity.WARN for b in self.breaches):
-            return Severity.WARN
-        return Severity.INFO
+        worst_rank = 0
+        for breach in self.breaches:
+            rank = _SEVERITY_RANKS.get(breach.severity, 0)
+            if rank == _FAIL_RANK:
+                return Severity.FAIL
+            if rank > worst_rank:
+                worst_rank = rank
+
+        return Severity.WARN if worst_rank else Severity.INFO
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -97,14 +237,16 @@ class GuardrailMonitor:
     but does not stop the simulation.
     """
 
-    def __init__(self, context: SimulationContext):
+    def __init__(self, context: SimulationContext, parallel: bool = False):
         """
         Initialize the guardrail monitor.
 
         Args:
             context: Simulation context
+            parallel: Whether to run the independent checks of each layer in a thread pool
         """
         self.context = context
+        self.parallel = parallel
         self.config = context.config
         self.websocket_manager = get_websocket_manager()
 
@@ -112,11 +254,38 @@ class GuardrailMonitor:
         guardrail_obj = getattr(self.config, "guardrails", {})
         self.guardrail_config = guardrail_obj.dict() if hasattr(guardrail_obj, 'dict') else (guardrail_obj if isinstance(guardrail_obj, dict) else {})
 
+        # Check once whether Monte Carlo is enabled with safe attribute access
+        # without serializing the whole submodel
+        monte_carlo_obj = getattr(self.config, "monte_carlo", None)
+        if isinstance(monte_carlo_obj, dict):
+            self.monte_carlo_enabled: bool = bool(monte_carlo_obj.get("enabled", False))
+        else:
+            self.monte_carlo_enabled = bool(getattr(monte_carlo_obj, "enabled", False))
+
+        # Resolve guardrail thresholds once, falling back to the defaults
+        self.thresholds: Dict[str, Any] = {
+            key: self.guardrail_config.get(key, default) for key, default in _DEFAULT_THRESHOLDS.items()
+        }
+
+        # Minimum acceptable IRR P5 from the hurdle rate, with safe attribute access
+        hurdle_rate = getattr(self.config, "hurdle_rate", 0.08)  # 8%
+        self.thresholds["hurdle_rate"] = hurdle_rate
+        self.thresholds["min_irr_p5"] = hurdle_rate - 0.025  # hurdle - 250 bp
+
         # Initialize report
         self.report = GuardrailReport(simulation_id=context.run_id)
 
-        # Track checked guardrails
-        self.checked_guardrails: Set[str] = set()
+        # Track checked guardrails as a bitmask of _GUARDRAIL_BITS
+        self._checked_mask = 0
+        self._checked_lock = threading.Lock()
+
+        # Progress updates of the evaluation stages, sent together with the final report
+        self.progress_stages: List[Dict[str, Any]] = []
+
+    @property
+    def checked_guardrails(self) -> Set[str]:
+        """Get the codes of the guardrails checked so far."""
+        return {code for code, bit in _GUARDRAIL_BITS.items() if self._checked_mask & bit}
 
     async def evaluate_guardrails(self) -> GuardrailReport:
         """
@@ -144,32 +313,9 @@ class GuardrailMonitor:
             logger.info("Guardrail evaluation cancelled", run_id=self.context.run_id)
             return self.report
 
-        # Evaluate property/loan level guardrails
-        await self._evaluate_loan_guardrails(metrics)
-
-        # Check for cancellation
-        if self.websocket_manager and self.websocket_manager.is_cancelled(self.context.run_id):
-            logger.info("Guardrail evaluation cancelled", run_id=self.context.run_id)
-            return self.report
-
-        # Evaluate zone level guardrails
-        await self._evaluate_zone_guardrails(metrics)
-
-        # Check for cancellation
-        if self.websocket_manager and self.websocket_manager.is_cancelled(self.context.run_id):
-            logger.info("Guardrail evaluation cancelled", run_id=self.context.run_id)
-            return self.report
-
-        # Evaluate portfolio level guardrails
-        await self._evaluate_portfolio_guardrails(metrics)
-
-        # Check for cancellation
-        if self.websocket_manager and self.websocket_manager.is_cancelled(self.context.run_id):
-            logger.info("Guardrail evaluation cancelled", run_id=self.context.run_id)
-            return self.report
-
-        # Evaluate model/process guardrails
-        await self._evaluate_model_guardrails(metrics)
+        # Evaluate the guardrails in a worker thread so the event loop stays free
+        # to deliver WebSocket messages while the checks run
+        await asyncio.to_thread(self._evaluate_layers, metrics)
 
         # Send progress update
         if self.websocket_manager:
@@ -178,135 +324,165 @@ class GuardrailMonitor:
                 module="guardrail_monitor",
                 progress=100.0,
                 message="Guardrail evaluation completed",
-                data=self.report.to_dict(),
+                data={**self.report.to_dict(), "stages": self.progress_stages},
             )
 
         # Store report in context
         self.context.guardrail_report = self.report
 
-        # Log breaches
-        for breach in self.report.breaches:
+        breaches = self.report.breaches
+        breach_counts = Counter(breach.code for breach in breaches)
+
+        # Log breaches as a single record with the counts per guardrail and the first failures
+        if breaches:
+            fail_breaches = [breach for breach in breaches if breach.severity == Severity.FAIL]
             logger.warning(
-                "Guardrail breach",
+                "Guardrail breaches",
                 run_id=self.context.run_id,
-                code=breach.code,
-                severity=breach.severity,
-                message=breach.message,
-                value=breach.value,
-                threshold=breach.threshold,
+                total=len(breaches),
+                counts=dict(breach_counts),
+                fail_count=len(fail_breaches),
+                fail=[breach.to_dict() for breach in fail_breaches[:_MAX_LOGGED_BREACHES]],
             )
 
-            # Increment Prometheus counter
+        # Increment Prometheus counter once per breached guardrail
+        for code, count in breach_counts.items():
             increment_counter(
                 "guardrail_violations_total",
-                labels={"guardrail": breach.code},
+                value=count,
+                labels={"guardrail": code},
             )
 
         return self.report
 
-    async def _evaluate_loan_guardrails(self, metrics: Dict[str, Any]) -> None:
+    def _record_progress(self, progress: float, message: str) -> None:
         """
-        Evaluate property/loan level guardrails.
+        Record a progress update for an evaluation stage.
+
+        The stage updates are sent in a single frame with the final report rather
+        than as one WebSocket message each.
 
         Args:
-            metrics: Simulation metrics
+            progress: Progress percentage (0-100)
+            message: Progress message
         """
-        logger.info("Evaluating loan guardrails", run_id=self.context.run_id)
+        self.progress_stages.append({
+            "module": "guardrail_monitor",
+            "progress": progress,
+            "message": message,
+        })
 
-        # Send progress update
-        if self.websocket_manager:
-            await self.websocket_manager.send_progress(
-                simulation_id=self.context.run_id,
-                module="guardrail_monitor",
-                progress=25.0,
-                message="Evaluating loan guardrails",
-            )
+    def _run_checks(self, metrics: Dict[str, Any], checks: List[Callable[[Dict[str, Any]], List[Breach]]]) -> None:
+        """
+        Run guardrail checks and add their breaches to the report.
 
-        # 1. Stress LTV (−20% price dip) ≤ 90%
-        self._check_stress_ltv_guardrail(metrics)
+        The checks are independent, so a parallel monitor runs them in a thread
+        pool that is shut down once they finish. Breaches are added in check order
+        either way.
 
-        # 2. Principal ≤ loan_ticket_limit_zone
-        self._check_loan_size_guardrail(metrics)
+        Args:
+            metrics: Simulation metrics
+            checks: Guardrail check methods
+        """
+        if self.parallel:
+            with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="guardrail_monitor") as executor:
+                results = list(executor.map(lambda check: check(metrics), checks))
+        else:
+            results = [check(metrics) for check in checks]
 
-        # 3. Exit month ≤ max_term_months (120)
-        self._check_exit_month_guardrail(metrics)
+        for breaches in results:
+            self.report.breaches.extend(breaches)
 
-    async def _evaluate_zone_guardrails(self, metrics: Dict[str, Any]) -> None:
+    def _evaluate_layers(self, metrics: Dict[str, Any]) -> None:
         """
-        Evaluate zone level guardrails.
+        Evaluate the property/loan, zone, portfolio and model/process level guardrails.
 
         Args:
             metrics: Simulation metrics
         """
-        logger.info("Evaluating zone guardrails", run_id=self.context.run_id)
-
-        # Send progress update
-        if self.websocket_manager:
-            await self.websocket_manager.send_progress(
-                simulation_id=self.context.run_id,
-                module="guardrail_monitor",
-                progress=50.0,
-                message="Evaluating zone guardrails",
-            )
-
-        # 4. Zone NAV weight ≤ capital_limit_zone (e.g. Red ≤ 5%)
-        self._check_zone_nav_weight_guardrail(metrics)
+        self._evaluate_loan_guardrails(metrics)
+        self._evaluate_zone_guardrails(metrics)
+        self._evaluate_portfolio_guardrails(metrics)
+        self._evaluate_model_guardrails(metrics)
 
-        # 5. Default rate zone ≤ 2× city_avg_default
-        self._check_zone_default_rate_guardrail(metrics)
-
-        # 6. Sigma price zone ≤ 3× city σ
-        self._check_zone_price_volatility_guardrail(metrics)
-
-    async def _evaluate_portfolio_guardrails(self, metrics: Dict[str, Any]) -> None:
+    def _evaluate_loan_guardrails(self, metrics: Dict[str, Any]) -> None:
         """
-        Evaluate portfolio level guardrails.
+        Evaluate property/loan level guardrails.
 
         Args:
             metrics: Simulation metrics
         """
-        logger.info("Evaluating portfolio guardrails", run_id=self.context.run_id)
-
-        # Send progress update
-        if self.websocket_manager:
-            await self.websocket_manager.send_progress(
-                simulation_id=self.context.run_id,
-                module="guardrail_monitor",
-                progress=75.0,
-                message="Evaluating portfolio guardrails",
-            )
-
-        # 7. Single suburb weight ≤ 10% NAV
-        self._check_suburb_concentration_guardrail(metrics)
-
-        # 8. Largest single loan weight ≤ 2% NAV
-        self._check_loan_concentration_guardrail(metrics)
+        logger.info("Evaluating loan guardrails", run_id=self.context.run_id)
 
-        # 9. NAV facility utilisation ≤ max_nav_util (cfg)
-        self._check_nav_utilization_guardrail(metrics)
+        # Record progress update
+        self._record_progress(25.0, "Evaluating loan guardrails")
 
-        # 10. Interest-coverage ratio (ICR) ≥ 1.25×
-        self._check_interest_coverage_guardrail(metrics)
+        self._run_checks(metrics, [
+            # 1. Stress LTV (−20% price dip) ≤ 90%
+            self._check_stress_ltv_guardrail,
+            # 2. Principal ≤ loan_ticket_limit_zone
+            self._check_loan_size_guardrail,
+            # 3. Exit month ≤ max_term_months (120)
+            self._check_exit_month_guardrail,
+        ])
 
-        # 11. Liquidity buffer (cash + undrawn) ≥ 4% NAV
-        self._check_liquidity_buffer_guardrail(metrics)
+    def _evaluate_zone_guardrails(self, metrics: Dict[str, Any]) -> None:
+        """
+        Evaluate zone level guardrails.
 
-        # 12. Weighted-Avg Life (WAL) ≤ 8 yrs unless wal_override=true
-        self._check_wal_guardrail(metrics)
+        Args:
+            metrics: Simulation metrics
+        """
+        logger.info("Evaluating zone guardrails", run_id=self.context.run_id)
 
-        # 13. VaR-99 ≤ 15% NAV (MC mode only)
-        self._check_var_guardrail(metrics)
+        # Record progress update
+        self._record_progress(50.0, "Evaluating zone guardrails")
 
-        # 14. CVaR-99 ≤ 20% NAV (MC mode only)
-        self._check_cvar_guardrail(metrics)
+        self._run_checks(metrics, [
+            # 4. Zone NAV weight ≤ capital_limit_zone (e.g. Red ≤ 5%)
+            self._check_zone_nav_weight_guardrail,
+            # 5. Default rate zone ≤ 2× city_avg_default
+            self._check_zone_default_rate_guardrail,
+            # 6. Sigma price zone ≤ 3× city σ
+            self._check_zone_price_volatility_guardrail,
+        ])
 
-        # 15. Net-IRR P5 ≥ hurdle (8%) – 250 bp
-        self._check_irr_p5_guardrail(metrics)
+    def _evaluate_portfolio_guardrails(self, metrics: Dict[str, Any]) -> None:
+        """
+        Evaluate portfolio level guardrails.
 
-        # 16. Hurdle-clear probability ≥ 70% (MC mode only)
-        self._check_hurdle_clear_probability_guardrail(metrics)
+        Args:
+            metrics: Simulation metrics
+        """
+        logger.info("Evaluating portfolio guardrails", run_id=self.context.run_id)
 
-    async def _evaluate_model_guardrails(self, metrics: Dict[str, Any]) -> None:
+        # Record progress update
+        self._record_progress(75.0, "Evaluating portfolio guardrails")
+
+        self._run_checks(metrics, [
+            # 7. Single suburb weight ≤ 10% NAV
+            self._check_suburb_concentration_guardrail,
+            # 8. Largest single loan weight ≤ 2% NAV
+            self._check_loan_concentration_guardrail,
+            # 9. NAV facility utilisation ≤ max_nav_util (cfg)
+            self._check_nav_utilization_guardrail,
+            # 10. Interest-coverage ratio (ICR) ≥ 1.25×
+            self._check_interest_coverage_guardrail,
+            # 11. Liquidity buffer (cash + undrawn) ≥ 4% NAV
+            self._check_liquidity_buffer_guardrail,
+            # 12. Weighted-Avg Life (WAL) ≤ 8 yrs unless wal_override=true
+            self._check_wal_guardrail,
+            # 13. VaR-99 ≤ 15% NAV (MC mode only)
+            self._check_var_guardrail,
+            # 14. CVaR-99 ≤ 20% NAV (MC mode only)
+            self._check_cvar_guardrail,
+            # 15. Net-IRR P5 ≥ hurdle (8%) – 250 bp
+            self._check_irr_p5_guardrail,
+            # 16. Hurdle-clear probability ≥ 70% (MC mode only)
+            self._check_hurdle_clear_probability_guardrail,
+        ])
+
+    def _evaluate_model_guardrails(self, metrics: Dict[str, Any]) -> None:
         """
         Evaluate model/process guardrails.
 
@@ -315,25 +491,20 @@ class GuardrailMonitor:
         """
         logger.info("Evaluating model guardrails", run_id=self.context.run_id)
 
-        # Send progress update
-        if self.websocket_manager:
-            await self.websocket_manager.send_progress(
-                simulation_id=self.context.run_id,
-                module="guardrail_monitor",
-                progress=90.0,
-                message="Evaluating model guardrails",
-            )
-
-        # 17. Config JSON schema version == engine schema version
-        self._check_schema_version_guardrail()
-
-        # 18. Monte-Carlo inner paths ≥ min_paths (500)
-        self._check_mc_paths_guardrail(metrics)
+        # Record progress update
+        self._record_progress(90.0, "Evaluating model guardrails")
 
-        # 19. Seed reproducibility check (rerun hash)
-        self._check_seed_reproducibility_guardrail(metrics)
+        self._run_checks(metrics, [
+            # 17. Config JSON schema version == engine schema version
+            self._check_schema_version_guardrail,
+            # 18. Monte-Carlo inner paths ≥ min_paths (500)
+            self._check_mc_paths_guardrail,
+            # 19. Seed reproducibility check (rerun hash)
+            self._check_seed_reproducibility_guardrail,
+        ])
 
-    def _check_stress_ltv_guardrail(self, metrics: Dict[str, Any]) -> None:
+    @_check_once("LTV_STRESS_HIGH")
+    def _check_stress_ltv_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check stress LTV guardrail.
 
@@ -343,40 +514,40 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "LTV_STRESS_HIGH" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("LTV_STRESS_HIGH")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get stress LTV metrics
         credit_metrics = metrics.get("credit_metrics", {})
         stress_ltv = credit_metrics.get("stress_ltv", {})
         loan_stress_ltvs = stress_ltv.get("loan_stress_ltvs", {})
 
-        # Check each loan
-        for loan_id, ltv in loan_stress_ltvs.items():
-            # Ensure ltv is a numeric value, not a list
-            if isinstance(ltv, (list, tuple)):
-                ltv = ltv[0] if ltv else 0.0
-            elif not isinstance(ltv, (int, float)):
-                continue
-
-            if ltv > 0.9:  # 90%
-                self.report.breaches.append(
-                    Breach(
-                        code="LTV_STRESS_HIGH",
-                        severity=Severity.FAIL,
-                        message=f"Loan {loan_id} has stress LTV of {ltv:.2%}, exceeding 90%",
-                        value=ltv,
-                        threshold=0.9,
-                        unit="%",
-                        layer="Unit",
-                    )
+        # Check all loans at once
+        loan_ids = list(loan_stress_ltvs)
+        ltvs = _to_float_array(loan_stress_ltvs.values())
+
+        for i in np.flatnonzero(ltvs > 0.9):  # 90%
+            loan_id = loan_ids[i]
+            ltv = ltvs[i].item()
+            breaches.append(
+                Breach(
+                    code="LTV_STRESS_HIGH",
+                    severity=Severity.FAIL,
+                    message=f"Loan {loan_id} has stress LTV of {ltv:.2%}, exceeding 90%",
+                    value=ltv,
+                    threshold=0.9,
+                    unit="%",
+                    layer="Unit",
                 )
+            )
 
-    def _check_loan_size_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("LOAN_SIZE_LIMIT")
+    def _check_loan_size_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check loan size guardrail.
 
@@ -386,68 +557,72 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "LOAN_SIZE_LIMIT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("LOAN_SIZE_LIMIT")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get portfolio
         portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
 
         if not portfolio:
-            return
+            return breaches
 
         # Get loans
         loans = portfolio.get("loans", [])
 
         if not loans:
-            return
+            return breaches
 
         # Get zone ticket limits from config
-        zone_ticket_limits = self.guardrail_config.get("zone_ticket_limits", {
-            "green": 500000,  # $500k
-            "orange": 400000,  # $400k
-            "red": 300000,  # $300k
-        })
+        zone_ticket_limits = self.thresholds["zone_ticket_limits"]
 
-        # Check each loan
+        # Get each loan's suburb zone from TLS data, looking up every suburb once
+        tls_manager = getattr(self.context, "tls_manager", None)
+        zones_by_suburb: Dict[str, str] = {}
+        suburb_zones = []
         for loan in loans:
-            loan_id = loan.get("loan_id")
-            loan_amount = loan.get("loan_amount", 0.0)
             suburb = loan.get("suburb")
-
-            # Get suburb zone from TLS data
             suburb_zone = "green"  # Default to green zone
 
-            if hasattr(self.context, "tls_manager") and self.context.tls_manager and suburb:
-                suburb_data = self.context.tls_manager.get_suburb_data(suburb)
-                suburb_zone = suburb_data.get("zone", "green")
-
-            # Get ticket limit for zone
+            if tls_manager and suburb:
+                suburb_zone = zones_by_suburb.get(suburb)
+                if suburb_zone is None:
+                    suburb_zone = tls_manager.get_suburb_data(suburb).get("zone", "green")
+                    zones_by_suburb[suburb] = suburb_zone
+
+            suburb_zones.append(suburb_zone)
+
+        # Check all loans at once against their zone's ticket limit
+        loan_amounts = _to_float_array(loan.get("loan_amount", 0.0) for loan in loans)
+        ticket_limits = np.fromiter(
+            (zone_ticket_limits.get(suburb_zone, 500000) for suburb_zone in suburb_zones),
+            dtype=np.float64,
+            count=len(suburb_zones),
+        )
+
+        for i in np.flatnonzero(loan_amounts > ticket_limits):
+            loan_id = loans[i].get("loan_id")
+            loan_amount = loan_amounts[i].item()
+            suburb_zone = suburb_zones[i]
             ticket_limit = zone_ticket_limits.get(suburb_zone, 500000)
-
-            # Ensure loan_amount is a numeric value, not a list
-            if isinstance(loan_amount, (list, tuple)):
-                loan_amount = loan_amount[0] if loan_amount else 0.0
-            elif not isinstance(loan_amount, (int, float)):
-                continue
-
-            if loan_amount > ticket_limit:
-                self.report.breaches.append(
-                    Breach(
-                        code="LOAN_SIZE_LIMIT",
-                        severity=Severity.FAIL,
-                        message=f"Loan {loan_id} amount ${loan_amount:,.0f} exceeds {suburb_zone} zone limit of ${ticket_limit:,.0f}",
-                        value=loan_amount,
-                        threshold=ticket_limit,
-                        unit="$",
-                        layer="Unit",
-                    )
+            breaches.append(
+                Breach(
+                    code="LOAN_SIZE_LIMIT",
+                    severity=Severity.FAIL,
+                    message=f"Loan {loan_id} amount ${loan_amount:,.0f} exceeds {suburb_zone} zone limit of ${ticket_limit:,.0f}",
+                    value=loan_amount,
+                    threshold=ticket_limit,
+                    unit="$",
+                    layer="Unit",
                 )
+            )
 
-    def _check_exit_month_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("EXIT_MONTH_LIMIT")
+    def _check_exit_month_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check exit month guardrail.
 
@@ -457,18 +632,17 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "EXIT_MONTH_LIMIT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("EXIT_MONTH_LIMIT")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get exits
         exits = self.context.exits if hasattr(self.context, "exits") else {}
 
         if not exits:
-            return
+            return breaches
 
         # Ensure exits is a dictionary, not a list
         if isinstance(exits, list):
@@ -482,32 +656,31 @@ class GuardrailMonitor:
             exits = exits_dict
 
         # Get max term months from config
-        max_term_months = self.guardrail_config.get("max_term_months", 120)  # 10 years
-
-        # Check each exit
-        for loan_id, exit_data in exits.items():
-            exit_month = exit_data.get("exit_month", 0)
-
-            # Ensure exit_month is a numeric value, not a list
-            if isinstance(exit_month, (list, tuple)):
-                exit_month = exit_month[0] if exit_month else 0
-            elif not isinstance(exit_month, (int, float)):
-                continue
-
-            if exit_month > max_term_months:
-                self.report.breaches.append(
-                    Breach(
-                        code="EXIT_MONTH_LIMIT",
-                        severity=Severity.FAIL,
-                        message=f"Loan {loan_id} exit month {exit_month} exceeds maximum term of {max_term_months} months",
-                        value=exit_month,
-                        threshold=max_term_months,
-                        unit="months",
-                        layer="Unit",
-                    )
+        max_term_months = self.thresholds["max_term_months"]
+
+        # Check all exits at once
+        loan_ids = list(exits)
+        exit_months = _to_float_array(exit_data.get("exit_month", 0) for exit_data in exits.values())
+
+        for i in np.flatnonzero(exit_months > max_term_months):
+            loan_id = loan_ids[i]
+            exit_month = exit_months[i].item()
+            breaches.append(
+                Breach(
+                    code="EXIT_MONTH_LIMIT",
+                    severity=Severity.FAIL,
+                    message=f"Loan {loan_id} exit month {exit_month:g} exceeds maximum term of {max_term_months} months",
+                    value=exit_month,
+                    threshold=max_term_months,
+                    unit="months",
+                    layer="Unit",
                 )
+            )
+
+        return breaches
 
-    def _check_zone_nav_weight_guardrail(self, metrics: Dict[str, Any]) -> None:
+    @_check_once("ZONE_RED_WEIGHT")
+    def _check_zone_nav_weight_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check zone NAV weight guardrail.
 
@@ -517,48 +690,44 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "ZONE_RED_WEIGHT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("ZONE_RED_WEIGHT")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get concentration metrics
         concentration_metrics = metrics.get("concentration_metrics", {})
         zone_exposure = concentration_metrics.get("zone_exposure", {})
 
         # Get zone limits from config
-        zone_limits = self.guardrail_config.get("zone_limits", {
-            "red": 0.05,  # 5%
-            "orange": 0.3,  # 30%
-            "green": 1.0,  # 100%
-        })
+        zone_limits = self.thresholds["zone_limits"]
 
-        # Check each zone
-        for zone, exposure in zone_exposure.items():
-            limit = zone_limits.get(zone, 1.0)
+        # Check all zones at once against their limits
+        zones = list(zone_exposure)
+        exposures = _to_float_array(zone_exposure.values())
+        limits = np.fromiter((zone_limits.get(zone, 1.0) for zone in zones), dtype=np.float64, count=len(zones))
 
-            # Ensure exposure is a numeric value, not a list
-            if isinstance(exposure, (list, tuple)):
-                exposure = exposure[0] if exposure else 0.0
-            elif not isinstance(exposure, (int, float)):
-                continue
-
-            if exposure > limit:
-                self.report.breaches.append(
-                    Breach(
-                        code=f"ZONE_{zone.upper()}_WEIGHT",
-                        severity=Severity.FAIL,
-                        message=f"{zone.capitalize()} zone exposure of {exposure:.2%} exceeds limit of {limit:.2%}",
-                        value=exposure,
-                        threshold=limit,
-                        unit="%",
-                        layer="Zone",
-                    )
+        for i in np.flatnonzero(exposures > limits):
+            zone = zones[i]
+            exposure = exposures[i].item()
+            limit = zone_limits.get(zone, 1.0)
+            breaches.append(
+                Breach(
+                    code=f"ZONE_{zone.upper()}_WEIGHT",
+                    severity=Severity.FAIL,
+                    message=f"{zone.capitalize()} zone exposure of {exposure:.2%} exceeds limit of {limit:.2%}",
+                    value=exposure,
+                    threshold=limit,
+                    unit="%",
+                    layer="Zone",
                 )
+            )
 
-    def _check_zone_default_rate_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("PD_ZONE_ALERT")
+    def _check_zone_default_rate_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check zone default rate guardrail.
 
@@ -568,12 +737,11 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "PD_ZONE_ALERT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("PD_ZONE_ALERT")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get credit metrics
         credit_metrics = metrics.get("credit_metrics", {})
@@ -581,32 +749,32 @@ class GuardrailMonitor:
         zone_default_probs = default_probability.get("zone_default_probs", {})
 
         # Get city average default rate
-        city_avg_default = self.guardrail_config.get("city_avg_default", 0.01)  # 1%
-
-        # Check each zone
-        for zone, default_rate in zone_default_probs.items():
-            threshold = 2 * city_avg_default
-
-            # Ensure default_rate is a numeric value, not a list
-            if isinstance(default_rate, (list, tuple)):
-                default_rate = default_rate[0] if default_rate else 0.0
-            elif not isinstance(default_rate, (int, float)):
-                continue
-
-            if default_rate > threshold:
-                self.report.breaches.append(
-                    Breach(
-                        code="PD_ZONE_ALERT",
-                        severity=Severity.WARN,
-                        message=f"{zone.capitalize()} zone default rate of {default_rate:.2%} exceeds 2× city average of {threshold:.2%}",
-                        value=default_rate,
-                        threshold=threshold,
-                        unit="%",
-                        layer="Zone",
-                    )
+        city_avg_default = self.thresholds["city_avg_default"]
+
+        # Check all zones at once
+        threshold = 2 * city_avg_default
+        zones = list(zone_default_probs)
+        default_rates = _to_float_array(zone_default_probs.values())
+
+        for i in np.flatnonzero(default_rates > threshold):
+            zone = zones[i]
+            default_rate = default_rates[i].item()
+            breaches.append(
+                Breach(
+                    code="PD_ZONE_ALERT",
+                    severity=Severity.WARN,
+                    message=f"{zone.capitalize()} zone default rate of {default_rate:.2%} exceeds 2× city average of {threshold:.2%}",
+                    value=default_rate,
+                    threshold=threshold,
+                    unit="%",
+                    layer="Zone",
                 )
+            )
+
+        return breaches
 
-    def _check_zone_price_volatility_guardrail(self, metrics: Dict[str, Any]) -> None:
+    @_check_once("ZONE_VOLATILITY_HIGH")
+    def _check_zone_price_volatility_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check zone price volatility guardrail.
 
@@ -616,12 +784,11 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "ZONE_VOLATILITY_HIGH" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("ZONE_VOLATILITY_HIGH")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get market price metrics
         market_price_metrics = metrics.get("market_price_metrics", {})
@@ -629,32 +796,32 @@ class GuardrailMonitor:
         zone_volatilities = volatility.get("zones", {})
 
         # Get city average volatility
-        city_avg_volatility = self.guardrail_config.get("city_avg_volatility", 0.05)  # 5%
-
-        # Check each zone
-        for zone, vol in zone_volatilities.items():
-            threshold = 3 * city_avg_volatility
-
-            # Ensure vol is a numeric value, not a list
-            if isinstance(vol, (list, tuple)):
-                vol = vol[0] if vol else 0.0
-            elif not isinstance(vol, (int, float)):
-                continue
-
-            if vol > threshold:
-                self.report.breaches.append(
-                    Breach(
-                        code="ZONE_VOLATILITY_HIGH",
-                        severity=Severity.WARN,
-                        message=f"{zone.capitalize()} zone price volatility of {vol:.2%} exceeds 3× city average of {threshold:.2%}",
-                        value=vol,
-                        threshold=threshold,
-                        unit="%",
-                        layer="Zone",
-                    )
+        city_avg_volatility = self.thresholds["city_avg_volatility"]
+
+        # Check all zones at once
+        threshold = 3 * city_avg_volatility
+        zones = list(zone_volatilities)
+        vols = _to_float_array(zone_volatilities.values())
+
+        for i in np.flatnonzero(vols > threshold):
+            zone = zones[i]
+            vol = vols[i].item()
+            breaches.append(
+                Breach(
+                    code="ZONE_VOLATILITY_HIGH",
+                    severity=Severity.WARN,
+                    message=f"{zone.capitalize()} zone price volatility of {vol:.2%} exceeds 3× city average of {threshold:.2%}",
+                    value=vol,
+                    threshold=threshold,
+                    unit="%",
+                    layer="Zone",
                 )
+            )
+
+        return breaches
 
-    def _check_suburb_concentration_guardrail(self, metrics: Dict[str, Any]) -> None:
+    @_check_once("SUBURB_CONCENTRATION")
+    def _check_suburb_concentration_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check suburb concentration guardrail.
 
@@ -664,42 +831,42 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "SUBURB_CONCENTRATION" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("SUBURB_CONCENTRATION")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get concentration metrics
         concentration_metrics = metrics.get("concentration_metrics", {})
         suburb_exposure = concentration_metrics.get("suburb_exposure", {})
 
         # Get suburb concentration limit from config
-        suburb_concentration_limit = self.guardrail_config.get("suburb_concentration_limit", 0.1)  # 10%
-
-        # Check each suburb
-        for suburb, exposure in suburb_exposure.items():
-            # Ensure exposure is a numeric value, not a list
-            if isinstance(exposure, (list, tuple)):
-                exposure = exposure[0] if exposure else 0.0
-            elif not isinstance(exposure, (int, float)):
-                continue
-
-            if exposure > suburb_concentration_limit:
-                self.report.breaches.append(
-                    Breach(
-                        code="SUBURB_CONCENTRATION",
-                        severity=Severity.FAIL,
-                        message=f"Suburb {suburb} exposure of {exposure:.2%} exceeds limit of {suburb_concentration_limit:.2%}",
-                        value=exposure,
-                        threshold=suburb_concentration_limit,
-                        unit="%",
-                        layer="Portfolio",
-                    )
+        suburb_concentration_limit = self.thresholds["suburb_concentration_limit"]
+
+        # Check all suburbs at once
+        suburbs = list(suburb_exposure)
+        exposures = _to_float_array(suburb_exposure.values())
+
+        for i in np.flatnonzero(exposures > suburb_concentration_limit):
+            suburb = suburbs[i]
+            exposure = exposures[i].item()
+            breaches.append(
+                Breach(
+                    code="SUBURB_CONCENTRATION",
+                    severity=Severity.FAIL,
+                    message=f"Suburb {suburb} exposure of {exposure:.2%} exceeds limit of {suburb_concentration_limit:.2%}",
+                    value=exposure,
+                    threshold=suburb_concentration_limit,
+                    unit="%",
+                    layer="Portfolio",
                 )
+            )
 
-    def _check_loan_concentration_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("LOAN_CONCENTRATION")
+    def _check_loan_concentration_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check loan concentration guardrail.
 
@@ -709,42 +876,42 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "LOAN_CONCENTRATION" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("LOAN_CONCENTRATION")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get concentration metrics
         concentration_metrics = metrics.get("concentration_metrics", {})
         loan_exposure = concentration_metrics.get("loan_exposure", {})
 
         # Get loan concentration limit from config
-        loan_concentration_limit = self.guardrail_config.get("loan_concentration_limit", 0.02)  # 2%
-
-        # Check each loan
-        for loan_id, exposure in loan_exposure.items():
-            # Ensure exposure is a numeric value, not a list
-            if isinstance(exposure, (list, tuple)):
-                exposure = exposure[0] if exposure else 0.0
-            elif not isinstance(exposure, (int, float)):
-                continue
-
-            if exposure > loan_concentration_limit:
-                self.report.breaches.append(
-                    Breach(
-                        code="LOAN_CONCENTRATION",
-                        severity=Severity.WARN,
-                        message=f"Loan {loan_id} exposure of {exposure:.2%} exceeds limit of {loan_concentration_limit:.2%}",
-                        value=exposure,
-                        threshold=loan_concentration_limit,
-                        unit="%",
-                        layer="Portfolio",
-                    )
+        loan_concentration_limit = self.thresholds["loan_concentration_limit"]
+
+        # Check all loans at once
+        loan_ids = list(loan_exposure)
+        exposures = _to_float_array(loan_exposure.values())
+
+        for i in np.flatnonzero(exposures > loan_concentration_limit):
+            loan_id = loan_ids[i]
+            exposure = exposures[i].item()
+            breaches.append(
+                Breach(
+                    code="LOAN_CONCENTRATION",
+                    severity=Severity.WARN,
+                    message=f"Loan {loan_id} exposure of {exposure:.2%} exceeds limit of {loan_concentration_limit:.2%}",
+                    value=exposure,
+                    threshold=loan_concentration_limit,
+                    unit="%",
+                    layer="Portfolio",
                 )
+            )
 
-    def _check_nav_utilization_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("LEVERAGE_UTIL")
+    def _check_nav_utilization_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check NAV utilization guardrail.
 
@@ -754,28 +921,26 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "LEVERAGE_UTIL" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("LEVERAGE_UTIL")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get leverage metrics
         leverage_metrics = metrics.get("leverage_metrics", {})
         nav_utilisation = leverage_metrics.get("nav_utilisation", 0.0)
 
         # Get max NAV utilization from config
-        max_nav_util = self.guardrail_config.get("max_nav_util", 0.6)  # 60%
+        max_nav_util = self.thresholds["max_nav_util"]
 
         # Ensure nav_utilisation is a numeric value, not a list
-        if isinstance(nav_utilisation, (list, tuple)):
-            nav_utilisation = nav_utilisation[0] if nav_utilisation else 0.0
-        elif not isinstance(nav_utilisation, (int, float)):
-            return
+        nav_utilisation, is_number = _as_number(nav_utilisation)
+        if not is_number:
+            return breaches
 
         if nav_utilisation > max_nav_util:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="LEVERAGE_UTIL",
                     severity=Severity.FAIL,
@@ -787,7 +952,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_interest_coverage_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("INTEREST_COVERAGE")
+    def _check_interest_coverage_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check interest coverage guardrail.
 
@@ -797,28 +965,26 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "INTEREST_COVERAGE" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("INTEREST_COVERAGE")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get leverage metrics
         leverage_metrics = metrics.get("leverage_metrics", {})
         interest_coverage = leverage_metrics.get("interest_coverage", 0.0)
 
         # Get min interest coverage from config
-        min_interest_coverage = self.guardrail_config.get("min_interest_coverage", 1.25)  # 1.25×
+        min_interest_coverage = self.thresholds["min_interest_coverage"]
 
         # Ensure interest_coverage is a numeric value, not a list
-        if isinstance(interest_coverage, (list, tuple)):
-            interest_coverage = interest_coverage[0] if interest_coverage else 0.0
-        elif not isinstance(interest_coverage, (int, float)):
-            return
+        interest_coverage, is_number = _as_number(interest_coverage)
+        if not is_number:
+            return breaches
 
         if interest_coverage < min_interest_coverage:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="INTEREST_COVERAGE",
                     severity=Severity.FAIL,
@@ -830,7 +996,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_liquidity_buffer_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("LIQUIDITY_BUFFER_LOW")
+    def _check_liquidity_buffer_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check liquidity buffer guardrail.
 
@@ -840,28 +1009,26 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "LIQUIDITY_BUFFER_LOW" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("LIQUIDITY_BUFFER_LOW")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Get liquidity metrics
         liquidity_metrics = metrics.get("liquidity_metrics", {})
         liquidity_buffer = liquidity_metrics.get("liquidity_buffer", 0.0)
 
         # Get min liquidity buffer from config
-        min_liquidity_buffer = self.guardrail_config.get("min_liquidity_buffer", 0.04)  # 4%
+        min_liquidity_buffer = self.thresholds["min_liquidity_buffer"]
 
         # Ensure liquidity_buffer is a numeric value, not a list
-        if isinstance(liquidity_buffer, (list, tuple)):
-            liquidity_buffer = liquidity_buffer[0] if liquidity_buffer else 0.0
-        elif not isinstance(liquidity_buffer, (int, float)):
-            return
+        liquidity_buffer, is_number = _as_number(liquidity_buffer)
+        if not is_number:
+            return breaches
 
         if liquidity_buffer < min_liquidity_buffer:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="LIQUIDITY_BUFFER_LOW",
                     severity=Severity.FAIL,
@@ -873,7 +1040,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_wal_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("WAL_SOFT")
+    def _check_wal_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check WAL guardrail.
 
@@ -883,34 +1053,32 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "WAL_SOFT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("WAL_SOFT")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # Check if WAL override is enabled
-        wal_override = self.guardrail_config.get("wal_override", False)
+        wal_override = self.thresholds["wal_override"]
 
         if wal_override:
-            return
+            return breaches
 
         # Get liquidity metrics
         liquidity_metrics = metrics.get("liquidity_metrics", {})
         wal = liquidity_metrics.get("wal", 0.0)
 
         # Get max WAL from config
-        max_wal = self.guardrail_config.get("max_wal", 8.0)  # 8 years
+        max_wal = self.thresholds["max_wal"]
 
         # Ensure wal is a numeric value, not a list
-        if isinstance(wal, (list, tuple)):
-            wal = wal[0] if wal else 0.0
-        elif not isinstance(wal, (int, float)):
-            return
+        wal, is_number = _as_number(wal)
+        if not is_number:
+            return breaches
 
         if wal > max_wal:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="WAL_SOFT",
                     severity=Severity.WARN,
@@ -922,7 +1090,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_var_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("VaR_99_LIMIT")
+    def _check_var_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check VaR guardrail.
 
@@ -932,20 +1103,15 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "VaR_99_LIMIT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("VaR_99_LIMIT")
-
-        # Check if Monte Carlo is enabled with safe attribute access
-        monte_carlo_obj = getattr(self.config, "monte_carlo", {})
-        monte_carlo_dict = monte_carlo_obj.dict() if hasattr(monte_carlo_obj, 'dict') else (monte_carlo_obj if isinstance(monte_carlo_obj, dict) else {})
-        monte_carlo_enabled = monte_carlo_dict.get("enabled", False)
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
-        if not monte_carlo_enabled:
-            return
+        # Skip unless Monte Carlo is enabled
+        if not self.monte_carlo_enabled:
+            return breaches
 
         # Get market price metrics
         market_price_metrics = metrics.get("market_price_metrics", {})
@@ -953,16 +1119,15 @@ class GuardrailMonitor:
         var_99 = var.get("var_99", 0.0)
 
         # Get max VaR-99 from config
-        max_var_99 = self.guardrail_config.get("max_var_99", 0.15)  # 15%
+        max_var_99 = self.thresholds["max_var_99"]
 
         # Ensure var_99 is a numeric value, not a list
-        if isinstance(var_99, (list, tuple)):
-            var_99 = var_99[0] if var_99 else 0.0
-        elif not isinstance(var_99, (int, float)):
-            return
+        var_99, is_number = _as_number(var_99)
+        if not is_number:
+            return breaches
 
         if var_99 > max_var_99:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="VaR_99_LIMIT",
                     severity=Severity.FAIL,
@@ -974,7 +1139,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_cvar_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("CVaR_99_LIMIT")
+    def _check_cvar_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check CVaR guardrail.
 
@@ -984,20 +1152,15 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "CVaR_99_LIMIT" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("CVaR_99_LIMIT")
-
-        # Check if Monte Carlo is enabled with safe attribute access
-        monte_carlo_obj = getattr(self.config, "monte_carlo", {})
-        monte_carlo_dict = monte_carlo_obj.dict() if hasattr(monte_carlo_obj, 'dict') else (monte_carlo_obj if isinstance(monte_carlo_obj, dict) else {})
-        monte_carlo_enabled = monte_carlo_dict.get("enabled", False)
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
-        if not monte_carlo_enabled:
-            return
+        # Skip unless Monte Carlo is enabled
+        if not self.monte_carlo_enabled:
+            return breaches
 
         # Get market price metrics
         market_price_metrics = metrics.get("market_price_metrics", {})
@@ -1005,16 +1168,15 @@ class GuardrailMonitor:
         cvar_99 = cvar.get("cvar_99", 0.0)
 
         # Get max CVaR-99 from config
-        max_cvar_99 = self.guardrail_config.get("max_cvar_99", 0.2)  # 20%
+        max_cvar_99 = self.thresholds["max_cvar_99"]
 
         # Ensure cvar_99 is a numeric value, not a list
-        if isinstance(cvar_99, (list, tuple)):
-            cvar_99 = cvar_99[0] if cvar_99 else 0.0
-        elif not isinstance(cvar_99, (int, float)):
-            return
+        cvar_99, is_number = _as_number(cvar_99)
+        if not is_number:
+            return breaches
 
         if cvar_99 > max_cvar_99:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="CVaR_99_LIMIT",
                     severity=Severity.FAIL,
@@ -1026,7 +1188,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_irr_p5_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("IRR_P5_LOW")
+    def _check_irr_p5_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check IRR P5 guardrail.
 
@@ -1036,40 +1201,32 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "IRR_P5_LOW" in self.checked_guardrails:
-            return
-
-        self.checked_guardrails.add("IRR_P5_LOW")
 
-        # Check if Monte Carlo is enabled with safe attribute access
-        monte_carlo_obj = getattr(self.config, "monte_carlo", {})
-        monte_carlo_dict = monte_carlo_obj.dict() if hasattr(monte_carlo_obj, 'dict') else (monte_carlo_obj if isinstance(monte_carlo_obj, dict) else {})
-        monte_carlo_enabled = monte_carlo_dict.get("enabled", False)
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
-        if not monte_carlo_enabled:
-            return
+        # Skip unless Monte Carlo is enabled
+        if not self.monte_carlo_enabled:
+            return breaches
 
         # Get performance metrics
         performance_metrics = metrics.get("performance_metrics", {})
         irr_distribution = performance_metrics.get("irr_distribution", {})
         irr_p5 = irr_distribution.get("p5", 0.0)
 
-        # Get hurdle rate from config with safe attribute access
-        hurdle_rate = getattr(self.config, "hurdle_rate", 0.08)  # 8%
-
-        # Calculate minimum acceptable IRR P5
-        min_irr_p5 = hurdle_rate - 0.025  # hurdle - 250 bp
+        # Get hurdle rate and minimum acceptable IRR P5
+        hurdle_rate = self.thresholds["hurdle_rate"]
+        min_irr_p5 = self.thresholds["min_irr_p5"]
 
         # Ensure irr_p5 is a numeric value, not a list
-        if isinstance(irr_p5, (list, tuple)):
-            irr_p5 = irr_p5[0] if irr_p5 else 0.0
-        elif not isinstance(irr_p5, (int, float)):
-            return
+        irr_p5, is_number = _as_number(irr_p5)
+        if not is_number:
+            return breaches
 
         if irr_p5 < min_irr_p5:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="IRR_P5_LOW",
                     severity=Severity.WARN,
@@ -1081,7 +1238,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_hurdle_clear_probability_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("HURDLE_CLEAR_PROB")
+    def _check_hurdle_clear_probability_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check hurdle clear probability guardrail.
 
@@ -1091,20 +1251,15 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "HURDLE_CLEAR_PROB" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("HURDLE_CLEAR_PROB")
-
-        # Check if Monte Carlo is enabled with safe attribute access
-        monte_carlo_obj = getattr(self.config, "monte_carlo", {})
-        monte_carlo_dict = monte_carlo_obj.dict() if hasattr(monte_carlo_obj, 'dict') else (monte_carlo_obj if isinstance(monte_carlo_obj, dict) else {})
-        monte_carlo_enabled = monte_carlo_dict.get("enabled", False)
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
-        if not monte_carlo_enabled:
-            return
+        # Skip unless Monte Carlo is enabled
+        if not self.monte_carlo_enabled:
+            return breaches
 
         # Get performance metrics
         performance_metrics = metrics.get("performance_metrics", {})
@@ -1112,19 +1267,18 @@ class GuardrailMonitor:
         probability = hurdle_clear_probability.get("value")
 
         if probability is None:
-            return
+            return breaches
 
         # Get min hurdle clear probability from config
-        min_hurdle_clear_prob = self.guardrail_config.get("min_hurdle_clear_prob", 0.7)  # 70%
+        min_hurdle_clear_prob = self.thresholds["min_hurdle_clear_prob"]
 
         # Ensure probability is a numeric value, not a list
-        if isinstance(probability, (list, tuple)):
-            probability = probability[0] if probability else 0.0
-        elif not isinstance(probability, (int, float)):
-            return
+        probability, is_number = _as_number(probability)
+        if not is_number:
+            return breaches
 
         if probability < min_hurdle_clear_prob:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="HURDLE_CLEAR_PROB",
                     severity=Severity.FAIL,
@@ -1136,7 +1290,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_schema_version_guardrail(self) -> None:
+        return breaches
+
+    @_check_once("INFO_SCHEMA_MISMATCH")
+    def _check_schema_version_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check schema version guardrail.
 
@@ -1145,24 +1302,22 @@ class GuardrailMonitor:
         Layer: Run
 
         Args:
-            None
-        """
-        # Skip if already checked
-        if "INFO_SCHEMA_MISMATCH" in self.checked_guardrails:
-            return
+            metrics: Simulation metrics
 
-        self.checked_guardrails.add("INFO_SCHEMA_MISMATCH")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
-        # Get schema versions with safe attribute access
-        config_schema_version = getattr(self.config, "schema_version", "1.0.0")
-        engine_schema_version = "1.0.0"  # This should be a constant defined elsewhere
+        # Get config schema version with safe attribute access
+        config_schema_version = getattr(self.config, "schema_version", _ENGINE_SCHEMA_VERSION)
 
-        if config_schema_version != engine_schema_version:
-            self.report.breaches.append(
+        if config_schema_version != _ENGINE_SCHEMA_VERSION:
+            breaches.append(
                 Breach(
                     code="INFO_SCHEMA_MISMATCH",
                     severity=Severity.INFO,
-                    message=f"Config schema version {config_schema_version} does not match engine schema version {engine_schema_version}",
+                    message=f"Config schema version {config_schema_version} does not match engine schema version {_ENGINE_SCHEMA_VERSION}",
                     value=None,
                     threshold=None,
                     unit=None,
@@ -1170,7 +1325,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_mc_paths_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("MC_LOW_PATHS")
+    def _check_mc_paths_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check Monte Carlo paths guardrail.
 
@@ -1180,36 +1338,30 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "MC_LOW_PATHS" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("MC_LOW_PATHS")
-
-        # Check if Monte Carlo is enabled with safe attribute access
-        monte_carlo_obj = getattr(self.config, "monte_carlo", {})
-        monte_carlo_dict = monte_carlo_obj.dict() if hasattr(monte_carlo_obj, 'dict') else (monte_carlo_obj if isinstance(monte_carlo_obj, dict) else {})
-        monte_carlo_enabled = monte_carlo_dict.get("enabled", False)
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
-        if not monte_carlo_enabled:
-            return
+        # Skip unless Monte Carlo is enabled
+        if not self.monte_carlo_enabled:
+            return breaches
 
         # Get Monte Carlo metrics
         monte_carlo_metrics = metrics.get("monte_carlo_metrics", {})
         inner_paths = monte_carlo_metrics.get("inner_paths", 0)
 
         # Get min paths from config
-        min_paths = self.guardrail_config.get("min_paths", 500)
+        min_paths = self.thresholds["min_paths"]
 
         # Ensure inner_paths is a numeric value, not a list
-        if isinstance(inner_paths, (list, tuple)):
-            inner_paths = inner_paths[0] if inner_paths else 0
-        elif not isinstance(inner_paths, (int, float)):
-            return
+        inner_paths, is_number = _as_number(inner_paths, default=0)
+        if not is_number:
+            return breaches
 
         if inner_paths < min_paths:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="MC_LOW_PATHS",
                     severity=Severity.WARN,
@@ -1221,7 +1373,10 @@ class GuardrailMonitor:
                 )
             )
 
-    def _check_seed_reproducibility_guardrail(self, metrics: Dict[str, Any]) -> None:
+        return breaches
+
+    @_check_once("SEED_REPRODUCIBILITY")
+    def _check_seed_reproducibility_guardrail(self, metrics: Dict[str, Any]) -> List[Breach]:
         """
         Check seed reproducibility guardrail.
 
@@ -1231,12 +1386,11 @@ class GuardrailMonitor:
 
         Args:
             metrics: Simulation metrics
-        """
-        # Skip if already checked
-        if "SEED_REPRODUCIBILITY" in self.checked_guardrails:
-            return
 
-        self.checked_guardrails.add("SEED_REPRODUCIBILITY")
+        Returns:
+            Breaches of the guardrail
+        """
+        breaches: List[Breach] = []
 
         # This is a placeholder for a more complex check that would compare
         # the results of multiple runs with the same seed to ensure reproducibility
@@ -1245,7 +1399,7 @@ class GuardrailMonitor:
         seed = getattr(self.config, "seed", None)
 
         if seed is None:
-            self.report.breaches.append(
+            breaches.append(
                 Breach(
                     code="SEED_REPRODUCIBILITY",
                     severity=Severity.INFO,
@@ -1255,4 +1409,6 @@ class GuardrailMonitor:
                     unit=None,
                     layer="Run",
                 )
-            )
\ No newline at end of file
+            )
+
+        return breaches
@@ -10,8 +10,11 @@ This module calculates risk metrics for the simulation, including:
 - Stress testing and scenario analysis
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass
 import numpy as np
+from scipy.stats import norm
 from typing import Dict, Any, List, Optional, Tuple, Union
 import structlog
 import time
@@ -29,6 +32,82 @@ from src.utils.metrics import increment_counter, observe_histogram, set_gauge
 # Set up logging
 logger = structlog.get_logger(__name__)
 
+# Zones that are always reported, in output order
+_ZONES = ("green", "orange", "red")
+
+
+@dataclass(slots=True)
+class PortfolioArrays:
+    """
+    Loan fields of the portfolio as arrays, one element per loan.
+
+    Attributes:
+        loan_ids: Loan IDs
+        zones: Zone names, indexed by zone_index
+        suburbs: Suburb names in order of first appearance, indexed by suburb_index
+        loan_amounts: Loan amounts
+        property_values: Property values
+        default_probabilities: Default probabilities from the loan or its suburb's TLS data
+        zone_index: Index of each loan's suburb zone in zones
+        suburb_index: Index of each loan's suburb in suburbs
+    """
+
+    loan_ids: List[Any]
+    zones: List[str]
+    suburbs: List[Any]
+    loan_amounts: np.ndarray
+    property_values: np.ndarray
+    default_probabilities: np.ndarray
+    zone_index: np.ndarray
+    suburb_index: np.ndarray
+
+
+def _safe_divide(numerators: np.ndarray, denominators: np.ndarray) -> np.ndarray:
+    """
+    Divide element-wise, with 0.0 where the denominator is not positive.
+
+    Args:
+        numerators: Numerators
+        denominators: Denominators
+
+    Returns:
+        Array of ratios
+    """
+    return np.divide(numerators, denominators, out=np.zeros_like(numerators), where=denominators > 0)
+
+
+# Standard normal z-scores for the analytic VaR confidence levels
+_Z_SCORE_95 = float(norm.ppf(0.95))
+_Z_SCORE_99 = float(norm.ppf(0.99))
+
+# Parameter ranges for sensitivity analysis
+_SENSITIVITY_RANGES = {
+    "interest_rate": np.linspace(0.01, 0.1, 10),  # 1% to 10%
+    "property_value_growth": np.linspace(-0.05, 0.15, 10),  # -5% to 15%
+    "default_rate": np.linspace(0.01, 0.2, 10),  # 1% to 20%
+    "prepayment_rate": np.linspace(0.0, 0.3, 10),  # 0% to 30%
+    "ltv_ratio": np.linspace(0.5, 0.9, 10),  # 50% to 90%
+    "leverage_ratio": np.linspace(0.0, 0.7, 10),  # 0% to 70%
+    "management_fee_rate": np.linspace(0.01, 0.03, 10),  # 1% to 3%
+    "carried_interest_rate": np.linspace(0.1, 0.3, 10),  # 10% to 30%
+    "hurdle_rate": np.linspace(0.05, 0.15, 10),  # 5% to 15%
+}
+_DEFAULT_SENSITIVITY_RANGE = np.linspace(0.0, 1.0, 10)
+
+# Sensitivity factors of IRR to each parameter
+_SENSITIVITY_FACTORS = {
+    "interest_rate": -5.0,  # 1% increase in interest rate reduces IRR by 5%
+    "property_value_growth": 2.0,  # 1% increase in property value growth increases IRR by 2%
+    "default_rate": -10.0,  # 1% increase in default rate reduces IRR by 10%
+    "prepayment_rate": -1.0,  # 1% increase in prepayment rate reduces IRR by 1%
+    "ltv_ratio": 1.0,  # 1% increase in LTV ratio increases IRR by 1%
+    "leverage_ratio": 1.5,  # 1% increase in leverage ratio increases IRR by 1.5%
+    "management_fee_rate": -20.0,  # 1% increase in management fee rate reduces IRR by 20%
+    "carried_interest_rate": -5.0,  # 1% increase in carried interest rate reduces IRR by 5%
+    "hurdle_rate": -2.0,  # 1% increase in hurdle rate reduces IRR by 2%
+}
+
+
 class RiskMetricsCalculator:
     """
     Calculator for risk metrics.
@@ -106,6 +185,19 @@ class RiskMetricsCalculator:
         self.scenario_analysis_results = {}
         self.visualization_data = {}
 
+        # Progress updates of the calculation stages, sent together when the calculation completes
+        self.progress_stages: List[Dict[str, Any]] = []
+
+        # Loan fields of the portfolio as arrays, see _get_portfolio_arrays
+        self._portfolio_arrays: Optional[PortfolioArrays] = None
+
+        # Returns and their statistics, computed once per calculation
+        self._returns: Optional[List[float]] = None
+        self._returns_statistics: Optional[Tuple[float, float, float]] = None
+
+        # Monte Carlo returns distribution as an array, see _get_returns_distribution
+        self._returns_distribution: Optional[np.ndarray] = None
+
     def _extract_existing_metrics(self) -> Dict[str, Any]:
         """
         Extract existing metrics from the simulation context.
@@ -163,14 +255,18 @@ class RiskMetricsCalculator:
             # Add price path metrics (using average across zones)
             zone_stats = price_path_stats.get("zone_stats", {})
             if zone_stats:
-                volatility_values = [stats.get("volatility", 0) for stats in zone_stats.values()]
-                sharpe_values = [stats.get("sharpe_ratio", 0) for stats in zone_stats.values()]
-                max_drawdown_values = [stats.get("max_drawdown", 0) for stats in zone_stats.values()]
-
+                # Sum the zone statistics in a single pass
+                volatility_sum = sharpe_sum = max_drawdown_sum = 0.0
+                for stats in zone_stats.values():
+                    volatility_sum += stats.get("volatility", 0)
+                    sharpe_sum += stats.get("sharpe_ratio", 0)
+                    max_drawdown_sum += stats.get("max_drawdown", 0)
+
+                zone_count = len(zone_stats)
                 metrics.update({
-                    "price_volatility": np.mean(volatility_values) if volatility_values else None,
-                    "price_sharpe_ratio": np.mean(sharpe_values) if sharpe_values else None,
-                    "price_max_drawdown": np.mean(max_drawdown_values) if max_drawdown_values else None,
+                    "price_volatility": volatility_sum / zone_count,
+                    "price_sharpe_ratio": sharpe_sum / zone_count,
+                    "price_max_drawdown": max_drawdown_sum / zone_count,
                 })
 
         # Extract reinvestment metrics with safe access
@@ -201,17 +297,20 @@ class RiskMetricsCalculator:
         """
         logger.info("Calculating risk metrics")
 
-        # Send progress update
-        self.websocket_manager.send_progress(
-            simulation_id=self.context.run_id,
-            module="risk_metrics",
-            progress=10.0,
-            message="Calculating risk metrics",
-        )
+        # Record progress update
+        self.progress_stages = []
+        self._record_progress(10.0, "Calculating risk metrics")
 
         # Start with existing metrics
         self.risk_metrics = self.existing_metrics.copy()
 
+        # Convert the portfolio, extract the returns and convert the Monte Carlo returns
+        # distribution again on the next use
+        self._portfolio_arrays = None
+        self._returns = None
+        self._returns_statistics = None
+        self._returns_distribution = None
+
         # Calculate market/price metrics
         self._calculate_market_price_metrics()
 
@@ -230,46 +329,26 @@ class RiskMetricsCalculator:
         # Calculate performance/return-risk metrics
         self._calculate_performance_metrics()
 
-        # Send progress update
-        self.websocket_manager.send_progress(
-            simulation_id=self.context.run_id,
-            module="risk_metrics",
-            progress=50.0,
-            message="Risk metrics calculated",
-        )
+        # Record progress update
+        self._record_progress(50.0, "Risk metrics calculated")
 
         # Run stress tests
         self._run_stress_tests()
 
-        # Send progress update
-        self.websocket_manager.send_progress(
-            simulation_id=self.context.run_id,
-            module="risk_metrics",
-            progress=70.0,
-            message="Stress tests completed",
-        )
+        # Record progress update
+        self._record_progress(70.0, "Stress tests completed")
 
         # Run scenario analysis
         self._run_scenario_analysis()
 
-        # Send progress update
-        self.websocket_manager.send_progress(
-            simulation_id=self.context.run_id,
-            module="risk_metrics",
-            progress=90.0,
-            message="Scenario analysis completed",
-        )
+        # Record progress update
+        self._record_progress(90.0, "Scenario analysis completed")
 
         # Generate visualization data
         self._generate_visualization_data()
 
-        # Send progress update
-        self.websocket_manager.send_progress(
-            simulation_id=self.context.run_id,
-            module="risk_metrics",
-            progress=100.0,
-            message="Risk metrics calculation completed",
-        )
+        # Send the progress updates
+        self._send_progress()
 
         # Store results in context
         self.context.metrics = {
@@ -294,6 +373,44 @@ class RiskMetricsCalculator:
 
         return self.context.metrics
 
+    def _record_progress(self, progress: float, message: str) -> None:
+        """
+        Record a progress update for a calculation stage.
+
+        The stage updates are sent in a single frame when the calculation completes
+        rather than as one WebSocket message each.
+
+        Args:
+            progress: Progress percentage (0-100)
+            message: Progress message
+        """
+        self.progress_stages.append({
+            "module": "risk_metrics",
+            "progress": progress,
+            "message": message,
+        })
+
+    def _send_progress(self) -> None:
+        """
+        Send the completed progress update with the recorded stages.
+
+        The calculation is synchronous, so the update is handed to the WebSocket
+        manager to send in the background instead of being awaited. Without a
+        running loop there is no connection to deliver it to, and it is skipped.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self.websocket_manager.send_in_background(self.websocket_manager.send_progress(
+            simulation_id=self.context.run_id,
+            module="risk_metrics",
+            progress=100.0,
+            message="Risk metrics calculation completed",
+            data={"stages": self.progress_stages},
+        ))
+
     def _calculate_market_price_metrics(self) -> None:
         """
         Calculate market/price metrics.
@@ -532,16 +649,15 @@ class RiskMetricsCalculator:
             mc_results = self.context.monte_carlo_results
             if mc_results and "returns_distribution" in mc_results:
                 # Calculate hurdle-clear probability from Monte Carlo results
-                returns_distribution = mc_results.get("returns_distribution", [])
-                if returns_distribution:
-                    # Count returns above hurdle rate
-                    above_hurdle = sum(1 for r in returns_distribution if r >= hurdle_rate)
-                    probability = above_hurdle / len(returns_distribution)
+                returns_distribution = self._get_returns_distribution()
+                if returns_distribution.size:
+                    # Share of returns at or above the hurdle rate
+                    probability = float(np.mean(returns_distribution >= hurdle_rate))
 
                     return {
                         "value": probability,
                         "hurdle_rate": hurdle_rate,
-                        "mc_simulations": len(returns_distribution)
+                        "mc_simulations": returns_distribution.size
                     }
 
         # If Monte Carlo is not available or no distribution data
@@ -552,6 +668,25 @@ class RiskMetricsCalculator:
             "note": "Hurdle-clear probability requires Monte Carlo simulation"
         }
 
+    def _get_returns_distribution(self) -> np.ndarray:
+        """
+        Get the Monte Carlo returns distribution, converted to an array once per calculation.
+
+        Returns:
+            Array of returns (empty if no distribution is available)
+        """
+        if self._returns_distribution is None:
+            # Get returns distribution from Monte Carlo results with safe access
+            mc_results = getattr(self.context, "monte_carlo_results", None)
+            if isinstance(mc_results, dict):
+                returns_distribution = mc_results.get("returns_distribution", [])
+            else:
+                returns_distribution = []
+
+            self._returns_distribution = np.asarray(returns_distribution, dtype=np.float64)
+
+        return self._returns_distribution
+
     def _calculate_volatility_metrics(self) -> None:
         """
         Calculate volatility-based metrics.
@@ -565,11 +700,13 @@ class RiskMetricsCalculator:
             logger.warning("No returns available for volatility calculation")
             return
 
+        _, volatility, downside_deviation = self._get_returns_statistics()
+
         # Calculate volatility (standard deviation of returns)
-        self.risk_metrics["volatility"] = np.std(returns, ddof=1) if len(returns) > 1 else 0
+        self.risk_metrics["volatility"] = volatility
 
         # Calculate downside deviation
-        self.risk_metrics["downside_deviation"] = self._calculate_downside_deviation(returns)
+        self.risk_metrics["downside_deviation"] = downside_deviation
 
     def _calculate_alpha_beta_metrics(self) -> None:
         """
@@ -625,41 +762,35 @@ class RiskMetricsCalculator:
         """
         Calculate VaR and CVaR using Monte Carlo simulation results.
         """
-        # Get returns distribution from Monte Carlo results with safe access
-        mc_results = self.context.monte_carlo_results
-        if isinstance(mc_results, dict):
-            returns_distribution = mc_results.get("returns_distribution", [])
-        else:
-            returns_distribution = []
+        # Get returns distribution from Monte Carlo results
+        returns = self._get_returns_distribution()
+        n = returns.size
 
-        if not returns_distribution:
+        if not n:
             logger.warning("No returns distribution available for VaR/CVaR calculation")
             # Fall back to analytic approximation
             self._calculate_var_cvar_analytic()
             return
 
-        # Sort returns for percentile calculation
-        sorted_returns = sorted(returns_distribution)
-        n = len(sorted_returns)
+        # Partition the returns around both percentiles at once rather than sorting them
+        var_95_index = int(n * 0.05)
+        var_99_index = int(n * 0.01)
+        partitioned = np.partition(returns, [var_99_index, var_95_index])
 
         # Calculate VaR 95% (5th percentile of negative returns)
-        var_95_index = int(n * 0.05)
-        var_95 = -sorted_returns[var_95_index]
+        var_95 = -float(partitioned[var_95_index])
         self.risk_metrics["var_95"] = var_95
 
         # Calculate VaR 99% (1st percentile of negative returns)
-        var_99_index = int(n * 0.01)
-        var_99 = -sorted_returns[var_99_index]
+        var_99 = -float(partitioned[var_99_index])
         self.risk_metrics["var_99"] = var_99
 
-        # Calculate CVaR 95% (average of returns below 5th percentile)
-        cvar_95_values = sorted_returns[:var_95_index+1]
-        cvar_95 = -np.mean(cvar_95_values) if cvar_95_values else var_95
+        # Calculate CVaR 95% (average of returns up to the 5th percentile)
+        cvar_95 = -float(partitioned[:var_95_index+1].mean())
         self.risk_metrics["cvar_95"] = cvar_95
 
-        # Calculate CVaR 99% (average of returns below 1st percentile)
-        cvar_99_values = sorted_returns[:var_99_index+1]
-        cvar_99 = -np.mean(cvar_99_values) if cvar_99_values else var_99
+        # Calculate CVaR 99% (average of returns up to the 1st percentile)
+        cvar_99 = -float(partitioned[:var_99_index+1].mean())
         self.risk_metrics["cvar_99"] = cvar_99
 
     def _calculate_var_cvar_analytic(self) -> None:
@@ -680,19 +811,15 @@ class RiskMetricsCalculator:
         # Calculate VaR at different confidence levels
         # For deterministic simulation, use analytic log-normal VaR: VaR = N⁻¹(0.99)*σ*√T – μT
         volatility = self.risk_metrics.get("volatility", 0.0)
-        mean_return = np.mean(returns) if returns else 0.0
+        mean_return, _, _ = self._get_returns_statistics()
         time_horizon = 1.0  # 1 year
 
-        from scipy import stats
-
         # Calculate VaR 95%
-        z_score_95 = stats.norm.ppf(0.95)
-        var_95 = z_score_95 * volatility * np.sqrt(time_horizon) - mean_return * time_horizon
+        var_95 = _Z_SCORE_95 * volatility * np.sqrt(time_horizon) - mean_return * time_horizon
         self.risk_metrics["var_95"] = var_95
 
         # Calculate VaR 99%
-        z_score_99 = stats.norm.ppf(0.99)
-        var_99 = z_score_99 * volatility * np.sqrt(time_horizon) - mean_return * time_horizon
+        var_99 = _Z_SCORE_99 * volatility * np.sqrt(time_horizon) - mean_return * time_horizon
         self.risk_metrics["var_99"] = var_99
 
         # For CVaR, note that it requires MC simulation
@@ -756,16 +883,22 @@ class RiskMetricsCalculator:
             # Define parameter range
             parameter_range = self._get_parameter_range(parameter)
 
-            # Calculate metrics for each parameter value
-            sensitivity_results = []
-            for param_value in parameter_range:
-                metrics = self._calculate_metrics_with_parameter(parameter, param_value)
-                sensitivity_results.append({
+            # Calculate metrics for all parameter values at once
+            metrics = self._calculate_metrics_with_parameter(parameter, parameter_range)
+            sensitivity_results = [
+                {
                     "parameter_value": param_value,
-                    "irr": metrics.get("irr"),
-                    "equity_multiple": metrics.get("equity_multiple"),
-                    "roi": metrics.get("roi")
-                })
+                    "irr": irr_value,
+                    "equity_multiple": equity_multiple_value,
+                    "roi": roi_value
+                }
+                for param_value, irr_value, equity_multiple_value, roi_value in zip(
+                    parameter_range.tolist(),
+                    metrics["irr"].tolist(),
+                    metrics["equity_multiple"].tolist(),
+                    metrics["roi"].tolist(),
+                )
+            ]
 
             # Store sensitivity analysis results
             self.scenario_analysis_results[parameter] = sensitivity_results
@@ -894,11 +1027,14 @@ class RiskMetricsCalculator:
 
     def _extract_returns(self) -> List[float]:
         """
-        Extract returns from cashflows.
+        Extract returns from cashflows, once per calculation.
 
         Returns:
             List of returns
         """
+        if self._returns is not None:
+            return self._returns
+
         returns = []
 
         # Try to get returns from fund-level cashflows
@@ -936,8 +1072,30 @@ class RiskMetricsCalculator:
                             period_return = (curr_price - prev_price) / prev_price
                             returns.append(period_return)
 
+        self._returns = returns
         return returns
 
+    def _get_returns_statistics(self) -> Tuple[float, float, float]:
+        """
+        Get the statistics of the returns, computed once per calculation.
+
+        Returns:
+            Tuple of (mean, standard deviation, downside deviation), all 0.0 without returns
+        """
+        if self._returns_statistics is None:
+            returns = self._extract_returns()
+            if returns:
+                returns_array = np.asarray(returns, dtype=np.float64)
+                self._returns_statistics = (
+                    float(returns_array.mean()),
+                    float(returns_array.std(ddof=1)) if returns_array.size > 1 else 0.0,
+                    float(self._calculate_downside_deviation(returns)),
+                )
+            else:
+                self._returns_statistics = (0.0, 0.0, 0.0)
+
+        return self._returns_statistics
+
     def _extract_cumulative_returns(self) -> List[float]:
         """
         Extract cumulative returns.
@@ -1206,24 +1364,21 @@ class RiskMetricsCalculator:
 
         return weighted_idiosyncratic / total_value
 
-    def _calculate_current_ltv(self) -> Dict[str, Any]:
+    def _get_portfolio_arrays(self) -> PortfolioArrays:
         """
-        Calculate current Loan-to-Value (LTV) ratio.
+        Get the loan fields of the portfolio as arrays, converted once per calculation.
+
+        Each suburb's TLS data is looked up once.
 
         Returns:
-            Dictionary with current LTV metrics
+            Portfolio arrays (empty if there are no loans)
         """
+        if self._portfolio_arrays is not None:
+            return self._portfolio_arrays
+
         # Get portfolio
         portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
 
-        if not portfolio:
-            return {
-                "portfolio_ltv": None,
-                "loan_ltvs": {},
-                "zone_ltvs": {},
-                "suburb_ltvs": {}
-            }
-
         # Get loans with safe access
         if isinstance(portfolio, dict):
             loans = portfolio.get("loans", [])
@@ -1232,80 +1387,110 @@ class RiskMetricsCalculator:
         else:
             loans = []
 
-        if not loans:
-            return {
-                "portfolio_ltv": None,
-                "loan_ltvs": {},
-                "zone_ltvs": {},
-                "suburb_ltvs": {}
-            }
-
-        # Calculate LTV for each loan
-        loan_ltvs = {}
-        zone_values = {"green": 0.0, "orange": 0.0, "red": 0.0}
-        zone_loans = {"green": 0.0, "orange": 0.0, "red": 0.0}
-        suburb_values = {}
-        suburb_loans = {}
-        total_value = 0.0
-        total_loan = 0.0
+        loan_ids = []
+        loan_amounts = []
+        property_values = []
+        default_probabilities = []
+        zone_index = []
+        suburb_index = []
+        zone_positions = {zone: i for i, zone in enumerate(_ZONES)}
+        suburb_positions: Dict[Any, int] = {}
+        suburb_data_by_suburb: Dict[Any, Dict[str, Any]] = {}
 
         for loan in loans:
-            loan_id = loan.get("loan_id")
             suburb = loan.get("suburb")
-            loan_amount = loan.get("loan_amount", 0.0)
-            property_value = loan.get("property_value", 0.0)
 
-            # Calculate loan LTV
-            if property_value > 0:
-                ltv = loan_amount / property_value
-            else:
-                ltv = 0.0
-
-            loan_ltvs[loan_id] = ltv
-
-            # Get suburb zone from TLS data
+            # Get default probability from loan or TLS data, and suburb zone from TLS data
+            default_prob = loan.get("default_probability", 0.0)
             suburb_zone = "green"  # Default to green zone
 
             if self.tls_manager and suburb:
-                suburb_data = self.tls_manager.get_suburb_data(suburb)
+                suburb_data = suburb_data_by_suburb.get(suburb)
+                if suburb_data is None:
+                    suburb_data = self.tls_manager.get_suburb_data(suburb)
+                    suburb_data_by_suburb[suburb] = suburb_data
+
                 suburb_zone = suburb_data.get("zone", "green")
+                if default_prob == 0.0:
+                    default_prob = suburb_data.get("default_probability", 0.02)
+
+            loan_ids.append(loan.get("loan_id"))
+            loan_amounts.append(loan.get("loan_amount", 0.0))
+            property_values.append(loan.get("property_value", 0.0))
+            default_probabilities.append(default_prob)
+            zone_index.append(zone_positions.setdefault(suburb_zone, len(zone_positions)))
+            suburb_index.append(suburb_positions.setdefault(suburb, len(suburb_positions)))
+
+        self._portfolio_arrays = PortfolioArrays(
+            loan_ids=loan_ids,
+            zones=list(zone_positions),
+            suburbs=list(suburb_positions),
+            loan_amounts=np.array(loan_amounts, dtype=np.float64),
+            property_values=np.array(property_values, dtype=np.float64),
+            default_probabilities=np.array(default_probabilities, dtype=np.float64),
+            zone_index=np.array(zone_index, dtype=np.intp),
+            suburb_index=np.array(suburb_index, dtype=np.intp),
+        )
+        return self._portfolio_arrays
 
-            # Update zone totals
-            zone_values[suburb_zone] += property_value
-            zone_loans[suburb_zone] += loan_amount
+    def _calculate_ltvs(
+        self, arrays: PortfolioArrays, value_factor: float
+    ) -> Tuple[float, Dict[Any, float], Dict[str, float], Dict[Any, float]]:
+        """
+        Calculate LTV ratios at the loan, zone, suburb and portfolio level.
 
-            # Update suburb totals
-            if suburb not in suburb_values:
-                suburb_values[suburb] = 0.0
-                suburb_loans[suburb] = 0.0
+        Args:
+            arrays: Portfolio arrays
+            value_factor: Factor applied to the property values
 
-            suburb_values[suburb] += property_value
-            suburb_loans[suburb] += loan_amount
+        Returns:
+            Tuple of (portfolio LTV, loan LTVs, zone LTVs, suburb LTVs)
+        """
+        loan_amounts = arrays.loan_amounts
+        property_values = arrays.property_values * value_factor
 
-            # Update portfolio totals
-            total_value += property_value
-            total_loan += loan_amount
+        # Calculate LTV for each loan
+        loan_ltvs = _safe_divide(loan_amounts, property_values)
 
         # Calculate zone LTVs
-        zone_ltvs = {}
-
-        for zone in zone_values:
-            if zone_values[zone] > 0:
-                zone_ltvs[zone] = zone_loans[zone] / zone_values[zone]
-            else:
-                zone_ltvs[zone] = 0.0
+        zone_values = np.bincount(arrays.zone_index, weights=property_values, minlength=len(arrays.zones))
+        zone_loans = np.bincount(arrays.zone_index, weights=loan_amounts, minlength=len(arrays.zones))
+        zone_ltvs = _safe_divide(zone_loans, zone_values)
 
         # Calculate suburb LTVs
-        suburb_ltvs = {}
-
-        for suburb in suburb_values:
-            if suburb_values[suburb] > 0:
-                suburb_ltvs[suburb] = suburb_loans[suburb] / suburb_values[suburb]
-            else:
-                suburb_ltvs[suburb] = 0.0
+        suburb_values = np.bincount(arrays.suburb_index, weights=property_values, minlength=len(arrays.suburbs))
+        suburb_loans = np.bincount(arrays.suburb_index, weights=loan_amounts, minlength=len(arrays.suburbs))
+        suburb_ltvs = _safe_divide(suburb_loans, suburb_values)
 
         # Calculate portfolio LTV
-        portfolio_ltv = total_loan / total_value if total_value > 0 else 0.0
+        total_value = float(zone_values.sum())
+        portfolio_ltv = float(zone_loans.sum()) / total_value if total_value > 0 else 0.0
+
+        return (
+            portfolio_ltv,
+            dict(zip(arrays.loan_ids, loan_ltvs.tolist())),
+            dict(zip(arrays.zones, zone_ltvs.tolist())),
+            dict(zip(arrays.suburbs, suburb_ltvs.tolist())),
+        )
+
+    def _calculate_current_ltv(self) -> Dict[str, Any]:
+        """
+        Calculate current Loan-to-Value (LTV) ratio.
+
+        Returns:
+            Dictionary with current LTV metrics
+        """
+        arrays = self._get_portfolio_arrays()
+
+        if not arrays.loan_ids:
+            return {
+                "portfolio_ltv": None,
+                "loan_ltvs": {},
+                "zone_ltvs": {},
+                "suburb_ltvs": {}
+            }
+
+        portfolio_ltv, loan_ltvs, zone_ltvs, suburb_ltvs = self._calculate_ltvs(arrays, 1.0)
 
         return {
             "portfolio_ltv": portfolio_ltv,
@@ -1321,21 +1506,9 @@ class RiskMetricsCalculator:
         Returns:
             Dictionary with stress LTV metrics
         """
-        # Get portfolio
-        portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
+        arrays = self._get_portfolio_arrays()
 
-        if not portfolio:
-            return {
-                "portfolio_stress_ltv": None,
-                "loan_stress_ltvs": {},
-                "zone_stress_ltvs": {},
-                "suburb_stress_ltvs": {}
-            }
-
-        # Get loans
-        loans = portfolio.get("loans", [])
-
-        if not loans:
+        if not arrays.loan_ids:
             return {
                 "portfolio_stress_ltv": None,
                 "loan_stress_ltvs": {},
@@ -1346,75 +1519,9 @@ class RiskMetricsCalculator:
         # Apply -20% price shock
         price_shock = -0.2
 
-        # Calculate stress LTV for each loan
-        loan_stress_ltvs = {}
-        zone_values = {"green": 0.0, "orange": 0.0, "red": 0.0}
-        zone_loans = {"green": 0.0, "orange": 0.0, "red": 0.0}
-        suburb_values = {}
-        suburb_loans = {}
-        total_value = 0.0
-        total_loan = 0.0
-
-        for loan in loans:
-            loan_id = loan.get("loan_id")
-            suburb = loan.get("suburb")
-            loan_amount = loan.get("loan_amount", 0.0)
-            property_value = loan.get("property_value", 0.0)
-
-            # Apply price shock
-            stressed_value = property_value * (1 + price_shock)
-
-            # Calculate loan stress LTV
-            if stressed_value > 0:
-                stress_ltv = loan_amount / stressed_value
-            else:
-                stress_ltv = 0.0
-
-            loan_stress_ltvs[loan_id] = stress_ltv
-
-            # Get suburb zone from TLS data
-            suburb_zone = "green"  # Default to green zone
-
-            if self.tls_manager and suburb:
-                suburb_data = self.tls_manager.get_suburb_data(suburb)
-                suburb_zone = suburb_data.get("zone", "green")
-
-            # Update zone totals
-            zone_values[suburb_zone] += stressed_value
-            zone_loans[suburb_zone] += loan_amount
-
-            # Update suburb totals
-            if suburb not in suburb_values:
-                suburb_values[suburb] = 0.0
-                suburb_loans[suburb] = 0.0
-
-            suburb_values[suburb] += stressed_value
-            suburb_loans[suburb] += loan_amount
-
-            # Update portfolio totals
-            total_value += stressed_value
-            total_loan += loan_amount
-
-        # Calculate zone stress LTVs
-        zone_stress_ltvs = {}
-
-        for zone in zone_values:
-            if zone_values[zone] > 0:
-                zone_stress_ltvs[zone] = zone_loans[zone] / zone_values[zone]
-            else:
-                zone_stress_ltvs[zone] = 0.0
-
-        # Calculate suburb stress LTVs
-        suburb_stress_ltvs = {}
-
-        for suburb in suburb_values:
-            if suburb_values[suburb] > 0:
-                suburb_stress_ltvs[suburb] = suburb_loans[suburb] / suburb_values[suburb]
-            else:
-                suburb_stress_ltvs[suburb] = 0.0
-
-        # Calculate portfolio stress LTV
-        portfolio_stress_ltv = total_loan / total_value if total_value > 0 else 0.0
+        portfolio_stress_ltv, loan_stress_ltvs, zone_stress_ltvs, suburb_stress_ltvs = self._calculate_ltvs(
+            arrays, 1 + price_shock
+        )
 
         return {
             "portfolio_stress_ltv": portfolio_stress_ltv,
@@ -1430,84 +1537,33 @@ class RiskMetricsCalculator:
         Returns:
             Dictionary with default probabilities
         """
-        # Get portfolio
-        portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
-
-        if not portfolio:
-            return {
-                "loan_default_probs": {},
-                "zone_default_probs": {},
-                "suburb_default_probs": {}
-            }
-
-        # Get loans with safe access
-        if isinstance(portfolio, dict):
-            loans = portfolio.get("loans", [])
-        elif isinstance(portfolio, list):
-            loans = portfolio  # Portfolio is already a list of loans
-        else:
-            loans = []
+        arrays = self._get_portfolio_arrays()
 
-        if not loans:
+        if not arrays.loan_ids:
             return {
                 "loan_default_probs": {},
                 "zone_default_probs": {},
                 "suburb_default_probs": {}
             }
 
-        # Get default probabilities for each loan
-        loan_default_probs = {}
-        zone_default_probs = {"green": 0.0, "orange": 0.0, "red": 0.0}
-        zone_loan_counts = {"green": 0, "orange": 0, "red": 0}
-        suburb_default_probs = {}
-        suburb_loan_counts = {}
-
-        for loan in loans:
-            loan_id = loan.get("loan_id")
-            suburb = loan.get("suburb")
-
-            # Get default probability from loan or TLS data
-            default_prob = loan.get("default_probability", 0.0)
-
-            if default_prob == 0.0 and self.tls_manager and suburb:
-                suburb_data = self.tls_manager.get_suburb_data(suburb)
-                default_prob = suburb_data.get("default_probability", 0.02)
-
-            loan_default_probs[loan_id] = default_prob
-
-            # Get suburb zone from TLS data
-            suburb_zone = "green"  # Default to green zone
-
-            if self.tls_manager and suburb:
-                suburb_data = self.tls_manager.get_suburb_data(suburb)
-                suburb_zone = suburb_data.get("zone", "green")
-
-            # Update zone totals
-            zone_default_probs[suburb_zone] += default_prob
-            zone_loan_counts[suburb_zone] += 1
-
-            # Update suburb totals
-            if suburb not in suburb_default_probs:
-                suburb_default_probs[suburb] = 0.0
-                suburb_loan_counts[suburb] = 0
-
-            suburb_default_probs[suburb] += default_prob
-            suburb_loan_counts[suburb] += 1
+        default_probabilities = arrays.default_probabilities
 
         # Calculate average default probability by zone
-        for zone in zone_default_probs:
-            if zone_loan_counts[zone] > 0:
-                zone_default_probs[zone] /= zone_loan_counts[zone]
+        zone_default_probs = _safe_divide(
+            np.bincount(arrays.zone_index, weights=default_probabilities, minlength=len(arrays.zones)),
+            np.bincount(arrays.zone_index, minlength=len(arrays.zones)).astype(np.float64),
+        )
 
         # Calculate average default probability by suburb
-        for suburb in suburb_default_probs:
-            if suburb_loan_counts[suburb] > 0:
-                suburb_default_probs[suburb] /= suburb_loan_counts[suburb]
+        suburb_default_probs = (
+            np.bincount(arrays.suburb_index, weights=default_probabilities, minlength=len(arrays.suburbs))
+            / np.bincount(arrays.suburb_index, minlength=len(arrays.suburbs))
+        )
 
         return {
-            "loan_default_probs": loan_default_probs,
-            "zone_default_probs": zone_default_probs,
-            "suburb_default_probs": suburb_default_probs
+            "loan_default_probs": dict(zip(arrays.loan_ids, default_probabilities.tolist())),
+            "zone_default_probs": dict(zip(arrays.zones, zone_default_probs.tolist())),
+            "suburb_default_probs": dict(zip(arrays.suburbs, suburb_default_probs.tolist()))
         }
 
     def _calculate_portfolio_default_rate(self) -> float:
@@ -1517,45 +1573,15 @@ class RiskMetricsCalculator:
         Returns:
             Portfolio default rate
         """
-        # Get portfolio
-        portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
-
-        if not portfolio:
-            return 0.0
-
-        # Get loans with safe access
-        if isinstance(portfolio, dict):
-            loans = portfolio.get("loans", [])
-        elif isinstance(portfolio, list):
-            loans = portfolio  # Portfolio is already a list of loans
-        else:
-            loans = []
-
-        if not loans:
-            return 0.0
+        arrays = self._get_portfolio_arrays()
 
         # Calculate exposure-weighted default rate
-        total_exposure = 0.0
-        weighted_default_rate = 0.0
-
-        for loan in loans:
-            loan_amount = loan.get("loan_amount", 0.0)
-            suburb = loan.get("suburb")
-
-            # Get default probability from loan or TLS data
-            default_prob = loan.get("default_probability", 0.0)
-
-            if default_prob == 0.0 and self.tls_manager and suburb:
-                suburb_data = self.tls_manager.get_suburb_data(suburb)
-                default_prob = suburb_data.get("default_probability", 0.02)
-
-            weighted_default_rate += loan_amount * default_prob
-            total_exposure += loan_amount
+        total_exposure = float(arrays.loan_amounts.sum())
 
         if total_exposure == 0:
             return 0.0
 
-        return weighted_default_rate / total_exposure
+        return float(arrays.loan_amounts @ arrays.default_probabilities) / total_exposure
 
     def _get_liquidity_score(self) -> Dict[str, Any]:
         """
@@ -2152,47 +2178,20 @@ class RiskMetricsCalculator:
         Returns:
             Dictionary of zone exposure percentages
         """
-        # Get portfolio
-        portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
-
-        if not portfolio:
-            return {"green": 0.0, "orange": 0.0, "red": 0.0}
-
-        # Get loans with safe access
-        if isinstance(portfolio, dict):
-            loans = portfolio.get("loans", [])
-        elif isinstance(portfolio, list):
-            loans = portfolio  # Portfolio is already a list of loans
-        else:
-            loans = []
+        arrays = self._get_portfolio_arrays()
 
-        if not loans:
+        if not arrays.loan_ids:
             return {"green": 0.0, "orange": 0.0, "red": 0.0}
 
         # Calculate zone exposure
-        zone_exposure = {"green": 0.0, "orange": 0.0, "red": 0.0}
-        total_exposure = 0.0
-
-        for loan in loans:
-            suburb = loan.get("suburb")
-            loan_amount = loan.get("loan_amount", 0.0)
-
-            # Get suburb zone from TLS data
-            suburb_zone = "green"  # Default to green zone
-
-            if self.tls_manager and suburb:
-                suburb_data = self.tls_manager.get_suburb_data(suburb)
-                suburb_zone = suburb_data.get("zone", "green")
-
-            zone_exposure[suburb_zone] += loan_amount
-            total_exposure += loan_amount
+        zone_exposure = np.bincount(arrays.zone_index, weights=arrays.loan_amounts, minlength=len(arrays.zones))
+        total_exposure = zone_exposure.sum()
 
         # Calculate percentages
         if total_exposure > 0:
-            for zone in zone_exposure:
-                zone_exposure[zone] /= total_exposure
+            zone_exposure /= total_exposure
 
-        return zone_exposure
+        return dict(zip(arrays.zones, zone_exposure.tolist()))
 
     def _calculate_suburb_exposure(self) -> Dict[str, Any]:
         """
@@ -2201,25 +2200,9 @@ class RiskMetricsCalculator:
         Returns:
             Dictionary of suburb exposure metrics
         """
-        # Get portfolio
-        portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
+        arrays = self._get_portfolio_arrays()
 
-        if not portfolio:
-            return {
-                "top_suburbs": [],
-                "max_suburb_exposure": 0.0,
-                "suburb_exposure_cap": 0.0
-            }
-
-        # Get loans with safe access
-        if isinstance(portfolio, dict):
-            loans = portfolio.get("loans", [])
-        elif isinstance(portfolio, list):
-            loans = portfolio  # Portfolio is already a list of loans
-        else:
-            loans = []
-
-        if not loans:
+        if not arrays.loan_ids:
             return {
                 "top_suburbs": [],
                 "max_suburb_exposure": 0.0,
@@ -2227,35 +2210,19 @@ class RiskMetricsCalculator:
             }
 
         # Calculate suburb exposure
-        suburb_exposure = {}
-        total_exposure = 0.0
+        suburb_exposure = np.bincount(arrays.suburb_index, weights=arrays.loan_amounts, minlength=len(arrays.suburbs))
+        total_exposure = suburb_exposure.sum()
 
-        for loan in loans:
-            suburb = loan.get("suburb")
-            loan_amount = loan.get("loan_amount", 0.0)
-
-            if suburb not in suburb_exposure:
-                suburb_exposure[suburb] = 0.0
-
-            suburb_exposure[suburb] += loan_amount
-            total_exposure += loan_amount
-
-        # Calculate percentages
-        suburb_exposure_pct = {}
+        # Get top 10 suburbs by exposure percentage, keeping the order of first appearance for ties
+        top_suburbs = []
 
         if total_exposure > 0:
-            for suburb in suburb_exposure:
-                suburb_exposure_pct[suburb] = suburb_exposure[suburb] / total_exposure
-
-        # Get top suburbs
-        top_suburbs = sorted(
-            [
-                {"suburb": suburb, "exposure": exposure}
-                for suburb, exposure in suburb_exposure_pct.items()
-            ],
-            key=lambda x: x["exposure"],
-            reverse=True
-        )
+            suburb_exposure_pct = suburb_exposure / total_exposure
+            top_indices = np.argsort(-suburb_exposure_pct, kind="stable")[:10]
+            top_suburbs = [
+                {"suburb": arrays.suburbs[i], "exposure": exposure}
+                for i, exposure in zip(top_indices.tolist(), suburb_exposure_pct[top_indices].tolist())
+            ]
 
         # Get maximum suburb exposure
         max_suburb_exposure = top_suburbs[0]["exposure"] if top_suburbs else 0.0
@@ -2264,7 +2231,7 @@ class RiskMetricsCalculator:
         suburb_exposure_cap = getattr(self.config, "suburb_exposure_cap", 0.2)
 
         return {
-            "top_suburbs": top_suburbs[:10],  # Top 10 suburbs
+            "top_suburbs": top_suburbs,
             "max_suburb_exposure": max_suburb_exposure,
             "suburb_exposure_cap": suburb_exposure_cap
         }
@@ -2276,25 +2243,9 @@ class RiskMetricsCalculator:
         Returns:
             Dictionary of single loan exposure metrics
         """
-        # Get portfolio
-        portfolio = self.context.portfolio if hasattr(self.context, "portfolio") else None
+        arrays = self._get_portfolio_arrays()
 
-        if not portfolio:
-            return {
-                "top_loans": [],
-                "max_loan_exposure": 0.0,
-                "loan_exposure_cap": 0.0
-            }
-
-        # Get loans with safe access
-        if isinstance(portfolio, dict):
-            loans = portfolio.get("loans", [])
-        elif isinstance(portfolio, list):
-            loans = portfolio  # Portfolio is already a list of loans
-        else:
-            loans = []
-
-        if not loans:
+        if not arrays.loan_ids:
             return {
                 "top_loans": [],
                 "max_loan_exposure": 0.0,
@@ -2302,32 +2253,19 @@ class RiskMetricsCalculator:
             }
 
         # Calculate loan exposure
-        loan_exposure = {}
-        total_exposure = 0.0
+        loan_exposure = arrays.loan_amounts
+        total_exposure = loan_exposure.sum()
 
-        for loan in loans:
-            loan_id = loan.get("loan_id")
-            loan_amount = loan.get("loan_amount", 0.0)
-
-            loan_exposure[loan_id] = loan_amount
-            total_exposure += loan_amount
-
-        # Calculate percentages
-        loan_exposure_pct = {}
+        # Get top 10 loans by exposure percentage, keeping the portfolio order for ties
+        top_loans = []
 
         if total_exposure > 0:
-            for loan_id in loan_exposure:
-                loan_exposure_pct[loan_id] = loan_exposure[loan_id] / total_exposure
-
-        # Get top loans
-        top_loans = sorted(
-            [
-                {"loan_id": loan_id, "exposure": exposure}
-                for loan_id, exposure in loan_exposure_pct.items()
-            ],
-            key=lambda x: x["exposure"],
-            reverse=True
-        )
+            loan_exposure_pct = loan_exposure / total_exposure
+            top_indices = np.argsort(-loan_exposure_pct, kind="stable")[:10]
+            top_loans = [
+                {"loan_id": arrays.loan_ids[i], "exposure": exposure}
+                for i, exposure in zip(top_indices.tolist(), loan_exposure_pct[top_indices].tolist())
+            ]
 
         # Get maximum loan exposure
         max_loan_exposure = top_loans[0]["exposure"] if top_loans else 0.0
@@ -2336,7 +2274,7 @@ class RiskMetricsCalculator:
         loan_exposure_cap = getattr(self.config, "loan_exposure_cap", 0.05)
 
         return {
-            "top_loans": top_loans[:10],  # Top 10 loans
+            "top_loans": top_loans,
             "max_loan_exposure": max_loan_exposure,
             "loan_exposure_cap": loan_exposure_cap
         }
@@ -2394,8 +2332,7 @@ class RiskMetricsCalculator:
             return 0.0
 
         # Calculate Sharpe ratio
-        mean_return = np.mean(returns)
-        std_return = np.std(returns, ddof=1) if len(returns) > 1 else 0.0
+        mean_return, std_return, _ = self._get_returns_statistics()
 
         if std_return == 0:
             return 0.0
@@ -2416,8 +2353,7 @@ class RiskMetricsCalculator:
             return 0.0
 
         # Calculate Sortino ratio
-        mean_return = np.mean(returns)
-        downside_deviation = self._calculate_downside_deviation(returns)
+        mean_return, _, downside_deviation = self._get_returns_statistics()
 
         if downside_deviation == 0:
             return 0.0
@@ -2483,7 +2419,7 @@ class RiskMetricsCalculator:
             "impact_pct": irr_impact_pct
         }
 
-    def _get_parameter_range(self, parameter: str) -> List[float]:
+    def _get_parameter_range(self, parameter: str) -> np.ndarray:
         """
         Get range of values for sensitivity analysis.
 
@@ -2491,33 +2427,22 @@ class RiskMetricsCalculator:
             parameter: Parameter name
 
         Returns:
-            List of parameter values
-        """
-        # Define parameter ranges for sensitivity analysis
-        ranges = {
-            "interest_rate": np.linspace(0.01, 0.1, 10),  # 1% to 10%
-            "property_value_growth": np.linspace(-0.05, 0.15, 10),  # -5% to 15%
-            "default_rate": np.linspace(0.01, 0.2, 10),  # 1% to 20%
-            "prepayment_rate": np.linspace(0.0, 0.3, 10),  # 0% to 30%
-            "ltv_ratio": np.linspace(0.5, 0.9, 10),  # 50% to 90%
-            "leverage_ratio": np.linspace(0.0, 0.7, 10),  # 0% to 70%
-            "management_fee_rate": np.linspace(0.01, 0.03, 10),  # 1% to 3%
-            "carried_interest_rate": np.linspace(0.1, 0.3, 10),  # 10% to 30%
-            "hurdle_rate": np.linspace(0.05, 0.15, 10),  # 5% to 15%
-        }
-
-        return ranges.get(parameter, np.linspace(0.0, 1.0, 10))
+            Array of parameter values (shared, must not be modified)
+        """
+        return _SENSITIVITY_RANGES.get(parameter, _DEFAULT_SENSITIVITY_RANGE)
 
-    def _calculate_metrics_with_parameter(self, parameter: str, param_value: float) -> Dict[str, Any]:
+    def _calculate_metrics_with_parameter(self, parameter: str, param_values: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        Calculate metrics with a specific parameter value.
+        Calculate metrics with a range of parameter values.
+
+        The base metrics and parameter value are looked up once for the whole range.
 
         Args:
             parameter: Parameter name
-            param_value: Parameter value
+            param_values: Array of parameter values
 
         Returns:
-            Dictionary of metrics
+            Dictionary of metric arrays, one element per parameter value
         """
         # For now, use a simplified approach to estimate metrics with different parameter values
         # In a real implementation, this would re-run parts of the simulation with different parameters
@@ -2527,35 +2452,22 @@ class RiskMetricsCalculator:
         base_equity_multiple = self.risk_metrics.get("equity_multiple", 1.0)
         base_roi = self.risk_metrics.get("roi", 0.0)
 
-        # Define sensitivity factors for each parameter
-        sensitivity_factors = {
-            "interest_rate": -5.0,  # 1% increase in interest rate reduces IRR by 5%
-            "property_value_growth": 2.0,  # 1% increase in property value growth increases IRR by 2%
-            "default_rate": -10.0,  # 1% increase in default rate reduces IRR by 10%
-            "prepayment_rate": -1.0,  # 1% increase in prepayment rate reduces IRR by 1%
-            "ltv_ratio": 1.0,  # 1% increase in LTV ratio increases IRR by 1%
-            "leverage_ratio": 1.5,  # 1% increase in leverage ratio increases IRR by 1.5%
-            "management_fee_rate": -20.0,  # 1% increase in management fee rate reduces IRR by 20%
-            "carried_interest_rate": -5.0,  # 1% increase in carried interest rate reduces IRR by 5%
-            "hurdle_rate": -2.0,  # 1% increase in hurdle rate reduces IRR by 2%
-        }
-
         # Get base parameter value
         base_param_value = self._get_base_parameter_value(parameter)
 
-        # Calculate parameter change
-        param_change = param_value - base_param_value
+        # Calculate parameter changes
+        param_changes = param_values - base_param_value
 
         # Get sensitivity factor
-        sensitivity_factor = sensitivity_factors.get(parameter, 0.0)
+        sensitivity_factor = _SENSITIVITY_FACTORS.get(parameter, 0.0)
 
         # Calculate impact on IRR
-        irr_impact = param_change * sensitivity_factor
+        irr_impact = param_changes * sensitivity_factor
 
         # Calculate metrics with parameter
-        irr = max(0.0, base_irr * (1 + irr_impact))
-        equity_multiple = max(1.0, base_equity_multiple * (1 + irr_impact * 0.5))
-        roi = max(0.0, base_roi * (1 + irr_impact * 0.8))
+        irr = np.maximum(0.0, base_irr * (1 + irr_impact))
+        equity_multiple = np.maximum(1.0, base_equity_multiple * (1 + irr_impact * 0.5))
+        roi = np.maximum(0.0, base_roi * (1 + irr_impact * 0.8))
 
         return {
             "irr": irr,
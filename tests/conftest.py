@@ -4,11 +4,12 @@ Pytest configuration file for the EQU IHOME SIM ENGINE v2.
 This module provides fixtures for testing.
 """
 
+import asyncio
 import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Awaitable, Callable, Generator, List
 
 import pytest
 import numpy as np
@@ -152,3 +153,54 @@ def deterministic_rng() -> Generator[None, None, None]:
         os.environ["SIM_SEED"] = original_seed
     else:
         os.environ.pop("SIM_SEED", None)
+
+
+class RecordingWebSocketManager:
+    """WebSocket manager stand-in that records progress updates."""
+
+    def __init__(self) -> None:
+        self.progress: List[Dict[str, Any]] = []
+        self.background_sends: List[asyncio.Task] = []
+
+    async def send_progress(self, **kwargs: Any) -> None:
+        self.progress.append(kwargs)
+
+    def send_in_background(self, send: Awaitable[None]) -> None:
+        self.background_sends.append(asyncio.get_running_loop().create_task(send))
+
+    def is_cancelled(self, simulation_id: str) -> bool:
+        return False
+
+
+class StubTLSManager:
+    """TLS manager stand-in that serves fixed suburb data and records its lookups."""
+
+    def __init__(self, suburb_data: Dict[str, Dict[str, Any]]) -> None:
+        self.suburb_data = suburb_data
+        self.lookups: List[str] = []
+
+    def get_suburb_data(self, suburb: str) -> Dict[str, Any]:
+        self.lookups.append(suburb)
+        return self.suburb_data[suburb]
+
+
+@pytest.fixture
+def recording_websocket_manager() -> RecordingWebSocketManager:
+    """
+    Get a WebSocket manager stand-in that records progress updates.
+
+    Returns:
+        Recording WebSocket manager
+    """
+    return RecordingWebSocketManager()
+
+
+@pytest.fixture
+def stub_tls_manager() -> Callable[[Dict[str, Dict[str, Any]]], StubTLSManager]:
+    """
+    Get a factory for TLS manager stand-ins serving fixed suburb data.
+
+    Returns:
+        Factory taking the suburb data by suburb name
+    """
+    return StubTLSManager
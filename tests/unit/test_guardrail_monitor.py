@@ -0,0 +1,259 @@
+"""
+Unit tests for the guardrail monitor.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+
+import pytest
+
+from src.config.config_loader import SimulationConfig
+from src.engine.simulation_context import SimulationContext
+from src.risk import guardrail_monitor
+from src.risk.guardrail_monitor import Breach, GuardrailMonitor, GuardrailReport, Severity
+
+
+@pytest.fixture
+def guardrail_context(sample_config: Dict[str, Any]) -> SimulationContext:
+    """
+    Get a simulation context whose metrics breach guardrails on every layer.
+
+    Args:
+        sample_config: Sample configuration dictionary
+
+    Returns:
+        Simulation context
+    """
+    config = SimulationConfig(
+        **{**sample_config, "seed": 42},
+        guardrails={"max_term_months": 120},
+        monte_carlo={"enabled": True},
+    )
+    context = SimulationContext(config, run_id="guardrail-test")
+    context.exits = {
+        "l1": {"exit_month": 100},
+        "l2": {"exit_month": [130]},
+    }
+    context.metrics = {
+        "credit_metrics": {
+            "stress_ltv": {"loan_stress_ltvs": {"l1": 0.95, "l2": 0.5, "l3": [0.92], "l4": "n/a"}},
+            "default_probability": {"zone_default_probs": {"green": 0.01, "red": 0.05}},
+        },
+        "concentration_metrics": {
+            "zone_exposure": {"green": 0.6, "red": 0.1},
+            "suburb_exposure": {"a": 0.12, "b": 0.05},
+            "loan_exposure": {"l1": 0.03, "l2": 0.01},
+        },
+        "market_price_metrics": {
+            "volatility": {"zones": {"red": 0.2}},
+            "var": {"var_99": 0.1},
+            "cvar": {"cvar_99": 0.25},
+        },
+        "leverage_metrics": {"nav_utilisation": 0.5, "interest_coverage": 2.0},
+        "liquidity_metrics": {"liquidity_buffer": 0.02, "wal": 9.0},
+        "performance_metrics": {
+            "irr_distribution": {"p5": 0.03},
+            "hurdle_clear_probability": {"value": 0.9},
+        },
+        "monte_carlo_metrics": {"inner_paths": 100},
+    }
+    return context
+
+
+def test_evaluate_guardrails(guardrail_context: SimulationContext) -> None:
+    """Test that breaches on every layer are reported."""
+    report = asyncio.run(GuardrailMonitor(guardrail_context).evaluate_guardrails())
+
+    codes = sorted(breach.code for breach in report.breaches)
+    assert codes == sorted([
+        "LTV_STRESS_HIGH",
+        "LTV_STRESS_HIGH",
+        "EXIT_MONTH_LIMIT",
+        "ZONE_RED_WEIGHT",
+        "PD_ZONE_ALERT",
+        "ZONE_VOLATILITY_HIGH",
+        "SUBURB_CONCENTRATION",
+        "LOAN_CONCENTRATION",
+        "LIQUIDITY_BUFFER_LOW",
+        "WAL_SOFT",
+        "CVaR_99_LIMIT",
+        "IRR_P5_LOW",
+        "MC_LOW_PATHS",
+    ])
+    assert report.worst_level == Severity.FAIL
+    assert guardrail_context.guardrail_report is report
+
+    stress_values = sorted(breach.value for breach in report.breaches if breach.code == "LTV_STRESS_HIGH")
+    assert stress_values == [0.92, 0.95]
+
+
+def test_evaluate_guardrails_parallel(guardrail_context: SimulationContext) -> None:
+    """Test that parallel checks report the same breaches in the same order."""
+    sequential = asyncio.run(GuardrailMonitor(guardrail_context).evaluate_guardrails())
+    monitor = GuardrailMonitor(guardrail_context, parallel=True)
+    parallel = asyncio.run(monitor.evaluate_guardrails())
+
+    assert [b.to_dict() for b in parallel.breaches] == [b.to_dict() for b in sequential.breaches]
+    assert len(monitor.checked_guardrails) == 19
+
+
+def test_evaluate_guardrails_cancelled(guardrail_context: SimulationContext) -> None:
+    """Test that a cancelled simulation skips the guardrail checks."""
+    monitor = GuardrailMonitor(guardrail_context)
+    monitor.websocket_manager.set_cancelled(guardrail_context.run_id)
+    try:
+        report = asyncio.run(monitor.evaluate_guardrails())
+    finally:
+        monitor.websocket_manager.set_cancelled(guardrail_context.run_id, False)
+
+    assert report.breaches == []
+
+
+def test_evaluate_guardrails_batches_progress(
+    guardrail_context: SimulationContext, recording_websocket_manager: Any
+) -> None:
+    """Test that stage progress updates are sent with the final report in one frame."""
+    monitor = GuardrailMonitor(guardrail_context)
+    monitor.websocket_manager = recording_websocket_manager
+    asyncio.run(monitor.evaluate_guardrails())
+
+    sent = monitor.websocket_manager.progress
+    assert [message["progress"] for message in sent] == [0.0, 100.0]
+    data = sent[-1]["data"]
+    assert [stage["progress"] for stage in data["stages"]] == [25.0, 50.0, 75.0, 90.0]
+    assert len(data["breaches"]) == len(monitor.report.breaches)
+
+
+def test_loan_size_guardrail(guardrail_context: SimulationContext, stub_tls_manager: Callable[..., Any]) -> None:
+    """Test loan amounts against the ticket limit of their suburb's zone."""
+    guardrail_context.tls_manager = stub_tls_manager({"a": {"zone": "red"}, "b": {"zone": "green"}})
+    guardrail_context.portfolio = {
+        "loans": [
+            {"loan_id": "l1", "loan_amount": 350000, "suburb": "a"},
+            {"loan_id": "l2", "loan_amount": 350000, "suburb": "b"},
+            {"loan_id": "l3", "loan_amount": [600000]},
+            {"loan_id": "l4", "loan_amount": None, "suburb": "a"},
+        ]
+    }
+    monitor = GuardrailMonitor(guardrail_context)
+
+    breaches = monitor._check_loan_size_guardrail(guardrail_context.metrics)
+
+    breaches = [(b.message, b.value, b.threshold) for b in breaches]
+    assert breaches == [
+        ("Loan l1 amount $350,000 exceeds red zone limit of $300,000", 350000, 300000),
+        ("Loan l3 amount $600,000 exceeds green zone limit of $500,000", 600000, 500000),
+    ]
+
+
+def test_breach_to_dict() -> None:
+    """Test breach serialization."""
+    breach = Breach(code="WAL_SOFT", severity=Severity.WARN, message="WAL too long", value=9.0, threshold=8.0)
+
+    assert not hasattr(breach, "__dict__")
+    assert breach.to_dict() == {
+        "code": "WAL_SOFT",
+        "severity": Severity.WARN,
+        "message": "WAL too long",
+        "value": 9.0,
+        "threshold": 8.0,
+        "unit": None,
+        "layer": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "severities, expected",
+    [
+        ([], Severity.INFO),
+        ([Severity.INFO], Severity.INFO),
+        ([Severity.INFO, Severity.WARN, Severity.INFO], Severity.WARN),
+        ([Severity.WARN, Severity.FAIL, Severity.INFO], Severity.FAIL),
+    ],
+)
+def test_worst_level(severities: list, expected: str) -> None:
+    """Test the worst severity level of a report."""
+    report = GuardrailReport(breaches=[Breach(code="X", severity=severity, message="") for severity in severities])
+
+    assert report.worst_level == expected
+
+
+def test_checks_run_once(guardrail_context: SimulationContext) -> None:
+    """Test that repeating a check does not report its breaches twice."""
+    monitor = GuardrailMonitor(guardrail_context)
+
+    assert len(monitor._check_stress_ltv_guardrail(guardrail_context.metrics)) == 2
+    assert monitor._check_stress_ltv_guardrail(guardrail_context.metrics) == []
+    assert "LTV_STRESS_HIGH" in monitor.checked_guardrails
+
+
+def test_violation_counters(guardrail_context: SimulationContext, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the violations counter is incremented once per code by its breach count."""
+    increments = []
+    monkeypatch.setattr(
+        guardrail_monitor,
+        "increment_counter",
+        lambda name, value=1.0, labels=None: increments.append((name, labels["guardrail"], value)),
+    )
+
+    asyncio.run(GuardrailMonitor(guardrail_context).evaluate_guardrails())
+
+    assert ("guardrail_violations_total", "LTV_STRESS_HIGH", 2) in increments
+    assert len(increments) == len({code for _, code, _ in increments}) == 12
+
+
+def test_monte_carlo_checks_skipped_when_disabled(guardrail_context: SimulationContext) -> None:
+    """Test that the Monte Carlo guardrails only run when Monte Carlo is enabled."""
+    guardrail_context.config.monte_carlo = {"enabled": False}
+    monitor = GuardrailMonitor(guardrail_context)
+
+    report = asyncio.run(monitor.evaluate_guardrails())
+
+    assert not monitor.monte_carlo_enabled
+    assert not {"CVaR_99_LIMIT", "IRR_P5_LOW", "MC_LOW_PATHS"} & {breach.code for breach in report.breaches}
+
+
+def test_schema_version_guardrail(guardrail_context: SimulationContext) -> None:
+    """Test that a config schema version other than the engine's is reported."""
+    monitor = GuardrailMonitor(guardrail_context)
+    assert monitor._check_schema_version_guardrail(guardrail_context.metrics) == []
+
+    guardrail_context.config.schema_version = "0.9.0"
+    breaches = GuardrailMonitor(guardrail_context)._check_schema_version_guardrail(guardrail_context.metrics)
+
+    assert [(b.code, b.severity) for b in breaches] == [("INFO_SCHEMA_MISMATCH", Severity.INFO)]
+    assert guardrail_monitor._ENGINE_SCHEMA_VERSION in breaches[0].message
+
+
+@pytest.mark.parametrize(
+    "monte_carlo, expected",
+    [
+        ({"enabled": True}, True),
+        ({}, False),
+        (SimpleNamespace(enabled=True), True),
+        (SimpleNamespace(), False),
+        (None, False),
+    ],
+)
+def test_monte_carlo_enabled(guardrail_context: SimulationContext, monte_carlo: Any, expected: bool) -> None:
+    """Test reading the Monte Carlo flag from a dict or a model section."""
+    guardrail_context.config.monte_carlo = monte_carlo
+
+    assert GuardrailMonitor(guardrail_context).monte_carlo_enabled is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (0.5, (0.5, True)),
+        (3, (3, True)),
+        ([0.7, 0.1], (0.7, True)),
+        ((), (0.0, True)),
+        ("n/a", (0.0, False)),
+        (None, (0.0, False)),
+    ],
+)
+def test_as_number(value: Any, expected: tuple) -> None:
+    """Test coercion of scalar metric values."""
+    assert guardrail_monitor._as_number(value) == expected
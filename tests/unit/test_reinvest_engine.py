@@ -0,0 +1,673 @@
+"""
+Tests for the reinvestment engine module.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from src.config.config_loader import SimulationConfig
+from src.engine.simulation_context import SimulationContext
+from src.reinvest_engine import reinvest_engine
+from src.reinvest_engine.reinvest_engine import (
+    ReinvestmentFrequency,
+    aggregate_portfolio,
+    build_portfolio_snapshot,
+    calculate_avg_ltv,
+    calculate_concentration_risk,
+    calculate_performance_adjustments,
+    calculate_reinvestment_statistics,
+    calculate_risk_impact,
+    calculate_zone_distribution,
+    generate_reinvestment_visualization,
+    get_portfolio_aggregates,
+    get_sorted_reinvestment_events,
+    get_opportunistic_allocations,
+    get_reinvestment_config,
+    get_target_allocations,
+    group_exits_by_time_period,
+    normalize_allocations,
+    process_exits_and_reinvest,
+    reinvest_capital,
+    sum_loan_sizes_by_zone,
+)
+
+
+@pytest.fixture
+def sample_exits() -> list:
+    """
+    Get a sample list of exit events.
+
+    Returns:
+        List of exit dictionaries
+    """
+    return [
+        {"loan_id": "a", "exit_year": 1.0, "exit_month": 0, "exit_value": 100.0},
+        {"loan_id": "b", "exit_year": 1.0, "exit_month": 4, "exit_value": 200.0},
+        {"loan_id": "c", "exit_year": 1.0, "exit_month": 1, "exit_value": 300.0},
+        {"loan_id": "d", "exit_year": 2.0, "exit_month": 11, "exit_value": 400.0},
+    ]
+
+
+@pytest.mark.parametrize(
+    "frequency, expected",
+    [
+        (
+            ReinvestmentFrequency.MONTHLY,
+            [
+                (1.0, 1, "1.0-01"),
+                (1.0, 5, "1.0-05"),
+                (1.0, 2, "1.0-02"),
+                (2.0, 12, "2.0-12"),
+            ],
+        ),
+        (ReinvestmentFrequency.QUARTERLY, [(1.0, 1, "1.0-Q1"), (1.0, 4, "1.0-Q2"), (2.0, 10, "2.0-Q4")]),
+        (ReinvestmentFrequency.SEMI_ANNUALLY, [(1.0, 1, "1.0-H1"), (2.0, 7, "2.0-H2")]),
+        (ReinvestmentFrequency.ANNUALLY, [(1.0, 1, "1.0"), (2.0, 1, "2.0")]),
+        ("quarterly", [(1.0, 1, "1.0-Q1"), (1.0, 4, "1.0-Q2"), (2.0, 10, "2.0-Q4")]),
+    ],
+)
+def test_group_exits_by_time_period(sample_exits: list, frequency: str, expected: list) -> None:
+    """Test that exit groups carry their year, month and label."""
+    groups = group_exits_by_time_period(sample_exits, frequency)
+
+    assert [(year, month, time_key) for year, month, time_key, _ in groups] == expected
+    assert sum(len(group_exits) for *_, group_exits in groups) == len(sample_exits)
+
+
+def test_get_reinvestment_config(sample_config: Dict[str, Any]) -> None:
+    """Test that the reinvestment config is resolved once and rebuilt when replaced."""
+    config = SimulationConfig(
+        **sample_config,
+        reinvestment_engine={"min_reinvestment_amount": 5000, "reinvestment_batch_size": 10},
+    )
+    context = SimulationContext(config)
+
+    reinvestment_config = get_reinvestment_config(context)
+
+    assert reinvestment_config.min_reinvestment_amount == 5000
+    assert reinvestment_config.reinvestment_frequency == ReinvestmentFrequency.QUARTERLY
+    assert get_reinvestment_config(context) is reinvestment_config
+
+    context.config.reinvestment_engine = {**context.config.reinvestment_engine, "enable_cash_reserve": True}
+
+    assert get_reinvestment_config(context).enable_cash_reserve is True
+
+
+def test_group_exits_on_exit() -> None:
+    """Test that on-exit grouping puts every exit in its own group."""
+    exits = [
+        {"loan_id": "a", "exit_year": 1.25, "exit_month": 2},
+        {"loan_id": "b", "exit_year": 1.25, "exit_month": 2},
+    ]
+
+    groups = group_exits_by_time_period(exits, ReinvestmentFrequency.ON_EXIT)
+
+    assert [(year, month, time_key) for year, month, time_key, _ in groups] == [
+        (1.2, 3, "1.2-03-a"),
+        (1.2, 3, "1.2-03-b"),
+    ]
+
+
+def test_group_exits_keeps_first_seen_order() -> None:
+    """Test that groups are returned in first-seen order with their exits collected."""
+    exits = [
+        {"loan_id": "a", "exit_year": 2.0, "exit_month": 0},
+        {"loan_id": "b", "exit_year": 1.0, "exit_month": 0},
+        {"loan_id": "c", "exit_year": 2.0, "exit_month": 5},
+    ]
+
+    groups = group_exits_by_time_period(exits, "annually")
+
+    assert [(time_key, [e["loan_id"] for e in group]) for _, _, time_key, group in groups] == [
+        ("2.0", ["a", "c"]),
+        ("1.0", ["b"]),
+    ]
+
+
+def test_get_target_allocations_cached_copy(sample_config_obj: SimulationConfig) -> None:
+    """Test that cached target allocations are not corrupted by callers."""
+    context = SimulationContext(sample_config_obj)
+
+    allocations = get_target_allocations(context)
+    allocations["green"] += 0.5
+
+    assert get_target_allocations(context) == pytest.approx({"green": 0.6, "orange": 0.3, "red": 0.1})
+
+
+def test_normalize_allocations() -> None:
+    """Test allocation normalization, including the zero-total case."""
+    assert normalize_allocations({"green": 3.0, "orange": 1.0}) == pytest.approx({"green": 0.75, "orange": 0.25})
+    assert normalize_allocations({"green": 0.0, "orange": 0.0}) == {"green": 0.0, "orange": 0.0}
+    assert normalize_allocations({}) == {}
+
+
+def test_get_opportunistic_allocations(sample_config_obj: SimulationConfig) -> None:
+    """Test that only zones appreciating above the threshold receive capital."""
+    context = SimulationContext(sample_config_obj)
+    context.price_paths = {
+        "zone_price_paths": {
+            "green": [1.0] * 13 + [1.1],
+            "orange": [1.0] * 13 + [1.2],
+            "red": [1.0] * 13 + [1.01],
+        }
+    }
+
+    allocations = get_opportunistic_allocations(context, opportunistic_threshold=0.05)
+
+    assert allocations == pytest.approx({"green": 1 / 3, "orange": 2 / 3, "red": 0.0})
+
+
+def test_get_opportunistic_allocations_falls_back_to_targets(sample_config_obj: SimulationConfig) -> None:
+    """Test the fallback to target allocations when no zone clears the threshold."""
+    context = SimulationContext(sample_config_obj)
+    context.price_paths = {"zone_price_paths": {"green": [1.0] * 20, "orange": [1.0] * 5}}
+
+    allocations = get_opportunistic_allocations(context, opportunistic_threshold=0.05)
+
+    assert allocations == pytest.approx({"green": 0.6, "orange": 0.3, "red": 0.1})
+
+
+def test_calculate_performance_adjustments(sample_config_obj: SimulationConfig) -> None:
+    """Test that only exits within the lookback period drive the adjustments."""
+    context = SimulationContext(sample_config_obj)
+    context.exits = [
+        {"loan_id": "a", "zone": "green", "exit_year": 3, "exit_month": 0, "roi": 0.2},
+        {"loan_id": "b", "zone": "orange", "exit_year": 3, "exit_month": 6, "roi": 0.1},
+        {"loan_id": "c", "zone": "red", "exit_year": 1, "exit_month": 0, "roi": 0.5},
+    ]
+
+    adjustments = calculate_performance_adjustments(context, lookback_period=12, weight=0.5, max_adjustment=0.2)
+
+    assert adjustments == pytest.approx({"green": 1 / 30, "orange": 1 / 60, "red": -0.05})
+
+
+def test_calculate_performance_adjustments_without_exits(sample_config_obj: SimulationConfig) -> None:
+    """Test that no exits produce no adjustments."""
+    context = SimulationContext(sample_config_obj)
+    context.exits = []
+
+    assert calculate_performance_adjustments(context) == {"green": 0.0, "orange": 0.0, "red": 0.0}
+
+
+@pytest.fixture
+def sample_loans() -> list:
+    """
+    Get a sample portfolio of loans spread over zones and suburbs.
+
+    Returns:
+        List of loan dictionaries
+    """
+    zones = ["green", "orange", "red"]
+    return [
+        {
+            "loan_id": f"loan-{i}",
+            "zone": zones[i % 3],
+            "suburb_name": f"suburb-{i % 13}",
+            "loan_size": 100_000.0 + 7_000.0 * i,
+            "ltv": 0.4 + 0.01 * (i % 30),
+        }
+        for i in range(60)
+    ]
+
+
+def test_portfolio_snapshot_matches_full_calculation(sample_config_obj: SimulationConfig, sample_loans: list) -> None:
+    """Test that snapshots built from aggregates match the per-metric helpers."""
+    context = SimulationContext(sample_config_obj)
+    context.loans = sample_loans
+
+    snapshot = build_portfolio_snapshot(aggregate_portfolio(sample_loans))
+
+    assert snapshot["num_loans"] == len(sample_loans)
+    assert snapshot["zone_distribution"] == pytest.approx(calculate_zone_distribution(context))
+    assert snapshot["avg_ltv"] == pytest.approx(calculate_avg_ltv(context))
+    assert snapshot["concentration_risk"] == pytest.approx(calculate_concentration_risk(context))
+
+
+def test_portfolio_aggregates_incremental(sample_loans: list) -> None:
+    """Test that adding loans to existing aggregates matches a full rescan."""
+    base = aggregate_portfolio(sample_loans[:40])
+    incremental_aggregates = aggregate_portfolio(sample_loans[40:], base=base)
+    full_aggregates = aggregate_portfolio(sample_loans)
+    incremental = build_portfolio_snapshot(incremental_aggregates)
+    full = build_portfolio_snapshot(full_aggregates)
+
+    assert base["num_loans"] == 40
+    assert incremental_aggregates["zone_sum_sq"] == pytest.approx(
+        sum(amount ** 2 for amount in full_aggregates["zone_amounts"].values())
+    )
+    assert incremental_aggregates["suburb_sum_sq"] == pytest.approx(
+        sum(amount ** 2 for amount in full_aggregates["suburb_amounts"].values())
+    )
+    assert incremental["num_loans"] == full["num_loans"]
+    assert incremental["avg_ltv"] == pytest.approx(full["avg_ltv"])
+    assert incremental["zone_distribution"] == pytest.approx(full["zone_distribution"])
+    assert incremental["concentration_risk"] == pytest.approx(full["concentration_risk"])
+
+
+def test_portfolio_helpers_share_cached_aggregates(sample_config_obj: SimulationConfig, sample_loans: list) -> None:
+    """Test that the portfolio helpers reuse aggregates and pick up appended loans."""
+    context = SimulationContext(sample_config_obj)
+    context.loans = [
+        {"loan_id": "l1", "zone": "green", "suburb_name": "a", "loan_size": 500.0, "ltv": 0.5},
+        {"loan_id": "l2", "zone": "orange", "suburb_name": "b", "loan_size": 300.0, "ltv": 0.7},
+    ]
+
+    aggregates = get_portfolio_aggregates(context)
+    assert get_portfolio_aggregates(context) is aggregates
+    assert calculate_avg_ltv(context) == pytest.approx((250.0 + 210.0) / 800.0)
+
+    context.loans.append({"loan_id": "l3", "zone": "red", "suburb_name": "a", "loan_size": 200.0, "ltv": 0.8})
+
+    assert get_portfolio_aggregates(context)["num_loans"] == 3
+    assert calculate_zone_distribution(context) == pytest.approx({"green": 0.5, "orange": 0.3, "red": 0.2})
+    assert calculate_concentration_risk(context)["hhi_suburb"] == pytest.approx(0.7 ** 2 + 0.3 ** 2)
+
+    context.loans = sample_loans
+    assert get_portfolio_aggregates(context)["num_loans"] == len(sample_loans)
+
+
+def test_concentration_risk_cached(sample_config_obj: SimulationConfig) -> None:
+    """Test that concentration risk is reused until the loans change."""
+    context = SimulationContext(sample_config_obj)
+    context.loans = [{"loan_id": "l1", "zone": "green", "suburb_name": "a", "loan_size": 100.0, "ltv": 0.5}]
+
+    risk = calculate_concentration_risk(context)
+    cached = context._concentration_risk_cache
+    risk["hhi_zone"] = -1.0
+
+    assert calculate_concentration_risk(context)["hhi_zone"] == pytest.approx(1.0)
+    assert context._concentration_risk_cache is cached
+
+    context.loans.append({"loan_id": "l2", "zone": "red", "suburb_name": "b", "loan_size": 100.0, "ltv": 0.5})
+
+    assert calculate_concentration_risk(context)["hhi_zone"] == pytest.approx(0.5)
+
+
+def test_calculate_risk_impact() -> None:
+    """Test the weighted risk score and diversification impact, treating missing metrics as zero."""
+    before = {
+        "zone_distribution": {"green": 1.0},
+        "avg_ltv": 0.5,
+        "concentration_risk": {"hhi_zone": 1.0, "hhi_suburb": 0.5, "top_5_concentration": 1.0},
+    }
+    after = {
+        "zone_distribution": {"green": 0.5, "red": 0.5},
+        "avg_ltv": 0.6,
+        "concentration_risk": {
+            "hhi_zone": 0.5,
+            "hhi_suburb": 0.25,
+            "top_5_concentration": 0.8,
+            "top_10_concentration": 1.0,
+        },
+    }
+
+    impact = calculate_risk_impact(before, after)
+
+    assert impact["zone_distribution_change"] == pytest.approx({"green": -0.5, "red": 0.5})
+    assert impact["avg_ltv_change"] == pytest.approx(0.1)
+    assert impact["risk_score_before"] == pytest.approx(0.15 + 0.2 + 0.1 + 0.15)
+    assert impact["risk_score_after"] == pytest.approx(0.18 + 0.1 + 0.05 + 0.12 + 0.15)
+    assert impact["risk_score_change"] == pytest.approx(-impact["risk_adjusted_return_impact"])
+    assert impact["diversification_impact"] == pytest.approx(0.2 + 0.1 + 0.02 - 0.1)
+
+
+def test_sum_loan_sizes_by_zone() -> None:
+    """Test zone totals for loans with, without and outside the zone_id coding."""
+    loans = [
+        {"zone": "green", "zone_id": 0, "loan_size": 100.0},
+        {"zone": "red", "loan_size": 50.0},
+        {"zone": "green", "loan_size": 25.0},
+        {"zone": "blue", "loan_size": 10.0},
+        {"loan_size": 5.0},
+    ]
+
+    assert sum_loan_sizes_by_zone(loans) == {"green": 125.0, "red": 50.0, "blue": 10.0, None: 5.0}
+    assert sum_loan_sizes_by_zone([]) == {}
+
+
+def test_empty_portfolio_snapshot() -> None:
+    """Test the snapshot of an empty portfolio."""
+    snapshot = build_portfolio_snapshot(aggregate_portfolio([]))
+
+    assert snapshot["zone_distribution"] == {"green": 0.0, "orange": 0.0, "red": 0.0}
+    assert snapshot["avg_ltv"] == 0.0
+    assert snapshot["concentration_risk"]["hhi_zone"] == 0.0
+
+
+@pytest.fixture
+def reinvestment_context(sample_config: Dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> SimulationContext:
+    """
+    Get a simulation context with cash-reserve reinvestment and stubbed loan generation.
+
+    Args:
+        sample_config: Sample configuration dictionary
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        Simulation context ready for process_exits_and_reinvest
+    """
+    config = SimulationConfig(
+        **sample_config,
+        reinvestment_engine={
+            "reinvestment_frequency": "annually",
+            "min_reinvestment_amount": 1000,
+            "enable_cash_reserve": True,
+            "cash_reserve_target": 0.05,
+            "cash_reserve_min": 0.02,
+        },
+    )
+
+    async def fake_generate_reinvestment_loans(
+        context: SimulationContext,
+        reinvestment_amount: float,
+        target_zones: Dict[str, float],
+        year: float,
+    ) -> List[Dict[str, Any]]:
+        return [{"loan_id": f"r-{year}", "zone": "green", "loan_size": reinvestment_amount, "ltv": 0.5}]
+
+    monkeypatch.setattr(reinvest_engine, "generate_reinvestment_loans", fake_generate_reinvestment_loans)
+
+    context = SimulationContext(config)
+    context.exits = [
+        {"loan_id": "a", "exit_year": 1.0, "exit_month": 0, "exit_value": 8_000_000.0},
+        {"loan_id": "b", "exit_year": 2.0, "exit_month": 0, "exit_value": 1_000_000.0},
+    ]
+    context.reinvestment_events = []
+    context.cash_reserve = 0.0
+    context.cash_reserve_history = []
+    return context
+
+
+def test_process_exits_with_cash_reserve(reinvestment_context: SimulationContext) -> None:
+    """Test that the cash reserve is tracked across exit groups."""
+    asyncio.run(process_exits_and_reinvest(reinvestment_context))
+
+    assert reinvestment_context.cash_reserve == pytest.approx(5_000_000.0)
+    assert [entry["cash_reserve"] for entry in reinvestment_context.cash_reserve_history] == pytest.approx(
+        [8_000_000.0, 5_000_000.0, 6_000_000.0, 5_000_000.0]
+    )
+    assert reinvestment_context.cash_reserve_history[0]["cash_reserve_percentage"] == pytest.approx(0.08)
+
+    events = reinvestment_context.reinvestment_events
+    assert [event["amount"] for event in events] == pytest.approx([3_000_000.0, 1_000_000.0])
+    assert reinvestment_context.total_reinvested == pytest.approx(4_000_000.0)
+    assert [event["event_id"] for event in events] == [
+        f"{reinvestment_context.run_id}-rinv-1",
+        f"{reinvestment_context.run_id}-rinv-2",
+    ]
+    assert events[0]["cash_reserve_before"] == pytest.approx(8_000_000.0)
+    assert events[0]["cash_reserve_after"] == pytest.approx(5_000_000.0)
+
+
+def test_process_exits_writes_back_cash_reserve_on_failure(
+    reinvestment_context: SimulationContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the cash reserve is written back when a reinvestment fails."""
+    original_reinvest_amount = reinvest_engine.reinvest_amount
+    calls = []
+
+    async def failing_reinvest_amount(**kwargs: Any) -> None:
+        calls.append(kwargs["amount"])
+        if len(calls) > 1:
+            raise RuntimeError("reinvestment failed")
+        await original_reinvest_amount(**kwargs)
+
+    monkeypatch.setattr(reinvest_engine, "reinvest_amount", failing_reinvest_amount)
+
+    with pytest.raises(RuntimeError, match="reinvestment failed"):
+        asyncio.run(process_exits_and_reinvest(reinvestment_context))
+
+    assert calls == pytest.approx([3_000_000.0, 1_000_000.0])
+    assert reinvestment_context.cash_reserve == pytest.approx(5_000_000.0)
+
+
+def test_reinvest_capital(reinvestment_context: SimulationContext) -> None:
+    """Test the full reinvestment pass, including the post-processing steps."""
+    reinvestment_context.loans = []
+    asyncio.run(reinvest_capital(reinvestment_context))
+
+    assert reinvestment_context.reinvestment_summary["total_reinvested"] == pytest.approx(4_000_000.0)
+    assert reinvestment_context.reinvestment_summary["num_reinvestment_events"] == 2
+    assert "charts" in reinvestment_context.reinvestment_visualization
+    assert len(reinvestment_context.reinvestment_risk_metrics) == 1
+
+
+@pytest.fixture
+def statistics_context(sample_config_obj: SimulationConfig) -> SimulationContext:
+    """
+    Get a simulation context with recorded reinvestment events, loans and exits.
+
+    Args:
+        sample_config_obj: Sample SimulationConfig object
+
+    Returns:
+        Simulation context ready for reinvestment statistics
+    """
+    context = SimulationContext(sample_config_obj)
+    context.reinvestment_events = [
+        {
+            "event_id": "e1",
+            "year": 1.0,
+            "month": 2,
+            "amount": 100.0,
+            "source": "exit",
+            "source_details": {"exit_ids": ["a", "b"]},
+            "strategy_used": "rebalance",
+            "target_allocations": {"green": 0.5, "orange": 0.3, "red": 0.2},
+            "actual_allocations": {"green": 0.6, "orange": 0.4},
+            "num_loans_generated": 2,
+        },
+        {
+            "event_id": "e2",
+            "year": 2.0,
+            "month": 8,
+            "amount": 50.0,
+            "source": "cash_reserve",
+            "source_details": {},
+            "strategy_used": "maintain_allocation",
+            "target_allocations": {"green": 1.0},
+            "actual_allocations": {"green": 1.0},
+            "num_loans_generated": 1,
+        },
+        {
+            "event_id": "e3",
+            "year": 1.0,
+            "month": 11,
+            "amount": 30.0,
+            "source": "exit",
+            "source_details": {"exit_ids": ["c"]},
+            "strategy_used": "rebalance",
+            "target_allocations": {"red": 1.0},
+            "actual_allocations": {"red": 1.0},
+            "num_loans_generated": 1,
+        },
+    ]
+    context.loans = [
+        {"loan_id": "l1", "zone": "green", "loan_size": 500.0, "ltv": 0.5},
+        {
+            "loan_id": "r1", "zone": "green", "loan_size": 100.0, "ltv": 0.6,
+            "is_reinvestment": True, "reinvestment_year": 1.0,
+        },
+        {
+            "loan_id": "r2", "zone": "orange", "loan_size": 50.0, "ltv": 0.7,
+            "is_reinvestment": True, "reinvestment_year": 2.0,
+        },
+        {
+            "loan_id": "r3", "zone": "red", "loan_size": 30.0, "ltv": 0.8,
+            "is_reinvestment": True, "reinvestment_year": 1.0,
+        },
+    ]
+    context.exits = [
+        {"loan_id": "a", "exit_year": 1.0, "exit_month": 0, "exit_value": 200.0},
+        {"loan_id": "b", "exit_year": 0.0, "exit_month": 6, "exit_value": 100.0},
+        {"loan_id": "c", "exit_year": 1.0, "exit_month": 9, "exit_value": 30.0},
+        {
+            "loan_id": "r1", "exit_year": 4.0, "exit_month": 0, "exit_value": 120.0,
+            "loan_size": 100.0, "exit_type": "sale",
+        },
+        {
+            "loan_id": "r2", "exit_year": 5.0, "exit_month": 0, "exit_value": 40.0,
+            "loan_size": 50.0, "exit_type": "refinance",
+        },
+    ]
+    context.cash_reserve_history = [
+        {"year": 1.0, "month": 1, "cash_reserve": 10.0},
+        {"year": 1.0, "month": 2, "cash_reserve": 30.0},
+        {"year": 2.0, "month": 8, "cash_reserve": 20.0},
+    ]
+    return context
+
+
+def test_calculate_reinvestment_statistics(statistics_context: SimulationContext) -> None:
+    """Test reinvestment statistics over a small set of events."""
+    statistics = calculate_reinvestment_statistics(statistics_context)
+
+    assert statistics["total_reinvested"] == pytest.approx(180.0)
+    assert statistics["num_reinvestment_events"] == 3
+    assert statistics["avg_reinvestment_amount"] == pytest.approx(60.0)
+    assert statistics["reinvestment_by_year"] == pytest.approx({1.0: 130.0, 2.0: 50.0})
+    assert statistics["reinvestment_by_zone"] == pytest.approx({"green": 110.0, "orange": 40.0, "red": 30.0})
+    assert statistics["reinvestment_by_strategy"] == pytest.approx({"rebalance": 130.0, "maintain_allocation": 50.0})
+    assert statistics["reinvestment_by_source"] == pytest.approx({"exit": 130.0, "cash_reserve": 50.0})
+    assert statistics["reinvestment_efficiency"] == pytest.approx({
+        "reinvestment_ratio": 180.0 / 490.0,
+        "avg_time_to_reinvest": 4.0,
+        "reinvestment_portfolio_impact": 3.0,
+    })
+    assert statistics["reinvestment_performance"]["roi"] == pytest.approx(160.0 / 150.0 - 1)
+    assert statistics["reinvestment_performance"]["avg_hold_period"] == pytest.approx(3.0)
+    assert statistics["reinvestment_performance"]["exit_type_distribution"] == pytest.approx(
+        {"sale": 0.5, "refinance": 0.5}
+    )
+    assert statistics["reinvestment_timing"] == {
+        1: {"q1": 100.0, "q2": 0, "q3": 0, "q4": 30.0},
+        2: {"q1": 0, "q2": 0, "q3": 50.0, "q4": 0},
+    }
+    assert statistics["cash_reserve_metrics"] == pytest.approx({
+        "avg_cash_reserve": 20.0,
+        "min_cash_reserve": 10.0,
+        "max_cash_reserve": 30.0,
+        "avg_cash_reserve_pct": 20.0 / 100_000_000,
+        "min_cash_reserve_pct": 10.0 / 100_000_000,
+        "max_cash_reserve_pct": 30.0 / 100_000_000,
+    })
+
+
+def test_generate_reinvestment_visualization(statistics_context: SimulationContext) -> None:
+    """Test reinvestment visualization data over a small set of events."""
+    statistics_context.reinvestment_summary = calculate_reinvestment_statistics(statistics_context)
+
+    visualization = generate_reinvestment_visualization(statistics_context)
+    charts = visualization["charts"]
+    tables = visualization["tables"]
+
+    assert [point["event_id"] for point in tables["reinvestment_events_table"]] == ["e1", "e3", "e2"]
+    assert [point["cumulative_amount"] for point in charts["reinvestment_timeline"]] == pytest.approx(
+        [100.0, 130.0, 180.0]
+    )
+    assert charts["reinvestment_by_year_chart"] == [
+        {"year": 1.0, "amount": 130.0, "num_events": 2},
+        {"year": 2.0, "amount": 50.0, "num_events": 1},
+    ]
+    assert [(point["event_id"], point["zone"]) for point in charts["allocation_comparison_chart"]] == [
+        ("e1", "green"), ("e1", "orange"), ("e1", "red"), ("e2", "green"), ("e3", "red"),
+    ]
+    assert [point["gap"] for point in charts["allocation_comparison_chart"][:3]] == pytest.approx([0.1, 0.1, -0.2])
+    assert charts["reinvestment_timing_chart"] == [
+        {"year": 1, "quarter": "q1", "amount": 100.0},
+        {"year": 1, "quarter": "q4", "amount": 30.0},
+        {"year": 2, "quarter": "q3", "amount": 50.0},
+    ]
+    assert [point["year"] for point in charts["reinvestment_vs_exits_chart"]] == [0.0, 1.0, 2.0, 4.0, 5.0]
+    assert charts["reinvestment_vs_exits_chart"][1] == {
+        "year": 1.0, "exits": 230.0, "reinvestments": 130.0, "gap": -100.0,
+    }
+    assert charts["loan_size_distribution_chart"][0] == {"bin": "30-37", "count": 1}
+    assert charts["loan_size_distribution_chart"][2] == {"bin": "44-51", "count": 1}
+    assert charts["loan_size_distribution_chart"][9] == {"bin": "93-100", "count": 1}
+    assert sum(point["count"] for point in charts["loan_size_distribution_chart"]) == 3
+    assert len(charts["cash_reserve_chart"]) == 3
+
+    summary_row = tables["reinvestment_summary_table"][0]
+    assert summary_row["num_events"] == 2
+    assert summary_row["num_loans"] == 3
+    assert summary_row["zone_distribution"] == pytest.approx({"green": 60 / 130, "orange": 40 / 130, "red": 30 / 130})
+    assert summary_row["strategy_distribution"] == pytest.approx({"rebalance": 1.0})
+
+    loans_table = {row["loan_id"]: row for row in tables["reinvestment_loans_table"]}
+    assert loans_table["r1"]["exit_type"] == "sale"
+    assert loans_table["r1"]["hold_period"] == pytest.approx(3.0)
+    assert "exit_year" not in loans_table["r3"]
+    assert visualization["kpis"]["num_reinvestment_loans"] == 3
+
+
+def test_loan_size_distribution_with_equal_sizes(statistics_context: SimulationContext) -> None:
+    """Test that equal loan sizes fall into the first of ten unit-width bins."""
+    for loan in statistics_context.loans:
+        loan["loan_size"] = 50.0
+    statistics_context.reinvestment_summary = calculate_reinvestment_statistics(statistics_context)
+
+    chart = generate_reinvestment_visualization(statistics_context)["charts"]["loan_size_distribution_chart"]
+
+    assert len(chart) == 10
+    assert chart[0] == {"bin": "50-51", "count": 3}
+    assert chart[9] == {"bin": "59-60", "count": 0}
+
+
+def test_get_sorted_reinvestment_events_cached(statistics_context: SimulationContext) -> None:
+    """Test that sorted events are cached until events are added."""
+    sorted_events = get_sorted_reinvestment_events(statistics_context)
+
+    assert [event["event_id"] for event in sorted_events] == ["e1", "e3", "e2"]
+    assert get_sorted_reinvestment_events(statistics_context) is sorted_events
+
+    statistics_context.reinvestment_events.append({"event_id": "e0", "year": 0.0, "month": 5})
+
+    assert [event["event_id"] for event in get_sorted_reinvestment_events(statistics_context)] == [
+        "e0", "e1", "e3", "e2",
+    ]
+
+
+def test_generate_reinvestment_visualization_without_activity(sample_config_obj: SimulationConfig) -> None:
+    """Test that a context without reinvestment activity yields empty charts and tables."""
+    context = SimulationContext(sample_config_obj)
+    context.reinvestment_events = []
+    context.loans = []
+    context.exits = []
+    context.cash_reserve_history = []
+    context.reinvestment_summary = calculate_reinvestment_statistics(context)
+
+    visualization = generate_reinvestment_visualization(context)
+
+    assert visualization["charts"]["reinvestment_timeline"] == []
+    assert visualization["charts"]["cash_reserve_chart"] == []
+    assert visualization["charts"]["loan_size_distribution_chart"] == []
+    assert all(not table for table in visualization["tables"].values())
+    assert visualization["kpis"]["total_reinvested"] == 0
+
+
+def test_generate_reinvestment_visualization_streaming(statistics_context: SimulationContext) -> None:
+    """Test that streaming tables yield the same rows as the materialized tables."""
+    statistics_context.reinvestment_summary = calculate_reinvestment_statistics(statistics_context)
+
+    tables = generate_reinvestment_visualization(statistics_context)["tables"]
+    streamed = generate_reinvestment_visualization(statistics_context, streaming=True)["tables"]
+
+    assert not isinstance(streamed["reinvestment_events_table"], list)
+    assert list(streamed["reinvestment_events_table"]) == tables["reinvestment_events_table"]
+    assert list(streamed["reinvestment_loans_table"]) == tables["reinvestment_loans_table"]
+
+
+@pytest.mark.parametrize("num_shares", [0, 3, 5, 8, 10, 40])
+def test_top_share_sums(num_shares: int) -> None:
+    """Test top-5 and top-10 sums against a full sort."""
+    shares = np.random.default_rng(7).random(num_shares)
+    expected = np.sort(shares)[::-1]
+
+    top_5, top_10 = reinvest_engine._top_share_sums(shares)
+
+    assert top_5 == pytest.approx(expected[:5].sum())
+    assert top_10 == pytest.approx(expected[:10].sum())
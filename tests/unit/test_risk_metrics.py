@@ -0,0 +1,210 @@
+"""
+Unit tests for the risk metrics calculator.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pytest
+
+from src.config.config_loader import SimulationConfig
+from src.engine.simulation_context import SimulationContext
+from src.risk.risk_metrics import RiskMetricsCalculator
+
+
+@pytest.fixture
+def risk_context(sample_config: Dict[str, Any]) -> SimulationContext:
+    """
+    Get a simulation context with a Monte Carlo returns distribution.
+
+    Args:
+        sample_config: Sample configuration dictionary
+
+    Returns:
+        Simulation context
+    """
+    config = SimulationConfig(**sample_config, monte_carlo={"enabled": True})
+    context = SimulationContext(config, run_id="risk-test")
+    context.monte_carlo_results = {
+        "returns_distribution": list(np.random.default_rng(42).normal(0.08, 0.05, 1000)),
+    }
+    return context
+
+
+@pytest.mark.parametrize("size", [1, 20, 1000])
+def test_var_cvar_from_mc(risk_context: SimulationContext, size: int) -> None:
+    """Test Monte Carlo VaR and CVaR against the percentiles of the sorted returns."""
+    returns_distribution = risk_context.monte_carlo_results["returns_distribution"][:size]
+    risk_context.monte_carlo_results["returns_distribution"] = returns_distribution
+    calculator = RiskMetricsCalculator(risk_context)
+
+    calculator._calculate_var_cvar_from_mc()
+
+    sorted_returns = sorted(returns_distribution)
+    for level, share in (("95", 0.05), ("99", 0.01)):
+        index = int(size * share)
+        assert calculator.risk_metrics[f"var_{level}"] == -sorted_returns[index]
+        assert calculator.risk_metrics[f"cvar_{level}"] == pytest.approx(-np.mean(sorted_returns[:index + 1]))
+
+
+def test_hurdle_clear_probability(risk_context: SimulationContext) -> None:
+    """Test the share of Monte Carlo returns that clear the hurdle rate."""
+    risk_context.monte_carlo_results["returns_distribution"] = [0.02, 0.08, 0.1, 0.12]
+    calculator = RiskMetricsCalculator(risk_context)
+
+    assert calculator._calculate_hurdle_clear_probability() == {
+        "value": 0.75,
+        "hurdle_rate": 0.08,
+        "mc_simulations": 4,
+    }
+    assert calculator._get_returns_distribution() is calculator._get_returns_distribution()
+
+
+def test_returns_statistics(risk_context: SimulationContext) -> None:
+    """Test that the returns are extracted and summarized once per calculation."""
+    risk_context.cashflows = {
+        "fund_level_cashflows": [{"cumulative_cashflow": value} for value in [-100, -90, -70, -75, -40, 10]],
+    }
+    calculator = RiskMetricsCalculator(risk_context)
+
+    returns = calculator._extract_returns()
+    mean, std, downside_deviation = calculator._get_returns_statistics()
+
+    assert calculator._extract_returns() is returns
+    assert mean == pytest.approx(np.mean(returns))
+    assert std == pytest.approx(np.std(returns, ddof=1))
+    assert downside_deviation == pytest.approx(calculator._calculate_downside_deviation(returns))
+    assert calculator._calculate_sharpe_ratio() == pytest.approx((mean - calculator.risk_free_rate) / std)
+
+
+def test_extract_existing_price_metrics(risk_context: SimulationContext) -> None:
+    """Test that the price path metrics are averaged across zones."""
+    risk_context.price_paths = {
+        "stats": {
+            "zone_stats": {
+                "green": {"volatility": 0.1, "sharpe_ratio": 1.0, "max_drawdown": 0.2},
+                "orange": {"volatility": 0.2, "sharpe_ratio": 0.5},
+            },
+        },
+    }
+
+    metrics = RiskMetricsCalculator(risk_context).existing_metrics
+
+    assert metrics["price_volatility"] == pytest.approx(0.15)
+    assert metrics["price_sharpe_ratio"] == pytest.approx(0.75)
+    assert metrics["price_max_drawdown"] == pytest.approx(0.1)
+
+
+def test_run_scenario_analysis(risk_context: SimulationContext) -> None:
+    """Test the sensitivity of the metrics to each parameter over its range."""
+    risk_context.config.risk_metrics = {"sensitivity_parameters": ["hurdle_rate", "unknown"]}
+    calculator = RiskMetricsCalculator(risk_context)
+    calculator.risk_metrics = {"irr": 0.1, "equity_multiple": 1.5, "roi": 0.2}
+
+    calculator._run_scenario_analysis()
+
+    results = calculator.scenario_analysis_results
+    assert [result["parameter_value"] for result in results["hurdle_rate"]] == pytest.approx(
+        np.linspace(0.05, 0.15, 10)
+    )
+    for result in results["hurdle_rate"]:
+        irr_impact = (result["parameter_value"] - 0.08) * -2.0
+        assert result["irr"] == pytest.approx(max(0.0, 0.1 * (1 + irr_impact)))
+        assert result["equity_multiple"] == pytest.approx(max(1.0, 1.5 * (1 + irr_impact * 0.5)))
+        assert result["roi"] == pytest.approx(max(0.0, 0.2 * (1 + irr_impact * 0.8)))
+    assert {result["irr"] for result in results["unknown"]} == {0.1}
+
+
+def test_var_cvar_analytic(risk_context: SimulationContext) -> None:
+    """Test the analytic log-normal VaR approximation."""
+    risk_context.cashflows = {
+        "fund_level_cashflows": [{"cumulative_cashflow": value} for value in [-100, -90, -70, -75, -40, 10]],
+    }
+    calculator = RiskMetricsCalculator(risk_context)
+    calculator.risk_metrics = {"volatility": 0.2}
+
+    calculator._calculate_var_cvar_analytic()
+
+    mean_return = np.mean(calculator._extract_returns())
+    assert calculator.risk_metrics["var_95"] == pytest.approx(1.6448536 * 0.2 - mean_return)
+    assert calculator.risk_metrics["var_99"] == pytest.approx(2.3263479 * 0.2 - mean_return)
+
+
+def test_calculate_metrics_batches_progress(
+    risk_context: SimulationContext, recording_websocket_manager: Any
+) -> None:
+    """Test that stage progress updates are sent in one frame when the calculation completes."""
+    calculator = RiskMetricsCalculator(risk_context)
+    calculator.websocket_manager = recording_websocket_manager
+
+    async def calculate() -> None:
+        calculator.calculate_metrics()
+        await asyncio.sleep(0)
+
+    asyncio.run(calculate())
+
+    sent = calculator.websocket_manager.progress
+    assert [message["progress"] for message in sent] == [100.0]
+    assert [stage["progress"] for stage in sent[0]["data"]["stages"]] == [10.0, 50.0, 70.0, 90.0]
+
+
+def test_calculate_credit_metrics(risk_context: SimulationContext, stub_tls_manager: Callable[..., Any]) -> None:
+    """Test LTVs and default probabilities by loan, zone and suburb."""
+    risk_context.tls_manager = stub_tls_manager({
+        "a": {"zone": "red", "default_probability": 0.04},
+        "b": {"zone": "green"},
+    })
+    risk_context.portfolio = [
+        {"loan_id": "l1", "suburb": "a", "loan_amount": 300.0, "property_value": 400.0},
+        {"loan_id": "l2", "suburb": "b", "loan_amount": 100.0, "property_value": 200.0, "default_probability": 0.01},
+        {"loan_id": "l3", "suburb": "a", "loan_amount": 100.0, "property_value": 0.0},
+    ]
+    calculator = RiskMetricsCalculator(risk_context)
+
+    calculator._calculate_credit_metrics()
+
+    credit_metrics = calculator.credit_metrics
+    assert credit_metrics["current_ltv"] == {
+        "portfolio_ltv": pytest.approx(500 / 600),
+        "loan_ltvs": {"l1": 0.75, "l2": 0.5, "l3": 0.0},
+        "zone_ltvs": {"green": 0.5, "orange": 0.0, "red": 1.0},
+        "suburb_ltvs": {"a": 1.0, "b": 0.5},
+    }
+    assert credit_metrics["stress_ltv"]["loan_stress_ltvs"] == pytest.approx({"l1": 0.9375, "l2": 0.625, "l3": 0.0})
+    assert credit_metrics["default_probability"] == {
+        "loan_default_probs": {"l1": 0.04, "l2": 0.01, "l3": 0.04},
+        "zone_default_probs": pytest.approx({"green": 0.01, "orange": 0.0, "red": 0.04}),
+        "suburb_default_probs": pytest.approx({"a": 0.04, "b": 0.01}),
+    }
+    assert credit_metrics["portfolio_default_rate"] == pytest.approx((300 * 0.04 + 100 * 0.01 + 100 * 0.04) / 500)
+    assert risk_context.tls_manager.lookups == ["a", "b"]
+
+
+def test_calculate_concentration_metrics(
+    risk_context: SimulationContext, stub_tls_manager: Callable[..., Any]
+) -> None:
+    """Test exposure by zone, suburb and loan, with ties in portfolio order."""
+    risk_context.tls_manager = stub_tls_manager({"a": {"zone": "red"}, "b": {"zone": "orange"}, "c": {}})
+    risk_context.portfolio = {
+        "loans": [
+            {"loan_id": f"l{i}", "suburb": suburb, "loan_amount": amount}
+            for i, (suburb, amount) in enumerate([("a", 100.0), ("b", 300.0), ("c", 300.0), ("a", 300.0)])
+        ]
+    }
+    calculator = RiskMetricsCalculator(risk_context)
+    calculator.risk_metrics = {}
+
+    calculator._calculate_concentration_metrics()
+
+    concentration_metrics = calculator.concentration_metrics
+    assert concentration_metrics["zone_exposure"] == {"green": 0.3, "orange": 0.3, "red": 0.4}
+    assert concentration_metrics["zone_concentration"]["red"] == 0.4
+    assert concentration_metrics["suburb_exposure"]["top_suburbs"] == [
+        {"suburb": "a", "exposure": 0.4},
+        {"suburb": "b", "exposure": 0.3},
+        {"suburb": "c", "exposure": 0.3},
+    ]
+    single_loan_exposure = concentration_metrics["single_loan_exposure"]
+    assert [loan["loan_id"] for loan in single_loan_exposure["top_loans"]] == ["l1", "l2", "l3", "l0"]
+    assert single_loan_exposure["max_loan_exposure"] == 0.3
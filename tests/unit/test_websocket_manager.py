@@ -0,0 +1,51 @@
+"""
+Unit tests for the WebSocket manager.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.api import websocket_manager
+from src.api.websocket_manager import WebSocketManager, dumps_message
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_message(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Test that orjson and the standard library fallback write the same JSON."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(websocket_manager, "USE_ORJSON", use_orjson)
+    message = {
+        "progress": float("nan"),
+        "values": [1.5, float("inf"), np.float64(2.0)],
+        "array": np.array([1, 2]),
+        "by_year": {1: np.int64(3)},
+        "message": "done",
+        "data": None,
+    }
+
+    assert dumps_message(message) == (
+        '{"progress":null,"values":[1.5,null,2.0],"array":[1,2],"by_year":{"1":3},"message":"done","data":null}'
+    )
+
+
+def test_send_in_background(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that background sends are held until they complete and failures are logged."""
+    manager = WebSocketManager()
+    errors = []
+    monkeypatch.setattr(websocket_manager.logger, "error", lambda event, **kwargs: errors.append(kwargs))
+
+    async def failing_send() -> None:
+        raise RuntimeError("connection lost")
+
+    async def send() -> None:
+        manager.send_in_background(failing_send())
+        assert len(manager.background_sends) == 1
+        await asyncio.gather(*manager.background_sends, return_exceptions=True)
+
+    asyncio.run(send())
+
+    assert manager.background_sends == set()
+    assert errors == [{"error": "connection lost"}]